@@ -0,0 +1,149 @@
+''' DATA ANALYSIS LIBRARIES'''
+import numpy as np
+
+'''
+Converting a telemetry 'Time' column (timedelta64) into float seconds in a single operation
+    time: pandas Series or numpy array of timedeltas
+'''
+def time_to_seconds(time):
+    return np.asarray(time, dtype='timedelta64[ns]').astype(np.int64) / 10**9
+
+'''
+Extracting the distance & time arrays of a lap's telemetry as float64 numpy arrays
+[The distance is shifted to start at 0; the telemetry itself is never modified]
+'''
+def lap_arrays(telemetry):
+    distance = telemetry['Distance'].to_numpy(dtype=np.float64)
+    time = time_to_seconds(telemetry['Time'])
+    return distance - distance[0], time - time[0]
+
+'''
+Calculating the Delta time w.r.t telemetry distance of one or more laps against a reference lap
+    ref_tel: telemetry of the reference lap
+    comp_tels: list of telemetry of the laps compared to the reference
+    step: spacing of the shared distance grid (m)
+Returns:
+    distance: shared distance grid, spanning the reference lap
+    delta: array of shape (len(comp_tels), len(distance)) holding the gap in seconds
+           [negative where the compared lap is behind the reference, as with the original get_delta]
+Each compared lap is scaled onto the reference lap length, so both laps finish on the same distance
+'''
+def get_deltas(ref_tel, comp_tels, step=1.0):
+    ref_distance, ref_time = lap_arrays(ref_tel)
+    return get_deltas_arrays(ref_distance, ref_time, [lap_arrays(comp_tel) for comp_tel in comp_tels], step)
+
+'''
+Delta time of one or more laps given as (distance, time) arrays starting at 0
+[Same result as get_deltas, for callers that already hold the lap arrays]
+'''
+def get_deltas_arrays(ref_distance, ref_time, comp_laps, step=1.0):
+    ref_length = ref_distance[-1]
+
+    distance = np.arange(0, ref_length, step)
+    ref_time = np.interp(distance, ref_distance, ref_time)
+
+    delta = np.empty((len(comp_laps), len(distance)))
+    for i, (comp_distance, comp_time) in enumerate(comp_laps):
+        comp_distance = comp_distance * (ref_length / comp_distance[-1])
+        delta[i] = ref_time - np.interp(distance, comp_distance, comp_time)
+
+    return distance, delta
+
+# Delta time of a single lap against the reference lap
+def get_delta(ref_tel, comp_tel, step=1.0):
+    distance, delta = get_deltas(ref_tel, [comp_tel], step)
+    return delta[0], distance
+
+# Distances (m) at which the equally sized minisectors of the circuit begin & end
+def minisector_edges(circuit_distance, num_minisectors):
+    return np.linspace(0, circuit_distance, num_minisectors + 1)
+
+'''
+Finding the time every lap spends in each minisector of the circuit, for all minisectors at once
+    telemetries: list of lap telemetry [the Distance column may already be aligned for lap 1]
+    circuit_distance: length of the circuit (m)
+    num_minisectors: number of equally sized minisectors
+Returns an array of shape (len(telemetries), num_minisectors) in seconds
+[NaN where a lap does not cover the whole minisector, e.g. the grid start of lap 1]
+The lap time at every minisector boundary is interpolated, so even minisectors shorter than
+the telemetry sample spacing get an exact time
+'''
+def minisector_times(telemetries, circuit_distance, num_minisectors=18):
+    times = np.full((len(telemetries), num_minisectors), np.nan)
+
+    for i, telemetry in enumerate(telemetries):
+        distance = telemetry['Distance'].to_numpy(dtype=np.float64)
+        times[i] = lap_minisector_times(distance, time_to_seconds(telemetry['Time']), circuit_distance, num_minisectors)
+
+    return times
+
+# Minisector times of a single lap given as distance (m) & time (s) arrays
+def lap_minisector_times(distance, time, circuit_distance, num_minisectors=18):
+    edges = minisector_edges(circuit_distance, num_minisectors)
+    distance = scale_distance(distance, circuit_distance)
+
+    edge_times = np.interp(edges, distance, time, left=np.nan, right=np.nan)
+    return np.diff(edge_times)
+
+# Index of the fastest lap in every minisector [-1 where no lap covers the minisector]
+def fastest_minisectors(times):
+    covered = ~np.isnan(times).all(axis=0)
+    fastest = np.argmin(np.where(np.isnan(times), np.inf, times), axis=0)
+    return np.where(covered, fastest, -1)
+
+# Minisector each telemetry sample was recorded in
+def minisector_of(distance, circuit_distance, num_minisectors):
+    edges = minisector_edges(circuit_distance, num_minisectors)
+    return np.digitize(np.asarray(distance, dtype=np.float64), edges[1:-1])
+
+# Scaling a lap's distance so that it finishes exactly on the circuit length [returns a new array]
+def scale_distance(distance, circuit_distance):
+    distance = np.asarray(distance, dtype=np.float64)
+    distance = distance * (circuit_distance / distance[-1])
+    distance[-1] = circuit_distance
+    return distance
+
+'''
+Fixed distance grid of a circuit, shared by every lap resampled onto it
+    circuit_distance: length of the circuit (m)
+    step: spacing of the grid (m) [the last point always lies on the circuit length]
+'''
+def distance_grid(circuit_distance, step=1.0):
+    return np.linspace(0, circuit_distance, int(round(circuit_distance / step)) + 1)
+
+'''
+Projecting irregularly sampled lap values onto a distance grid
+    distance: distance of every sample, scaled onto the circuit length (increasing)
+    values: value of every sample
+    grid: distance grid of the circuit
+    stepwise: holding the previous sample instead of interpolating [for gears, DRS & brake]
+Returns a float64 array, NaN on the grid points the lap does not cover [e.g. the grid start of lap 1]
+'''
+def resample(distance, values, grid, stepwise=False):
+    values = np.asarray(values, dtype=np.float64)
+    if stepwise:
+        index = np.clip(np.searchsorted(distance, grid, side='right') - 1, 0, len(values) - 1)
+        result = values[index]
+    else:
+        result = np.interp(grid, distance, values)
+
+    result[(grid < distance[0]) | (grid > distance[-1])] = np.nan
+    return result
+
+'''
+Values of every resampled lap at arbitrary distances, interpolated between the grid points
+    grid: distance grid the rows were resampled onto
+    rows: array of shape (laps, len(grid))
+    points: distances to interpolate at
+Returns an array of shape (laps, len(points)) [the interpolation weights are shared by every lap]
+'''
+def grid_interp(grid, rows, points):
+    upper = np.clip(np.searchsorted(grid, points), 1, len(grid) - 1)
+    lower = upper - 1
+    weight = (points - grid[lower]) / (grid[upper] - grid[lower])
+    return rows[:, lower] * (1 - weight) + rows[:, upper] * weight
+
+# Minisector times of every resampled lap at once, from rows of lap time on the grid
+def grid_minisector_times(grid, time_rows, circuit_distance, num_minisectors=18):
+    edges = minisector_edges(circuit_distance, num_minisectors)
+    return np.diff(grid_interp(grid, np.asarray(time_rows, dtype=np.float64), edges), axis=1)
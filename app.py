@@ -1,59 +1,66 @@
 ''' ALL APP LIBRARY IMPORTS AND MODIFICATIONS'''
+# Startup Profiling [--profile-startup prints the import & init time breakdown]
+import sys
+from startup_profile import StartupProfiler
+profiler = StartupProfiler('--profile-startup' in sys.argv)
+
 # PyQt5
-from PyQt5.QtWidgets import QMainWindow, QApplication, QWidget, QButtonGroup, QShortcut, QStyledItemDelegate
-from PyQt5 import QtWidgets as qtw
-import PyQt5.QtGui as QtGui
-from PyQt5.QtGui import *
-from PyQt5.QtCore import * 
-from PyQt5.QtCore import QPoint, QRect, QSize, Qt
-from PyQt5.QtGui import QIcon, QIconEngine, QImage, QPainter, QPixmap
-from PyQt5.uic import loadUi 
-from PyQt5.QtCore import Qt as QtCore
+with profiler.stage('Imports', 'PyQt5'):
+    from PyQt5.QtWidgets import QMainWindow, QApplication, QWidget, QButtonGroup, QShortcut, QStyledItemDelegate
+    from PyQt5 import QtWidgets as qtw
+    import PyQt5.QtGui as QtGui
+    from PyQt5.QtGui import *
+    from PyQt5.QtCore import * 
+    from PyQt5.QtCore import QPoint, QRect, QSize, Qt
+    from PyQt5.QtGui import QIcon, QIconEngine, QImage, QPainter, QPixmap
+    from PyQt5.uic import loadUi 
+    from PyQt5.QtCore import Qt as QtCore
 
 # Miscellanous Functionality
-import sys
-import os
-from datetime import timezone, timedelta
 import datetime
+import os
 import socket
 import threading
 
 # FastF1 API
-import fastf1 as ff1
-from fastf1 import plotting
+# [fastf1.plotting & matplotlib are only imported on the first driver color lookup, see plot_style.py]
+with profiler.stage('Imports', 'FastF1'):
+    import fastf1 as ff1
 
 # Plotting Libraries
-import pyqtgraph as pg
-from matplotlib import font_manager
-import matplotlib.pyplot as plt
+with profiler.stage('Imports', 'pyqtgraph'):
+    import pyqtgraph as pg
 
 pg.setConfigOption('background', '#1e1e1f')
 
-# FastF1 Plotting Global Modifications
-ff1.plotting.DRIVER_COLORS['max verstappen'] = '#734fff'
-ff1.plotting.DRIVER_COLORS['lewis hamilton'] = '#eef12e'
-ff1.plotting.DRIVER_COLORS['sergio perez'] = '#1017df'
-ff1.plotting.TEAM_COLORS['red bull'] = '#734fff'
-ff1.plotting.DRIVER_COLORS['alexander albon'] = '#49BBFF'
-ff1.plotting.DRIVER_COLORS['logan sargeant'] = '#008BFE'
-ff1.plotting.TEAM_COLORS['williams'] = '#49BBFF'
-
-ff1.plotting.setup_mpl(mpl_timedelta_support=True, color_scheme='fastf1', misc_mpl_mods=True)
-font_dirs = ['/Users/niratpai/Library/Fonts']
-font_files = font_manager.findSystemFonts(fontpaths=font_dirs)
-for font_file in font_files:
-    font_manager.fontManager.addfont(font_file)
-plt.rcParams['font.family'] = 'Formula1'
-
-# Data Analysis Libraries
-import pandas as pd
-
 # Setting Cache Directory
-ff1.Cache.enable_cache('cache')
+with profiler.stage('Init', 'FastF1 cache'):
+    ff1.Cache.enable_cache('cache')
+
+# Local Data Server [--data-server=URL sends every backend request to a replay server, see mock_server.py]
+data_server = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--data-server=')), None)
+if data_server is not None:
+    import mock_server
+    mock_server.install(data_server)
 
 # UI pages
-from driver_comparison import UI_driver
-from settings import UI_settings
+with profiler.stage('Imports', 'UI pages'):
+    from driver_comparison import UI_driver
+    from race_pace import UI_pace
+    from standings import UI_standings
+    from settings import UI_settings
+
+# Background Session Loading, Event Schedules & Export
+with profiler.stage('Imports', 'Loaders'):
+    from session_loader import SessionLoader
+    from schedule_cache import ScheduleCache
+    from exporter import SessionExporter
+    from prefetch import SessionPrefetcher, likely_sessions
+
+# Stage Timings & Memory Accounting [--perf-trace records from the start & writes perf_trace.json on exit]
+from perf_trace import recorder, timed, process_memory
+from session_cache import session_footprint
+recorder.enable('--perf-trace' in sys.argv)
 
 # Rewriting the Icon Map Engine for higher resolution Images & Icons [affects the sidebar]
 class PixmapIconEngine(QIconEngine):
@@ -82,10 +89,12 @@ class ui(QMainWindow):
         self.session_select.setItemDelegate(QStyledItemDelegate(self.session_select))
 
         self.stackedWidget.addWidget(QWidget())
-        self.stackedWidget.addWidget(QWidget())
+        self.standings_page = UI_standings()
+        self.stackedWidget.addWidget(self.standings_page)
         self.driver_comparison = UI_driver()
         self.stackedWidget.addWidget(self.driver_comparison)
-        self.stackedWidget.addWidget(QWidget())
+        self.race_pace = UI_pace()
+        self.stackedWidget.addWidget(self.race_pace)
         self.settings_page = UI_settings()
         self.stackedWidget.addWidget(self.settings_page)
 
@@ -136,18 +145,50 @@ class ui(QMainWindow):
         for box in comboboxes:
             box.wheelEvent = lambda *event: None
         
+        # Loading sessions in the background while streaming the progress into the title bar
+        self.session_loader = SessionLoader(parent=self)
+        self.session_loader.progress.connect(self.load_progress_update)
+        self.session_loader.loaded.connect(self.session_loaded)
+        self.session_loader.telemetry_loaded.connect(self.session_telemetry_loaded)
+        self.session_loader.failed.connect(self.session_load_failed)
+        self.current_session = None
+        self.loaded_key = None
+
+        # Event schedules of every season, kept in memory & prefetched in the background
+        self.schedule_cache = ScheduleCache(parent=self)
+        self.schedule_cache.schedule_ready.connect(self.schedule_ready)
+        self.schedule_cache.schedule_failed.connect(self.schedule_failed)
+        QApplication.instance().aboutToQuit.connect(self.schedule_cache.shutdown)
+
+        # Fetching the sessions likely to be opened next into the FastF1 cache, stopped by any interactive load
+        self.prefetcher = SessionPrefetcher(parent=self)
+        self.update_prefetch_budget()
+        self.settings_page.prefetch_sessions.valueChanged.connect(self.update_prefetch_budget)
+        self.settings_page.prefetch_pause.valueChanged.connect(self.update_prefetch_budget)
+
         # Populating Current Grand-Prix Selection ComboBox
         self.weekend_enable()
+        self.schedule_cache.prefetch()
 
         # Year Selection
         self.year_select.valueChanged.connect(self.weekend_enable)
         # Race Selection
         self.grandprix_select.currentIndexChanged.connect(self.session_enable)
         # Session Selection
-        self.session_select.currentIndexChanged.connect(self.load)
+        self.session_select.currentIndexChanged.connect(lambda: self.load())
 
         # Exporting Data
-        self.export_data.clicked.connect(self.export)
+        self.exporter = SessionExporter(parent=self)
+        self.exporter.progress.connect(self.export_progress)
+        self.exporter.finished.connect(self.export_finished)
+        self.exporter.failed.connect(self.export_failed)
+        self.export_data.clicked.connect(lambda: self.export())
+
+        # Track Domination resolution
+        self.settings_page.minisector_count.valueChanged.connect(self.driver_comparison.set_minisectors)
+
+        # Memory shown on the performance panel
+        self.settings_page.set_memory_source(self.memory_accounting)
 
     def switch_tabs(self):
         id = self.tabs.checkedId()
@@ -159,23 +200,26 @@ class ui(QMainWindow):
         self.grandprix_select.clear()
         self.session_select.clear()
 
-        # Getting the schedule for the given year
+        # Getting the schedule for the given year from memory
+        # [seasons not cached yet are fetched in the background & filled in by schedule_ready]
         self.year = self.year_select.value()
-        schedule = ff1.get_event_schedule(self.year, include_testing=False)
-        rounds = len(schedule) + 1
+        if self.schedule_cache.request(self.year):
+            self.grandprix_select.addItems(self.schedule_cache.events(self.year))
 
-        for round in range(1, rounds):            
-            event = schedule.get_event_by_round(round)
+        # Showing the stored standings of the season right away, fetching any rounds missing from the store
+        self.standings_page.show_season(self.year, self.schedule_cache.schedule(self.year))
+        self.prefetch()
 
-            # Checking the current time of running [the time the app was opened]
-            self.current_time = datetime.datetime.now(timezone.utc)
-            self.current_utc_time = self.current_time.replace(tzinfo=timezone.utc)
-            grandprix_time = event.get_session_date('Practice 1',utc= True)
-            grandprix_time = grandprix_time.replace(tzinfo=timezone.utc)
+    # Filling the Grand-Prix combo box & the standings once the schedule of the selected Season has been fetched
+    def schedule_ready(self, year):
+        if year == self.year and self.grandprix_select.count() == 0:
+            self.grandprix_select.addItems(self.schedule_cache.events(year))
+        if year == self.year:
+            self.standings_page.show_season(year, self.schedule_cache.schedule(year))
+        self.prefetch()
 
-            # Checking if the weekend has started yet
-            if (grandprix_time + timedelta(hours= 5)) < self.current_utc_time:
-                self.grandprix_select.addItem(event['EventName'])
+    def schedule_failed(self, year, message):
+        print('Failed to load the ' + str(year) + ' schedule: ' + message)
 
     # Filling the combo box with the list of Sessions for the selected Grand-Prix weekend
     def session_enable(self):
@@ -187,84 +231,145 @@ class ui(QMainWindow):
 
         self.grand_prix = self.grandprix_select.currentText()
 
-        event = ff1.get_event(self.year, self.grand_prix)
-        self.session_select.addItem(event['Session1'])
-
-        # Checking if the session has occured yet, & adding to the combo box as required
-        if (event.get_session_date(event['Session2'],utc= True).replace(tzinfo=timezone.utc) + timedelta(hours= 5)) < self.current_utc_time:
-            self.session_select.addItem(event['Session2'])
-        if (event.get_session_date(event['Session3'],utc= True).replace(tzinfo=timezone.utc) + timedelta(hours= 5)) < self.current_utc_time:
-            self.session_select.addItem(event['Session3'])
-        if (event.get_session_date(event['Session4'],utc= True).replace(tzinfo=timezone.utc) + timedelta(hours= 5)) < self.current_utc_time:
-            self.session_select.addItem(event['Session4'])
-        if (event.get_session_date(event['Session5'],utc= True).replace(tzinfo=timezone.utc) + timedelta(hours= 5)) < self.current_utc_time:
-            self.session_select.addItem(event['Session5'])
+        # Adding the sessions that have occured yet to the combo box
+        self.session_select.addItems(self.schedule_cache.sessions(self.year, self.grand_prix))
 
+    '''
+    Requesting the selected session from the background loader
+    [A newer selection supersedes any load still in progress]
+    '''
+    @timed('app.load', 'load')
     def load(self):
+        # Interactive loads take over the FastF1 cache & the network from the prefetch
+        self.prefetcher.cancel()
+
+        # Keeping the selections made on the session being left, to restore them when switching back
+        if self.loaded_key is not None:
+            self.session_loader.session_cache.set_selection(self.loaded_key, self.driver_comparison.selection())
+            self.loaded_key = None
+
         if self.session_select.currentIndex() == -1:
+            self.session_loader.cancel()
+            self.load_progress.setValue(0)
             self.driver_comparison.disable_drivers(True)
+            self.race_pace.clear()
             return
         
-        self.export_data.setEnabled(True)
+        self.export_data.setEnabled(False)
         self.session_name = self.session_select.currentText()
-        self.current_session = ff1.get_session(self.year, self.grand_prix, self.session_name)
-        self.current_session.load()
-        self.circuit_info = self.current_session.get_circuit_info()
-
-        t1 = threading.Thread(target=self.driver_comparison.receive_parameters, args=(self.current_session, self.circuit_info, False,))
-        t1.start()
-        t1.join()
+        self.driver_comparison.disable_drivers(True)
+        self.race_pace.clear()
+        self.load_progress.setValue(0)
+        self.session_loader.load(self.year, self.grand_prix, self.session_name)
+
+    # Displaying the progress of the background session load
+    def load_progress_update(self, percent, message):
+        self.load_progress.setValue(percent)
+        self.load_progress.setToolTip(message)
+
+    # Handing the session loaded with its laps over to the driver comparison & race pace pages
+    @timed('app.session_loaded', 'load')
+    def session_loaded(self, current_session, session_index):
+        self.current_session = current_session
+        self.session_index = session_index
+        self.driver_comparison.receive_parameters(self.current_session, self.session_index, False)
+        self.loaded_key = self.session_loader.requested
+        selection = self.session_loader.session_cache.selection(self.loaded_key)
+        if selection is not None:
+            self.driver_comparison.restore_selection(selection)
+        self.race_pace.receive_session(self.current_session)
+
+    # Plotting the selected laps once the telemetry of the session has loaded
+    @timed('app.session_telemetry_loaded', 'load')
+    def session_telemetry_loaded(self, current_session, circuit_info):
+        self.circuit_info = circuit_info
+        self.export_data.setEnabled(True)
+        self.driver_comparison.receive_telemetry(self.circuit_info)
+        self.prefetch()
+
+    def session_load_failed(self, message):
+        self.load_progress.setValue(0)
+        self.load_progress.setToolTip('Failed to load session: ' + message)
+        print('Failed to load session: ' + message)
+        self.prefetch()
+
+    def update_prefetch_budget(self):
+        self.prefetcher.set_budget(self.settings_page.prefetch_sessions.value(), self.settings_page.prefetch_pause.value())
+
+    '''
+    Prefetching the Qualifying & Race of the selected event & of the latest weekend
+    [Waits while an interactive load runs; resumed once it has finished]
+    '''
+    def prefetch(self):
+        if self.session_loader.is_loading():
+            return
 
-    # Exporting Data
+        current_year = datetime.datetime.now().year
+        grand_prix = self.grandprix_select.currentText() or None
+        loaded = set()
+        if self.current_session is not None:
+            loaded.add((self.current_session.date.year, self.current_session.event['EventName'], self.current_session.name))
+        self.prefetcher.request(likely_sessions(self.schedule_cache, self.year, grand_prix, current_year), loaded)
+
+    '''
+    Exporting Data
+    [files are produced & written concurrently by the background exporter]
+    '''
+    @timed('app.export', 'export')
     def export(self):
         directory = 'exports/' + str(self.year) + '_' + self.grand_prix + '_' + self.session_name
-        os.makedirs(directory, exist_ok=True)
 
-        if self.settings_page.session_results_exp.isChecked():
-            self.current_session.results.to_csv(directory + '/session_results.csv')
-
-        if self.settings_page.circuit_info_exp.isChecked():
-            self.circuit_info.corners.to_csv(directory + '/circuit_corners.csv')
-            self.circuit_info.marshal_lights.to_csv(directory + '/circuit_marshal_lights.csv')
-            self.circuit_info.marshal_sectors.to_csv(directory + '/circuit_marshal_sectors.csv')
-
-            # Converting Track Rotation into a single element dataframe
-            rotation = pd.DataFrame(columns= ['TrackRotation'])
-            rotation.loc[0] = self.driver_comparison.circuit_info.rotation
-            rotation.to_csv(directory + '/circuit_rotation.csv')
-
-        # Checking if a driver telemetry data has been loaded
+        # Collecting the laps currently selected on the driver comparison page
+        selected_laps = []
         is_enabled1 = self.driver_comparison.lap_sel1.isEnabled()
         is_enabled2 = self.driver_comparison.lap_sel2.isEnabled()
         is_enabled3 = self.driver_comparison.lap_sel3.isEnabled()
-        is_enabled = (is_enabled1 or is_enabled2 or is_enabled3)
-
-        if is_enabled:
-            lap_directory = directory + '/driver_laps'
-            os.makedirs(lap_directory, exist_ok=True)
+        if is_enabled1 or is_enabled2 or is_enabled3:
             for i in range(len(self.driver_comparison.drivers)):
-                if self.driver_comparison.laps[i] == '':
-                    continue
-                lap_data = self.driver_comparison.driver_laps[i]
-                driver_name = lap_data['Driver']
-                lap_number = int(lap_data['LapNumber'])
-                temp_lap = self.driver_comparison.current_session.laps.pick_driver(self.driver_comparison.drivers[i]).pick_wo_box().pick_fastest()
-                weather = lap_data.get_weather_data()
-                telemetry = lap_data.get_telemetry()
-
-                if temp_lap['LapNumber'] == lap_number:
-                    lap = str(lap_number) + '_personalBest'              
-                else:
-                    lap = str(lap_number)
-                
-                if self.settings_page.lap_data_exp.isChecked():
-                    lap_data.to_csv(lap_directory + '/'+ driver_name + '_'+ lap + '.csv')
-                
-                if self.settings_page.weather_exp.isChecked():
-                    weather.to_csv(lap_directory + '/'+ driver_name + '_'+ lap + '_weatherData.csv')
-                
-                if self.settings_page.telemetry_data_exp.isChecked():
-                    telemetry.to_csv(lap_directory + '/'+ driver_name + '_'+ lap + '_telemetry.csv')
+                if not self.driver_comparison.laps[i] == '':
+                    selected_laps.append(self.driver_comparison.driver_laps[i])
+
+        self.export_data.setEnabled(False)
+        self.load_progress.setValue(0)
+        self.exporter.export(directory, self.current_session, self.circuit_info, selected_laps,
+                             self.settings_page.export_options(), self.driver_comparison.telemetry_cache,
+                             self.driver_comparison.session_index)
+
+    # Displaying the export progress in the title bar
+    def export_progress(self, done, total, path):
+        self.load_progress.setValue(int(done / total * 100))
+        self.load_progress.setToolTip('Exported ' + str(done) + '/' + str(total) + ': ' + path)
+
+    # Reporting the files written & any files that failed in the title bar
+    def export_finished(self, directory, count, errors):
+        self.export_data.setEnabled(True)
+        self.load_progress.setValue(100)
+        message = 'Exported ' + str(count) + ' files to ' + directory
+        if errors:
+            message = message + '; ' + str(len(errors)) + ' file(s) failed, first error: ' + errors[0]
+            print('Export incomplete: ' + str(len(errors)) + ' file(s) failed, first error: ' + errors[0])
+        self.load_progress.setToolTip(message)
+
+    def export_failed(self, message):
+        self.export_data.setEnabled(True)
+        self.load_progress.setToolTip('Export failed: ' + message)
+        print('Export failed: ' + message)
+
+    '''
+    Memory held by the app, as (label, bytes) pairs
+    [Frame sizes are approximate, see session_cache.session_footprint; the loaded session is also part of the session cache]
+    '''
+    def memory_accounting(self):
+        session_cache = self.session_loader.session_cache
+        telemetry_cache = self.driver_comparison.telemetry_cache
+        comparison = self.driver_comparison.comparison
+        memory = [('Process', process_memory())]
+        if self.current_session is not None:
+            memory.append(('Loaded session', session_footprint(self.current_session)))
+        memory.append(('Session cache [' + str(len(session_cache)) + ' sessions]', session_cache.total_bytes))
+        memory.append(('Telemetry cache [' + str(len(telemetry_cache)) + ' laps]', telemetry_cache.total_bytes))
+        memory.append(('Compared laps [' + str(len(comparison)) + ' laps]', comparison.nbytes()))
+        return memory
 
 # Checking for Internet connection for enablement of offline cache
 def check_internet_connection():
@@ -280,22 +385,9 @@ def check_internet_connection():
     finally:
         sock.close()
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-
-    # Setting UI quality factors
-    QtGui.QFontDatabase.addApplicationFont("/Users/niratpai/Library/Fonts/Formula1.ttf")
-    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "5"
-    os.environ["QT_SCALE_FACTOR"] = '1.25'
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps)
-
-    # Loading App CSS & style
-    qss="app_style.qss"
-    with open(qss,"r") as fh:
-        app.setStyleSheet(fh.read())
-    app.setStyle('fusion')
-
-    # Enabling offline cache while disconnected from the internet
+# Enabling offline cache while disconnected from the internet
+# [run on a background thread, so the window never waits for the connection probe]
+def apply_connection_status():
     if check_internet_connection():
         print("Connection Status: ONLINE")
     else:
@@ -303,6 +395,36 @@ if __name__ == "__main__":
         print("Enabling offline cache.....")
         ff1.Cache.offline_mode(True)
 
-    window = ui()
-    window.show()
-    app.exec_()
\ No newline at end of file
+if __name__ == "__main__":
+    with profiler.stage('Init', 'QApplication'):
+        app = QApplication(sys.argv)
+
+    # Setting UI quality factors
+    with profiler.stage('Init', 'Fonts & scaling'):
+        QtGui.QFontDatabase.addApplicationFont("/Users/niratpai/Library/Fonts/Formula1.ttf")
+        os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "5"
+        os.environ["QT_SCALE_FACTOR"] = '1.25'
+        app.setAttribute(Qt.AA_UseHighDpiPixmaps)
+
+    # Loading App CSS & style
+    with profiler.stage('Init', 'Stylesheet'):
+        qss="app_style.qss"
+        with open(qss,"r") as fh:
+            app.setStyleSheet(fh.read())
+        app.setStyle('fusion')
+
+    # The replay server stands in for the backends, so the connection status does not apply
+    if data_server is None:
+        threading.Thread(target=apply_connection_status, daemon=True).start()
+
+    with profiler.stage('Init', 'Main window'):
+        window = ui()
+    with profiler.stage('Init', 'Show window'):
+        window.show()
+
+    # Reporting once the event loop is running, i.e. when the window becomes responsive
+    QTimer.singleShot(0, profiler.report)
+    app.exec_()
+
+    if '--perf-trace' in sys.argv:
+        print('Wrote ' + str(recorder.write_chrome_trace('perf_trace.json')) + ' trace events to perf_trace.json')
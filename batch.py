@@ -0,0 +1,199 @@
+''' BATCH ANALYSIS LIBRARIES'''
+# Miscellanous Functionality
+from collections import namedtuple
+import datetime
+import os
+import re
+
+# FastF1 API
+import fastf1 as ff1
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Session Loading & Session Helpers
+import session_data
+from session_data import SESSION_DELAY, seconds
+
+# Compared Laps, Circuit Geometry & Shared Lap Telemetry Store
+from comparison import LapComparison, aligned_distance
+from circuit_index import CircuitIndex
+from telemetry_cache import TelemetryCache
+
+# Planning & Writing the Export Files
+from export_files import plan_export, write_files, write_frame
+
+'''
+A single batch job: the fastest laps of the given drivers compared in one session
+    year, event, session: session identifiers as passed to ff1.get_session
+    drivers: driver abbreviations or numbers [every driver of the session if empty]
+'''
+BatchJob = namedtuple('BatchJob', ['year', 'event', 'session', 'drivers'])
+
+'''
+Outcome of a batch job, as handed back from the worker process
+    name: report name of the job
+    directory: report directory
+    laps: number of compared laps
+    fastest: abbreviation of the driver with the fastest compared lap
+    files: number of files written
+    errors: messages of the files or drivers that failed
+'''
+BatchResult = namedtuple('BatchResult', ['name', 'directory', 'laps', 'fastest', 'files', 'errors'])
+
+# Export preferences of a batch job [same keys as the settings page's export_options]
+EXPORT_OPTIONS = ['session_results', 'circuit_info', 'lap_data', 'telemetry', 'weather', 'whole_session']
+
+
+# Circuit geometry, built once per worker process
+circuit_index = CircuitIndex()
+
+# Building a job from a JSON job spec {"year": ..., "event": ..., "session": ..., "drivers": [...]}
+def job_from_spec(spec):
+    return BatchJob(int(spec['year']), str(spec['event']), str(spec['session']), [str(driver) for driver in spec.get('drivers', [])])
+
+# Directory name of a job's reports, e.g. 2024_Monaco_Grand_Prix_Qualifying
+def report_name(job):
+    return re.sub(r'[^0-9A-Za-z]+', '_', str(job.year) + ' ' + str(job.event) + ' ' + job.session).strip('_')
+
+'''
+Jobs for the given session of every event of a season that has taken place, in calendar order
+    drivers: drivers compared in every job [every driver if empty]
+'''
+def season_jobs(year, session_name, drivers):
+    schedule = ff1.get_event_schedule(year, include_testing=False)
+    cutoff = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - SESSION_DELAY
+
+    jobs = []
+    for _, event in schedule.sort_values('RoundNumber').iterrows():
+        for i in range(1, 6):
+            date = event['Session' + str(i) + 'DateUtc']
+            if event['Session' + str(i)] == session_name and pd.notna(date) and date < cutoff:
+                jobs.append(BatchJob(year, event['EventName'], session_name, list(drivers)))
+    return jobs
+
+'''
+Export preferences from the names given on the command line
+    names: list of EXPORT_OPTIONS to enable
+'''
+def export_options(names, file_format='CSV'):
+    options = {option: option in names for option in EXPORT_OPTIONS}
+    options['file_format'] = file_format
+    return options
+
+'''
+Length of the session's circuit (m) from the circuit geometry
+[falling back to the fastest lap's distance for circuits missing from f1_circuits, as on the driver comparison page]
+'''
+def circuit_length(session, session_index):
+    location = session.event['Location']
+    if location in circuit_index:
+        return circuit_index.length(location)
+    return session_index.reference_lap_length
+
+'''
+Driver numbers of the job's drivers
+Returns the driver numbers & the drivers that are not part of the session
+'''
+def driver_numbers(session, drivers):
+    if len(drivers) == 0:
+        return list(session.drivers), []
+
+    numbers, missing = [], []
+    for driver in drivers:
+        matches = session.results[(session.results['Abbreviation'] == driver.upper()) | (session.results['DriverNumber'] == driver)]
+        if matches.empty:
+            missing.append(driver)
+        else:
+            numbers.append(str(matches['DriverNumber'].iloc[0]))
+    return numbers, missing
+
+'''
+Summary of the compared laps, fastest first
+    laps: compared laps in order
+    won: number of minisectors each lap is fastest in
+'''
+def lap_summary(laps, won, num_minisectors):
+    lap_times = np.array([seconds(lap['LapTime']) for lap in laps])
+    return pd.DataFrame({
+        'Driver': [lap['Driver'] for lap in laps],
+        'DriverNumber': [lap['DriverNumber'] for lap in laps],
+        'Team': [lap['Team'] for lap in laps],
+        'LapNumber': [int(lap['LapNumber']) for lap in laps],
+        'LapTime': lap_times,
+        'Sector1Time': [seconds(lap['Sector1Time']) for lap in laps],
+        'Sector2Time': [seconds(lap['Sector2Time']) for lap in laps],
+        'Sector3Time': [seconds(lap['Sector3Time']) for lap in laps],
+        'Compound': [lap['Compound'] for lap in laps],
+        'Gap': lap_times - lap_times[0],
+        'MinisectorsWon': won,
+        'MinisectorShare': won / num_minisectors,
+    }, index=pd.RangeIndex(1, len(laps) + 1, name='Position'))
+
+'''
+Running a batch job: comparing the fastest lap of every driver & writing the reports
+[Runs in a worker process without a GUI; every report of the job is written to out_dir/<report name>]
+    job: BatchJob
+    out_dir: directory of the reports of every job
+    num_minisectors: track domination resolution
+    options: export preferences [see export_options; None skips the export]
+    max_workers: number of export files produced & written at once
+Writes:
+    summary: lap & sector times, compound, gap & minisectors won of every compared lap
+    deltas: delta time of every lap to the fastest lap over the distance grid
+    minisectors: time of every lap in every minisector, with the fastest driver of each minisector
+Returns a BatchResult
+'''
+def run_job(job, out_dir, num_minisectors=25, options=None, max_workers=4):
+    directory = os.path.join(out_dir, report_name(job))
+    file_format = options['file_format'] if options else 'CSV'
+
+    loaded = session_data.load_session(job.year, job.event, job.session)
+    session, session_index = loaded.session, loaded.session_index
+    hot_laps = session_data.is_qualifying(session)
+    numbers, missing = driver_numbers(session, job.drivers)
+    errors = ['driver ' + driver + ' is not part of the session' for driver in missing]
+
+    # Fastest lap of every driver, with the fastest lap first as the delta reference
+    laps = []
+    for driver in numbers:
+        lap_number = session_index.fastest_lap(driver, hot_laps)
+        if lap_number is not None:
+            laps.append(session.laps.iloc[session_index.lap_row(driver, lap_number)])
+    laps.sort(key=lambda lap: seconds(lap['LapTime']) if pd.notna(lap['LapTime']) else np.inf)
+    if len(laps) == 0:
+        return BatchResult(report_name(job), directory, 0, None, 0, errors + ['no timed laps'])
+
+    telemetry_cache = TelemetryCache()
+    comparison = LapComparison(circuit_length(session, session_index))
+    for order, lap in enumerate(laps):
+        telemetry = telemetry_cache.get_telemetry(session, lap)
+        comparison.add(lap['DriverNumber'], lap, telemetry, aligned_distance(lap, telemetry, session_index, hot_laps),
+                       lap['Driver'], None, order)
+
+    domination = comparison.track_domination(num_minisectors)
+    won = np.bincount(domination.fastest[domination.fastest >= 0], minlength=len(laps))
+    names = [lap['Driver'] for lap in laps]
+
+    reports = [('summary', lap_summary(laps, won, num_minisectors))]
+    deltas = comparison.deltas()
+    if deltas is not None:
+        _, compared, delta_time = deltas
+        reports.append(('deltas', pd.DataFrame(delta_time.T, index=pd.Index(comparison.grid, name='Distance'),
+                                               columns=[entry.name for entry in compared])))
+    minisectors = pd.DataFrame(domination.times.T, index=pd.RangeIndex(1, num_minisectors + 1, name='Minisector'), columns=names)
+    minisectors['Fastest'] = [names[i] if i >= 0 else None for i in domination.fastest]
+    reports.append(('minisectors', minisectors))
+
+    for name, frame in reports:
+        write_frame(frame, os.path.join(directory, name), file_format)
+    written = len(reports)
+
+    if options and any(options[option] for option in EXPORT_OPTIONS):
+        jobs = plan_export(session, loaded.circuit_info, laps, options, telemetry_cache, session_index)
+        exported, export_errors = write_files(os.path.join(directory, 'export'), jobs, file_format, max_workers)
+        written = written + exported
+        errors.extend(export_errors)
+
+    return BatchResult(report_name(job), directory, len(laps), names[0], written, errors)
@@ -0,0 +1,76 @@
+'''
+Micro-benchmark of the delta time engine against the original per-sample implementation
+Run from the repository root:
+    python benchmarks/bench_delta.py [number of compared laps]
+'''
+# Miscellanous Functionality
+import os
+import sys
+import timeit
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+from scipy import interpolate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analysis
+
+# Generating a FastF1-shaped lap telemetry frame (~4 Hz merged samples over a 5.8 km lap)
+def synthetic_lap(lap_time=80.0, length=5793.0, samples=750, seed=0):
+    rng = np.random.default_rng(seed)
+    time = np.sort(rng.uniform(0, lap_time, samples))
+    time[0] = 0
+    speed = 200 + 100 * np.sin(np.linspace(0, 12 * np.pi, samples))
+    distance = np.cumsum(speed * np.gradient(time))
+    distance = (distance - distance[0]) * (length / (distance[-1] - distance[0]))
+    return pd.DataFrame({'Time': pd.to_timedelta(time, unit='s'), 'Distance': distance, 'Speed': speed})
+
+# The original UI_driver.get_delta, kept as the baseline to measure against
+def legacy_get_delta(ref_lap, comp_lap):
+    distance_ref = ref_lap['Distance'].copy()
+    distance_comp = comp_lap['Distance'].copy()
+    time_ref = [0] * len(ref_lap['Time'])
+    time_comp = [0] * len(comp_lap['Time'])
+
+    for i in range(len(ref_lap['Time'])):
+        time_ref[i] = ref_lap['Time'].iloc[i].seconds * (10 ** 6) + ref_lap['Time'].iloc[i].microseconds
+
+    for i in range(len(comp_lap['Time'])):
+        time_comp[i] = comp_lap['Time'].iloc[i].seconds * (10 ** 6) + comp_lap['Time'].iloc[i].microseconds
+
+    max1 = distance_comp.max()
+    max2 = distance_ref.max()
+    if distance_comp.max() < distance_ref.max():
+        distance_comp.replace(to_replace= max1, value=max2, inplace=True)
+    elif distance_comp.max() > distance_ref.max():
+        distance_ref.replace(to_replace=max2, value=max1, inplace=True)
+
+    distance_comp.replace(distance_comp.min(), 0, inplace=True)
+    distance_ref.replace(distance_ref.min(), 0, inplace=True)
+
+    temp = interpolate.interp1d(distance_ref, time_ref)
+    distance_ref = np.arange(distance_ref.min(), distance_ref.max())
+    time_ref = temp(distance_ref)
+
+    temp = interpolate.interp1d(distance_comp, time_comp)
+    distance_comp = np.arange(distance_comp.min(), distance_comp.max())
+    time_comp = temp(distance_comp)
+
+    delta = (time_ref - time_comp) / (10** 6)
+    return(delta, distance_ref)
+
+def main(comp_count=2, repeat=20):
+    ref_tel = synthetic_lap()
+    comp_tels = [synthetic_lap(lap_time=80.0 + 0.3 * (i + 1), seed=i + 1) for i in range(comp_count)]
+
+    legacy = min(timeit.repeat(lambda: [legacy_get_delta(ref_tel, comp_tel) for comp_tel in comp_tels], number=1, repeat=repeat))
+    vectorized = min(timeit.repeat(lambda: analysis.get_deltas(ref_tel, comp_tels), number=1, repeat=repeat))
+
+    print('Compared laps:       ' + str(comp_count))
+    print('Legacy get_delta:    ' + format(legacy * 1000, '.3f') + ' ms')
+    print('Vectorized engine:   ' + format(vectorized * 1000, '.3f') + ' ms')
+    print('Speedup:             ' + format(legacy / vectorized, '.1f') + 'x')
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2)
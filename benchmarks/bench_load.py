@@ -0,0 +1,116 @@
+'''
+End-to-end session load latency against the local replay server, with a cold & a warm FastF1 cache
+[Every backend request is answered from the recordings of mock_server.py with the given latency & bandwidth,
+ so runs are reproducible & need no network. Record the session first:
+     python mock_server.py record --year 2023 --event Monza --session Q]
+Run from the repository root:
+    python benchmarks/bench_load.py --year 2023 --event Monza --session Q --latency 80 --bandwidth 4
+'''
+# Miscellanous Functionality
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# FastF1 API
+import fastf1 as ff1
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import mock_server
+import session_data
+from session_index import SessionIndex
+
+# Stages of a session load, in the order & with the calls of the app's background loader [see session_loader.py]
+STAGES = ['schedule', 'get_session', 'load_laps', 'session_index', 'load_telemetry', 'circuit_info']
+
+'''
+Loading the session as the app does, timing every stage
+Returns {stage: seconds}
+'''
+def load_session(year, event, session_name):
+    timings = {}
+
+    def stage(name, function):
+        start = time.perf_counter()
+        result = function()
+        timings[name] = time.perf_counter() - start
+        return result
+
+    stage('schedule', lambda: ff1.get_event_schedule(year, include_testing=False))
+    session = stage('get_session', lambda: ff1.get_session(year, event, session_name))
+    stage('load_laps', lambda: session.load(laps=True, telemetry=False, weather=False, messages=True))
+    session_index = stage('session_index', lambda: SessionIndex(session))
+    stage('load_telemetry', lambda: session_data.load_telemetry(session))
+
+    def circuit_info():
+        session.get_circuit_info()
+        session_index.index_telemetry(session)
+    stage('circuit_info', circuit_info)
+    return timings
+
+'''
+Timing a cold-cache load into an empty cache directory, then a warm-cache load from the same directory
+Returns (cold timings, warm timings)
+'''
+def cold_and_warm(year, event, session_name):
+    cache_dir = tempfile.mkdtemp(prefix='bench_load_')
+    try:
+        ff1.Cache.enable_cache(cache_dir)
+        cold = load_session(year, event, session_name)
+        warm = load_session(year, event, session_name)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return cold, warm
+
+def report(runs, label):
+    print('\n' + label)
+    print(format('Stage', '<18') + format('Cold (ms)', '>12') + format('Warm (ms)', '>12'))
+    for stage in STAGES + ['total']:
+        cold = statistics.median(run[0][stage] for run in runs) * 1000
+        warm = statistics.median(run[1][stage] for run in runs) * 1000
+        print(format(stage, '<18') + format(cold, '>12.1f') + format(warm, '>12.1f'))
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Measure cold & warm cache session loads against the local replay server.')
+    parser.add_argument('--year', type=int, required=True)
+    parser.add_argument('--event', required=True)
+    parser.add_argument('--session', required=True)
+    parser.add_argument('--recordings', default=mock_server.RECORDINGS_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help='delay before every response (ms)')
+    parser.add_argument('--bandwidth', type=float, default=0.0, help='transfer rate (MB/s) [0 for unlimited]')
+    parser.add_argument('--repeat', type=int, default=3, help='number of cold & warm load pairs [the median is reported]')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    recordings = mock_server.Recordings(args.recordings)
+    if not len(recordings):
+        print('No recordings in ' + args.recordings + ', record the session first with mock_server.py record')
+        return 1
+
+    bandwidth = args.bandwidth * 1024**2 if args.bandwidth > 0 else None
+    server = mock_server.ReplayServer(recordings, args.latency / 1000, bandwidth, port=0)
+    server.start()
+
+    runs = []
+    try:
+        with mock_server.redirect(server.url):
+            for _ in range(args.repeat):
+                cold, warm = cold_and_warm(args.year, args.event, args.session)
+                cold['total'], warm['total'] = sum(cold.values()), sum(warm.values())
+                runs.append((cold, warm))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    report(runs, str(args.year) + ' ' + args.event + ' ' + args.session + ', latency ' + str(args.latency) + ' ms, '
+           + ('bandwidth ' + str(args.bandwidth) + ' MB/s' if bandwidth else 'unlimited bandwidth'))
+    if server.misses:
+        print('\n' + str(len(set(server.misses))) + ' request(s) were not recorded, e.g. ' + server.misses[0])
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
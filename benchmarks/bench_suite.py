@@ -0,0 +1,328 @@
+'''
+Benchmark suite of the comparison, plotting & export hot paths on synthetic sessions, with regression thresholds
+Every case is timed at several data sizes & its peak Python memory measured; the results are compared with
+the baseline of this machine & the run fails when a case is slower or larger than the baseline allows
+Run from the repository root:
+    python benchmarks/bench_suite.py                    compare against this machine's baseline [stored on the first run]
+    python benchmarks/bench_suite.py --update-baseline  store this run as the baseline
+    python benchmarks/bench_suite.py --filter delta --no-gui --repeat 15
+[Timings depend on the machine, so baselines are never committed: each is stored under benchmarks/baselines,
+ keyed by host & Python version. A baseline recorded on another machine is only compared for information]
+'''
+# Miscellanous Functionality
+import argparse
+from collections import namedtuple
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analysis
+from comparison import LapComparison, aligned_distance
+from export_files import plan_export, write_files
+
+import fixtures
+
+# Host & Python version a baseline was recorded on
+def machine_key():
+    return platform.node() + '-py' + '.'.join(platform.python_version_tuple()[:2])
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', machine_key() + '.json')
+
+# Data sizes every case is measured at
+LAP_COUNTS = [1, 2, 5, 10, 20]
+MINISECTOR_COUNTS = [18, 50, 100, 250, 500]
+CORNER_COUNTS = [10, 18, 30]
+
+# Differences below these are noise, whatever the relative change
+MIN_TIME_CHANGE = 0.25
+MIN_MEMORY_CHANGE = 64
+
+# Colors of the benchmarked laps [fixed, so the plots do not depend on FastF1's color tables]
+PALETTE = ['#734fff', '#e8002d', '#27f4d2', '#ff8000', '#229971', '#0093cc', '#64c4ff', '#b6babd', '#52e252', '#ffffff']
+
+'''
+A benchmark case at one data size
+    name: unique name of the case & size, e.g. delta/get_deltas[laps=5]
+    prepare: callable returning (run, reset); only run is timed, reset restores the state after every run
+'''
+Case = namedtuple('Case', ['name', 'prepare'])
+
+# The timed callable with nothing to restore
+def no_reset(run):
+    return lambda: (run, lambda: None)
+
+# Adding the laps to a comparison of the synthetic circuit, fastest lap first
+def compared_laps(loaded, comparison=None):
+    session, session_index, _, telemetry_cache, laps = loaded
+    comparison = comparison or LapComparison(fixtures.CIRCUIT_LENGTH)
+    for order, lap in enumerate(laps):
+        telemetry = telemetry_cache.get_telemetry(session, lap)
+        comparison.add(order, lap, telemetry, aligned_distance(lap, telemetry, session_index, True), lap['Driver'],
+                       PALETTE[order % len(PALETTE)], order)
+    return comparison
+
+# Cases of the Qt-free core: the delta engine, lap resampling, track domination & the export
+def core_cases(sessions):
+    cases = []
+    for num_laps in LAP_COUNTS:
+        loaded = sessions(num_laps)
+        session, _, _, telemetry_cache, laps = loaded
+        telemetries = [telemetry_cache.get_telemetry(session, lap) for lap in laps]
+        size = '[laps=' + str(num_laps) + ']'
+
+        # The delta of every lap against the fastest, from the raw telemetry [the former get_delta]
+        cases.append(Case('delta/get_deltas' + size, no_reset(lambda telemetries=telemetries: analysis.get_deltas(telemetries[0], telemetries[1:]))))
+        cases.append(Case('delta/comparison_add' + size, no_reset(lambda loaded=loaded: compared_laps(loaded))))
+        comparison = compared_laps(loaded)
+        cases.append(Case('delta/comparison_deltas' + size, no_reset(comparison.deltas)))
+
+        for num_minisectors in MINISECTOR_COUNTS:
+            cases.append(Case('track_domination/compute[laps=' + str(num_laps) + ',minisectors=' + str(num_minisectors) + ']',
+                              no_reset(lambda comparison=comparison, num_minisectors=num_minisectors: comparison.track_domination(num_minisectors))))
+
+    for num_laps in [1, 5, 20]:
+        for file_format in ['CSV', 'Parquet']:
+            cases.append(Case('export/write_files[laps=' + str(num_laps) + ',format=' + file_format + ']',
+                              lambda loaded=sessions(num_laps), file_format=file_format: export_case(loaded, file_format)))
+    return cases
+
+'''
+Exporting the session results, circuit info, lap data & telemetry of the laps [ui.export without the dialog]
+The files are written to a temporary directory, removed after every run
+'''
+def export_case(loaded, file_format):
+    session, session_index, circuit_info, telemetry_cache, laps = loaded
+    options = {'session_results': True, 'circuit_info': True, 'lap_data': True, 'telemetry': True,
+               'weather': False, 'whole_session': False, 'file_format': file_format}
+    directory = tempfile.mkdtemp(prefix='parc_ferme_bench_')
+
+    def run():
+        jobs = plan_export(session, circuit_info, laps, options, telemetry_cache, session_index)
+        written, errors = write_files(directory, jobs, file_format, 8)
+        if errors:
+            raise RuntimeError(errors[0])
+
+    def reset():
+        shutil.rmtree(directory, ignore_errors=True)
+    return run, reset
+
+'''
+Driver comparison page with a synthetic session & its circuit loaded
+[Drawn offscreen; lap colors come from PALETTE]
+'''
+def comparison_page(app, loaded):
+    from driver_comparison import UI_driver
+
+    session, session_index, circuit_info, telemetry_cache, _ = loaded
+    page = UI_driver()
+    page.lap_style = lambda lap: (PALETTE[int(lap['Position']) % len(PALETTE)], lap['Driver'])
+    page.current_session = session
+    page.session_index = session_index
+    page.telemetry_cache = telemetry_cache
+    page.circuit_info = circuit_info
+    page.circuit_distance = fixtures.CIRCUIT_LENGTH
+    page.comparison.set_circuit(page.circuit_distance)
+    page.telemetry_ready = True
+    return page
+
+# Removing every lap drawn on the page
+def clear_page(page):
+    for key in page.comparison.keys():
+        page.remove_lap(key)
+    page.remove_delta_items()
+
+# Drawing the telemetry of every lap on every channel display [plot_tel for every lap]
+def plot_tel_case(app, page, loaded):
+    session, _, _, telemetry_cache, laps = loaded
+
+    def run():
+        for order, lap in enumerate(laps):
+            page.add_lap(order, lap, telemetry_cache.get_telemetry(session, lap), order)
+        page.set_plot_limits()
+        app.processEvents()
+    return run, lambda: clear_page(page)
+
+# Cases of the driver comparison page's drawing [needs PyQt5 & pyqtgraph; drawn offscreen]
+def gui_cases(sessions):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    cases = []
+    for num_laps in LAP_COUNTS:
+        loaded = sessions(num_laps)
+        page = comparison_page(app, loaded)
+        cases.append(Case('plot_tel/add_laps[laps=' + str(num_laps) + ']', lambda page=page, loaded=loaded: plot_tel_case(app, page, loaded)))
+
+        # The delta & track domination are drawn from a page holding every lap
+        page = comparison_page(app, loaded)
+        run, _ = plot_tel_case(app, page, loaded)
+        run()
+        cases.append(Case('delta/plot_delta[laps=' + str(num_laps) + ']',
+                          lambda page=page: (lambda: (page.plot_delta(), app.processEvents()), page.remove_delta_items)))
+
+        for num_minisectors in MINISECTOR_COUNTS:
+            def prepare(page=page, num_minisectors=num_minisectors):
+                page.num_minisectors = num_minisectors
+                return (lambda: (page.plot_track_domination(), app.processEvents()), lambda: None)
+            cases.append(Case('track_domination/plot[laps=' + str(num_laps) + ',minisectors=' + str(num_minisectors) + ']', prepare))
+
+    for num_corners in CORNER_COUNTS:
+        loaded = sessions(2, num_corners)
+        page = comparison_page(app, loaded)
+        cases.append(Case('corner_markers/build[corners=' + str(num_corners) + ']',
+                          lambda page=page: (lambda: (page.build_corner_markers(), app.processEvents()), lambda: None)))
+    return cases
+
+'''
+Timing a case & measuring its peak Python memory
+[Peak memory is traced in a separate run, as tracing slows the code down; memory allocated by Qt is not traced]
+Returns a dict of the median & fastest time (ms) & the peak memory (KiB)
+'''
+def measure(case, repeat):
+    times = []
+    for _ in range(repeat + 1):
+        run, reset = case.prepare()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000)
+        reset()
+
+    # The first run warms up imports & caches
+    times = times[1:]
+
+    run, reset = case.prepare()
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    reset()
+
+    return {'median_ms': round(statistics.median(times), 4), 'min_ms': round(min(times), 4), 'peak_kib': round(peak / 1024, 1)}
+
+'''
+Comparing the results with the baseline
+[Times are compared on the fastest run, which is far less noisy than the median on a busy machine]
+    time_threshold, memory_threshold: allowed relative increase before a case counts as regressed
+Returns a list of (case name, status, detail) where status is ok, faster, REGRESSED or new
+'''
+def compare(results, baseline, time_threshold, memory_threshold):
+    report = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            report.append((name, 'new', ''))
+            continue
+
+        time_change = result['min_ms'] - base['min_ms']
+        memory_change = result['peak_kib'] - base['peak_kib']
+        detail = format(time_change / base['min_ms'] * 100 if base['min_ms'] else 0.0, '+.0f') + '% time, ' + \
+                 format(memory_change / base['peak_kib'] * 100 if base['peak_kib'] else 0.0, '+.0f') + '% memory'
+
+        slower = time_change > MIN_TIME_CHANGE and result['min_ms'] > base['min_ms'] * (1 + time_threshold)
+        larger = memory_change > MIN_MEMORY_CHANGE and result['peak_kib'] > base['peak_kib'] * (1 + memory_threshold)
+        if slower or larger:
+            report.append((name, 'REGRESSED', detail))
+        elif time_change < -MIN_TIME_CHANGE and result['min_ms'] < base['min_ms'] * (1 - time_threshold):
+            report.append((name, 'faster', detail))
+        else:
+            report.append((name, 'ok', detail))
+    return report
+
+# Cases of a stored baseline & the machine key it was recorded on [None for a missing baseline]
+def read_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}, None
+    return data.get('cases', {}), data.get('machine', {}).get('key')
+
+def write_baseline(path, results, repeat):
+    data = {
+        'machine': {'key': machine_key(), 'python': platform.python_version(), 'platform': platform.platform(),
+                    'processor': platform.processor(), 'numpy': np.__version__, 'pandas': pd.__version__, 'repeat': repeat},
+        'cases': results,
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=1, sort_keys=True)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Benchmark the hot paths on synthetic sessions & check them against the baseline.')
+    parser.add_argument('--filter', default='', help='only run the cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs of every case')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file [this machine\'s by default]')
+    parser.add_argument('--update-baseline', action='store_true', help='store the results as the baseline instead of checking them')
+    parser.add_argument('--time-threshold', type=float, default=0.25, help='allowed relative slowdown [0.25 = 25%%]')
+    parser.add_argument('--memory-threshold', type=float, default=0.20, help='allowed relative peak memory increase')
+    parser.add_argument('--no-gui', action='store_true', help='skip the cases drawing on the driver comparison page')
+    parser.add_argument('--output', help='also write the results of this run to the given JSON file')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # Synthetic sessions are generated once per size & shared by every case
+    loaded_sessions = {}
+    def sessions(num_laps, num_corners=18):
+        key = (num_laps, num_corners)
+        if key not in loaded_sessions:
+            loaded_sessions[key] = fixtures.loaded_session(num_laps, num_corners)
+        return loaded_sessions[key]
+
+    cases = core_cases(sessions)
+    if not args.no_gui:
+        try:
+            cases.extend(gui_cases(sessions))
+        except ImportError as error:
+            print('Skipping the GUI cases: ' + str(error))
+    cases = [case for case in cases if args.filter in case.name]
+
+    results = {}
+    for case in cases:
+        results[case.name] = measure(case, args.repeat)
+        result = results[case.name]
+        print(case.name.ljust(58) + format(result['median_ms'], '10.3f') + ' ms' + format(result['peak_kib'], '12.1f') + ' KiB')
+
+    if args.output:
+        write_baseline(args.output, results, args.repeat)
+
+    baseline, recorded_on = read_baseline(args.baseline)
+    if args.update_baseline or not baseline:
+        # Keeping the baseline of the cases that were filtered out
+        baseline.update(results)
+        write_baseline(args.baseline, baseline, args.repeat)
+        print('Stored ' + str(len(results)) + ' case(s) as the baseline in ' + args.baseline)
+        return 0
+
+    report = compare(results, baseline, args.time_threshold, args.memory_threshold)
+    for name, status, detail in report:
+        if status != 'ok':
+            print(status.ljust(10) + name.ljust(58) + detail)
+
+    regressed = [name for name, status, _ in report if status == 'REGRESSED']
+    print(str(len(regressed)) + ' of ' + str(len(report)) + ' case(s) regressed')
+
+    # Timings of another machine only inform, they never fail the run
+    if recorded_on != machine_key():
+        print('Baseline recorded on ' + str(recorded_on) + ', not on ' + machine_key() + '; the comparison is advisory')
+        return 0
+    return 1 if regressed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+'''
+Synthetic FastF1-shaped sessions for the benchmarks, generated offline & deterministically
+[Laps, merged lap telemetry & circuit info carry the same columns & dtypes as FastF1's,
+ so the app code runs on them unchanged]
+'''
+# Miscellanous Functionality
+from collections import namedtuple
+import os
+import sys
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from telemetry_cache import TelemetryCache
+
+# Length (m) & fastest lap time (s) of the synthetic circuit [close to Silverstone]
+CIRCUIT_LENGTH = 5891.0
+LAP_TIME = 87.0
+
+# Merged telemetry is sampled at ~9 Hz [car & position data interleaved]
+SAMPLE_RATE = 9.0
+
+DRIVERS = [('1', 'VER', 'Red Bull Racing'), ('11', 'PER', 'Red Bull Racing'), ('16', 'LEC', 'Ferrari'), ('55', 'SAI', 'Ferrari'),
+           ('44', 'HAM', 'Mercedes'), ('63', 'RUS', 'Mercedes'), ('4', 'NOR', 'McLaren'), ('81', 'PIA', 'McLaren'),
+           ('14', 'ALO', 'Aston Martin'), ('18', 'STR', 'Aston Martin'), ('10', 'GAS', 'Alpine'), ('31', 'OCO', 'Alpine'),
+           ('23', 'ALB', 'Williams'), ('2', 'SAR', 'Williams'), ('22', 'TSU', 'RB'), ('3', 'RIC', 'RB'),
+           ('77', 'BOT', 'Kick Sauber'), ('24', 'ZHO', 'Kick Sauber'), ('20', 'MAG', 'Haas F1 Team'), ('27', 'HUL', 'Haas F1 Team')]
+
+# Circuit info of a session [the attributes the app reads from FastF1's CircuitInfo]
+CircuitInfo = namedtuple('CircuitInfo', ['corners', 'marshal_lights', 'marshal_sectors', 'rotation'])
+
+'''
+Closed track outline sampled every metre, as X & Y (m) & the curvature at every point
+[A distorted circle, so the corners are where the curvature peaks]
+'''
+def track_outline(length=CIRCUIT_LENGTH):
+    theta = np.linspace(0, 2 * np.pi, 4096, endpoint=False)
+    radius = 1 + 0.22 * np.sin(3 * theta) + 0.12 * np.cos(5 * theta + 0.7) + 0.05 * np.sin(9 * theta)
+    x, y = radius * np.cos(theta), radius * np.sin(theta)
+
+    segment = np.hypot(np.diff(x, append=x[0]), np.diff(y, append=y[0]))
+    scale = length / segment.sum()
+    arc = np.concatenate([[0], np.cumsum(segment)[:-1]]) * scale
+
+    distance = np.arange(0, length)
+    x = np.interp(distance, arc, x * scale, period=length)
+    y = np.interp(distance, arc, y * scale, period=length)
+
+    dx, dy = np.gradient(x), np.gradient(y)
+    ddx, ddy = np.gradient(dx), np.gradient(dy)
+    curvature = np.abs(dx * ddy - dy * ddx) / np.power(dx**2 + dy**2, 1.5)
+    return x, y, curvature
+
+'''
+Merged telemetry of one lap, as returned by Lap.get_telemetry
+    lap_time: duration of the lap (s)
+    seed: varies the speed trace, so no two laps are identical
+'''
+def synthetic_telemetry(lap_time=LAP_TIME, length=CIRCUIT_LENGTH, seed=0, start=pd.Timedelta(minutes=20)):
+    rng = np.random.default_rng(seed)
+    x, y, curvature = track_outline(length)
+
+    # Speed falls with the curvature ahead, then is scaled so the lap takes lap_time
+    smooth = np.convolve(np.concatenate([curvature[-150:], curvature, curvature[:150]]), np.ones(301) / 301, mode='valid')
+    speed = 330 - 250 * np.clip(smooth / smooth.max(), 0, 1) + rng.normal(0, 2, len(smooth))
+    time = np.concatenate([[0], np.cumsum(1 / (speed[:-1] / 3.6))])
+    time = time * (lap_time / (time[-1] + 1 / (speed[-1] / 3.6)))
+
+    samples = int(lap_time * SAMPLE_RATE)
+    sample_time = np.sort(rng.uniform(0, lap_time, samples))
+    sample_time[0] = 0
+    distance = np.interp(sample_time, time, np.arange(len(time)))
+    speed = np.interp(distance, np.arange(len(speed)), speed)
+
+    accelerating = np.gradient(speed) >= 0
+    gear = np.clip((speed / 42).astype(int) + 1, 1, 8)
+    session_time = start + pd.to_timedelta(sample_time, unit='s')
+
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2024-07-06 14:00') + session_time,
+        'SessionTime': session_time,
+        'DriverAhead': '',
+        'DistanceToDriverAhead': np.full(samples, np.nan),
+        'Time': pd.to_timedelta(sample_time, unit='s'),
+        'RPM': (6000 + 6000 * (speed / 42 % 1)).round(),
+        'Speed': speed.round(),
+        'nGear': gear,
+        'Throttle': np.where(accelerating, 100.0, 0.0),
+        'Brake': ~accelerating,
+        'DRS': np.where(speed > 300, 12, 0),
+        'Source': np.where(np.arange(samples) % 2 == 0, 'car', 'pos'),
+        'Distance': distance,
+        'RelativeDistance': distance / length,
+        'Status': 'OnTrack',
+        'X': np.interp(distance, np.arange(len(x)), x) * 10,
+        'Y': np.interp(distance, np.arange(len(y)), y) * 10,
+        'Z': np.zeros(samples),
+    })
+
+# Circuit info with the given number of corners, one at the sharpest point of every equal part of the lap
+def synthetic_circuit_info(num_corners=18, length=CIRCUIT_LENGTH):
+    x, y, curvature = track_outline(length)
+    parts = np.array_split(np.arange(len(curvature)), num_corners)
+    distances = np.array([part[np.argmax(curvature[part])] for part in parts])
+
+    def points(distances):
+        return pd.DataFrame({
+            'X': x[distances] * 10, 'Y': y[distances] * 10,
+            'Number': np.arange(1, len(distances) + 1), 'Letter': '',
+            'Angle': np.degrees(np.arctan2(np.gradient(y)[distances], np.gradient(x)[distances])),
+            'Distance': distances.astype(np.float64),
+        })
+
+    marshals = np.linspace(0, length - 1, 20).astype(int)
+    return CircuitInfo(points(distances), points(marshals), points(marshals), 92.0)
+
+'''
+A loaded session of synthetic laps
+[Every driver sets laps_per_driver laps, each a little slower than the driver's fastest]
+'''
+class SyntheticSession:
+    def __init__(self, num_drivers=20, laps_per_driver=3, name='Qualifying', year=2023):
+        self.name = name
+        self.date = pd.Timestamp(str(year) + '-07-06 14:00')
+        self.event = pd.Series({'EventName': 'Synthetic Grand Prix', 'Location': 'Synthetic', 'RoundNumber': 1})
+        self.drivers = [number for number, _, _ in DRIVERS[:num_drivers]]
+
+        rows = []
+        for position, (number, abbreviation, team) in enumerate(DRIVERS[:num_drivers]):
+            for lap_number in range(1, laps_per_driver + 1):
+                lap_time = LAP_TIME + 0.12 * position + 0.4 * (lap_number - 1)
+                sector = lap_time / 3
+                rows.append({
+                    'Time': pd.Timedelta(minutes=20 + 2 * lap_number, seconds=position), 'Driver': abbreviation, 'DriverNumber': number,
+                    'LapTime': pd.Timedelta(seconds=lap_time), 'LapNumber': float(lap_number), 'Stint': 1.0,
+                    'PitOutTime': pd.NaT, 'PitInTime': pd.NaT,
+                    'Sector1Time': pd.Timedelta(seconds=sector), 'Sector2Time': pd.Timedelta(seconds=sector),
+                    'Sector3Time': pd.Timedelta(seconds=sector), 'SpeedI1': 290.0, 'SpeedI2': 300.0, 'SpeedFL': 280.0, 'SpeedST': 315.0,
+                    'IsPersonalBest': lap_number == 1, 'Compound': 'SOFT', 'TyreLife': float(lap_number), 'FreshTyre': True,
+                    'Team': team, 'LapStartTime': pd.Timedelta(minutes=20 + 2 * lap_number), 'TrackStatus': '1',
+                    'Position': float(position + 1), 'Deleted': False, 'DeletedReason': '', 'FastF1Generated': False, 'IsAccurate': True,
+                })
+        self.laps = pd.DataFrame(rows)
+        self.results = pd.DataFrame({
+            'DriverNumber': self.drivers,
+            'Abbreviation': [abbreviation for _, abbreviation, _ in DRIVERS[:num_drivers]],
+            'TeamName': [team for _, _, team in DRIVERS[:num_drivers]],
+            'Position': np.arange(1, num_drivers + 1, dtype=np.float64),
+        }, index=self.drivers)
+
+    def get_driver(self, driver):
+        return self.results.loc[driver]
+
+    # Every lap of the session as a single FastF1 Lap (Series), in order
+    def lap_list(self):
+        return [self.laps.iloc[row] for row in range(len(self.laps))]
+
+# The SessionIndex lookups used by the comparison & the export [lap 1 is the fastest lap of every driver]
+class SyntheticSessionIndex:
+    def __init__(self, session, reference_lap_length=CIRCUIT_LENGTH):
+        self.rows = {(lap['DriverNumber'], int(lap['LapNumber'])): row for row, lap in enumerate(session.lap_list())}
+        self.reference_lap_length = reference_lap_length
+
+    def fastest_lap(self, driver, hot_laps):
+        return 1
+
+    def lap_row(self, driver, lap_number):
+        return self.rows[(driver, int(lap_number))]
+
+    def align_lap_one(self, distance):
+        return distance + (self.reference_lap_length - distance.max())
+
+'''
+Telemetry cache holding the synthetic telemetry of every lap of the session
+[The laps are plain Series without get_telemetry, so every lap is stored up front]
+'''
+def telemetry_cache(session):
+    cache = TelemetryCache(max_bytes=4 * 1024**3)
+    for seed, lap in enumerate(session.lap_list()):
+        cache.insert(cache.lap_key(session, lap), synthetic_telemetry(lap['LapTime'].total_seconds(), seed=seed))
+    return cache
+
+'''
+A session with its index, circuit info & telemetry, ready for the comparison, plots & export
+Returns (session, session_index, circuit_info, telemetry_cache, laps) with the laps fastest first
+'''
+def loaded_session(num_laps, num_corners=18):
+    session = SyntheticSession(num_drivers=min(num_laps, len(DRIVERS)), laps_per_driver=max(1, -(-num_laps // len(DRIVERS))))
+    laps = sorted(session.lap_list(), key=lambda lap: lap['LapTime'])[:num_laps]
+    return session, SyntheticSessionIndex(session), synthetic_circuit_info(num_corners), telemetry_cache(session), laps
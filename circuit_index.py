@@ -0,0 +1,151 @@
+''' CIRCUIT INDEX LIBRARIES'''
+# Miscellanous Functionality
+from collections import namedtuple
+import glob
+import json
+import os
+import pickle
+import threading
+
+# Data Analysis Libraries
+import numpy as np
+
+# Parsed circuit geometry; coordinates are an (n, 2) float64 array of lon/lat points
+Circuit = namedtuple('Circuit', ['id', 'location', 'name', 'length', 'bbox', 'coordinates'])
+
+'''
+In-memory index of the circuit geometry in f1_circuits, built lazily on the first lookup
+[Keyed by FastF1 location (the maps/ file name), the GeoJSON location property & the circuit id]
+The parsed index is stored as a binary sidecar, so later app starts skip the JSON parsing entirely;
+the sidecar is rebuilt whenever any of the source files change
+    source_dir: directory of the f1_circuits data
+    sidecar_path: location of the binary sidecar
+'''
+class CircuitIndex:
+    VERSION = 1
+
+    def __init__(self, source_dir='f1_circuits', sidecar_path='cache/circuit_index.pkl'):
+        self.source_dir = source_dir
+        self.sidecar_path = sidecar_path
+        self.circuits = None
+        self.seasons = None
+        self.lock = threading.Lock()
+
+    # Every file the index is built from
+    def source_files(self):
+        files = sorted(glob.glob(os.path.join(self.source_dir, 'maps', '*.geojson')))
+        files.append(os.path.join(self.source_dir, 'f1-circuits.geojson'))
+        files.extend(sorted(glob.glob(os.path.join(self.source_dir, 'championships', '*.json'))))
+        return [file for file in files if os.path.isfile(file)]
+
+    # Identifies the state of the source files; a changed signature invalidates the sidecar
+    def signature(self):
+        signature = [self.VERSION]
+        for file in self.source_files():
+            stat = os.stat(file)
+            signature.append((os.path.relpath(file, self.source_dir), stat.st_mtime_ns, stat.st_size))
+        return signature
+
+    def ensure_loaded(self):
+        if self.circuits is not None:
+            return
+
+        with self.lock:
+            if self.circuits is not None:
+                return
+
+            signature = self.signature()
+            if not self.read_sidecar(signature):
+                self.build()
+                self.write_sidecar(signature)
+
+    def read_sidecar(self, signature):
+        try:
+            with open(self.sidecar_path, 'rb') as file:
+                data = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return False
+
+        if data.get('signature') != signature:
+            return False
+
+        self.circuits = data['circuits']
+        self.seasons = data['seasons']
+        return True
+
+    def write_sidecar(self, signature):
+        data = {'signature': signature, 'circuits': self.circuits, 'seasons': self.seasons}
+        try:
+            os.makedirs(os.path.dirname(self.sidecar_path) or '.', exist_ok=True)
+            # [one temporary file per process, as batch workers may build the index at the same time]
+            temp_path = self.sidecar_path + '.' + str(os.getpid()) + '.tmp'
+            with open(temp_path, 'wb') as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.sidecar_path)
+        except OSError:
+            # The index still works from memory if the sidecar cannot be written
+            pass
+
+    # Parsing every GeoJSON & championship file into the index
+    def build(self):
+        circuits = {}
+
+        # The circuit collection first, so the per-location maps take precedence for shared ids
+        collection_path = os.path.join(self.source_dir, 'f1-circuits.geojson')
+        if os.path.isfile(collection_path):
+            for feature in self.read_json(collection_path)['features']:
+                circuit = self.parse_feature(feature)
+                circuits[circuit.id] = circuit
+                circuits[circuit.location] = circuit
+
+        for path in sorted(glob.glob(os.path.join(self.source_dir, 'maps', '*.geojson'))):
+            for feature in self.read_json(path)['features']:
+                circuit = self.parse_feature(feature)
+                circuits[circuit.id] = circuit
+                circuits[circuit.location] = circuit
+
+                # The file name is the location name used by FastF1 [e.g. 'Montréal' for 'Montreal']
+                circuits[os.path.splitext(os.path.basename(path))[0]] = circuit
+
+        seasons = {}
+        for path in sorted(glob.glob(os.path.join(self.source_dir, 'championships', '*.json'))):
+            year = int(os.path.splitext(os.path.basename(path))[0].rsplit('-', 1)[-1])
+            seasons[year] = [entry['id'] for entry in self.read_json(path)]
+
+        self.circuits = circuits
+        self.seasons = seasons
+
+    @staticmethod
+    def read_json(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def parse_feature(feature):
+        properties = feature['properties']
+        coordinates = np.asarray(feature['geometry']['coordinates'], dtype=np.float64)
+        bbox = tuple(feature.get('bbox') or (coordinates[:, 0].min(), coordinates[:, 1].min(),
+                                             coordinates[:, 0].max(), coordinates[:, 1].max()))
+        return Circuit(properties['id'], properties['Location'], properties['Name'],
+                       float(properties['length']), bbox, coordinates)
+
+    '''
+    Finding a circuit by FastF1 location, GeoJSON location or circuit id
+    Raises KeyError if the circuit is not part of f1_circuits
+    '''
+    def get(self, key):
+        self.ensure_loaded()
+        return self.circuits[key]
+
+    # Length of the circuit (m)
+    def length(self, key):
+        return self.get(key).length
+
+    # Circuits raced in the given season, in calendar order
+    def season_circuits(self, year):
+        self.ensure_loaded()
+        return [self.circuits[circuit_id] for circuit_id in self.seasons.get(year, []) if circuit_id in self.circuits]
+
+    def __contains__(self, key):
+        self.ensure_loaded()
+        return key in self.circuits
@@ -0,0 +1,138 @@
+''' BATCH CLI LIBRARIES'''
+# Runs driver comparisons & exports for many sessions without the GUI, one session per worker process
+# Examples, run from the repository root:
+#     python cli.py --year 2024 --session Qualifying --events all
+#     python cli.py --year 2024 --session Race --events "Monaco Grand Prix" "Italian Grand Prix" --drivers VER LEC NOR
+#     python cli.py --jobs jobs.json --export lap_data telemetry --format Parquet
+#     python cli.py --year 2024 --session Qualifying --analysis --from-year 2018
+# [jobs.json holds a list of {"year": 2024, "event": "Monaco Grand Prix", "session": "Qualifying", "drivers": ["VER", "LEC"]}]
+# [--analysis writes season tables of every driver's deficit to the fastest lap & gap to the teammate at every round]
+
+# Miscellanous Functionality
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import json
+import os
+import sys
+import time
+
+# FastF1 API
+import fastf1 as ff1
+
+# Batch Jobs & Season Analysis
+import batch
+import season_analysis
+from export_files import FORMATS, write_frame
+from session_data import init_worker
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Compare the fastest laps of many sessions & export their data without the GUI.')
+    parser.add_argument('--jobs', help='JSON file listing the jobs as {year, event, session, drivers} objects')
+    parser.add_argument('--year', type=int, help='season of the jobs')
+    parser.add_argument('--session', default='Qualifying', help='session of every event, e.g. Qualifying or Race')
+    parser.add_argument('--events', nargs='+', default=['all'], help='event names, or all for every event held so far')
+    parser.add_argument('--drivers', nargs='*', default=[], help='driver abbreviations or numbers [every driver if left out]')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1), help='number of worker processes')
+    parser.add_argument('--out', default='reports', help='directory of the reports')
+    parser.add_argument('--cache', default='cache', help='FastF1 cache directory shared by the workers')
+    parser.add_argument('--export', nargs='*', default=[], choices=batch.EXPORT_OPTIONS, help='session data exported with every report')
+    parser.add_argument('--format', default='CSV', choices=list(FORMATS), help='file format of the reports & exports')
+    parser.add_argument('--minisectors', type=int, default=25, help='track domination resolution')
+    parser.add_argument('--analysis', action='store_true', help='write season tables of every round instead of per-session reports')
+    parser.add_argument('--from-year', type=int, help='first season of the analysis [the --year season only if left out]')
+
+    args = parser.parse_args(argv)
+    if args.jobs is None and args.year is None:
+        parser.error('either --jobs or --year is required')
+    if args.analysis and args.year is None:
+        parser.error('--analysis requires --year')
+    return args
+
+# Building the job list from a jobs file or from the season & event arguments
+def build_jobs(args):
+    if args.jobs is not None:
+        with open(args.jobs, 'r', encoding='utf-8') as file:
+            return [batch.job_from_spec(spec) for spec in json.load(file)]
+
+    if args.events == ['all']:
+        return batch.season_jobs(args.year, args.session, args.drivers)
+    return [batch.BatchJob(args.year, event, args.session, list(args.drivers)) for event in args.events]
+
+'''
+Summarizing the session of every event of the seasons in worker processes & writing the season tables
+Writes to out/<report name>:
+    summaries: best lap of every driver at every round
+    deficits: deficit of every driver to the fastest lap of every round
+    teammates: gap of every driver to the teammate at every round
+    drivers: season of every driver in one row
+'''
+def run_analysis(args):
+    years = list(range(args.from_year or args.year, args.year + 1))
+    sessions = season_analysis.season_sessions(years, args.session)
+    if len(sessions) == 0:
+        print('No sessions to analyse')
+        return 0
+
+    workers = max(1, min(args.workers, len(sessions)))
+    print('Analysing ' + str(len(sessions)) + ' session(s) with ' + str(workers) + ' worker process(es)')
+
+    def progress(done, total, label):
+        print('[' + str(done) + '/' + str(total) + '] ' + label)
+
+    start = time.perf_counter()
+    summaries, errors = season_analysis.run_season(sessions, workers, args.cache, progress)
+    for error in errors:
+        print('    ' + error)
+
+    name = batch.report_name(batch.BatchJob(str(years[0]) + '-' + str(years[-1]), 'Season', args.session, []))
+    directory = os.path.join(args.out, name)
+    tables = [('summaries', summaries), ('deficits', season_analysis.pole_deficits(summaries)),
+              ('teammates', season_analysis.teammate_gaps(summaries)), ('drivers', season_analysis.driver_seasons(summaries))]
+    for table, frame in tables:
+        write_frame(frame, os.path.join(directory, table), args.format)
+
+    print('Finished in ' + format(time.perf_counter() - start, '.1f') + ' s, ' + str(len(errors)) + ' session(s) failed, '
+          + str(len(tables)) + ' file(s) in ' + directory)
+    return 1 if errors else 0
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # The season schedule is fetched through the same cache the workers use
+    os.makedirs(args.cache, exist_ok=True)
+    ff1.Cache.enable_cache(args.cache)
+    if args.analysis:
+        return run_analysis(args)
+
+    jobs = build_jobs(args)
+    if len(jobs) == 0:
+        print('No sessions to analyse')
+        return 0
+
+    options = batch.export_options(args.export, args.format)
+    workers = max(1, min(args.workers, len(jobs)))
+    print('Analysing ' + str(len(jobs)) + ' session(s) with ' + str(workers) + ' worker process(es)')
+
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(args.cache,)) as executor:
+        futures = {executor.submit(batch.run_job, job, args.out, args.minisectors, options): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            prefix = '[' + str(done) + '/' + str(len(jobs)) + '] ' + batch.report_name(job) + ': '
+            try:
+                result = future.result()
+            except Exception as error:
+                failed = failed + 1
+                print(prefix + 'failed: ' + str(error))
+                continue
+
+            print(prefix + str(result.laps) + ' laps, fastest ' + str(result.fastest) + ', ' + str(result.files) + ' file(s) in ' + result.directory)
+            for error in result.errors:
+                print('    ' + error)
+
+    print('Finished in ' + format(time.perf_counter() - start, '.1f') + ' s, ' + str(failed) + ' session(s) failed')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+''' COMPARISON LIBRARIES'''
+# Miscellanous Functionality
+from collections import namedtuple
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Delta Time & Minisector Engine
+import analysis
+
+# Telemetry channels drawn on the telemetry displays
+CHANNELS = ['Speed', 'Brake', 'RPM', 'Throttle', 'nGear', 'DRS']
+
+# Every column resampled onto the distance grid [Time is the time since the start of the lap (s)]
+COLUMNS = ['Time', 'X', 'Y'] + CHANNELS
+
+# Columns holding their value between samples rather than being interpolated
+STEPWISE_COLUMNS = {'Brake', 'nGear', 'DRS'}
+
+'''
+A lap taking part in the comparison
+    key: identifies the entry [a driver slot index or e.g. ('fastest', driver number)]
+    order: position of the lap in the comparison [the lowest is the reference lap]
+    lap: the FastF1 lap [Lap or one-row Laps]
+    row: row of the lap in every column of the comparison
+'''
+ComparisonLap = namedtuple('ComparisonLap', ['key', 'order', 'lap', 'name', 'color', 'row'])
+
+'''
+Track domination of the compared laps
+    times: minisector times of every lap in order, shape (laps, minisectors)
+    fastest: order of the fastest lap in every minisector [-1 where no lap covers it]
+    track: X & Y of the map lap at every grid point it covers, shape (points, 2)
+    distance: grid distance of every track point
+    point_owner: order of the fastest lap in the minisector of every track point
+'''
+TrackDomination = namedtuple('TrackDomination', ['times', 'fastest', 'track', 'distance', 'point_owner'])
+
+# Single row of the lap [race laps are selected as one-row Laps objects]
+def lap_row(lap):
+    if isinstance(lap, pd.DataFrame):
+        return lap.iloc[0]
+    return lap
+
+'''
+Distance trace of a lap, with lap 1 of a race aligned onto the full lap length
+    session_index: per-session lookups of the lap's session
+    hot_laps: whether the session is a qualifying session [no lap 1 to align]
+'''
+def aligned_distance(lap, telemetry, session_index, hot_laps):
+    distance = telemetry['Distance']
+    if not hot_laps and int(lap_row(lap)['LapNumber']) == 1:
+        distance = session_index.align_lap_one(distance)
+    return distance
+
+'''
+Any number of laps compared against each other, resampled onto one distance grid of the circuit
+[Every column is a contiguous float32 array of shape (laps, grid points), so deltas, minisectors &
+ overlays are plain array operations; each lap is resampled once, when it is added]
+The lap with the lowest order is the reference of the delta times
+    circuit_distance: length of the circuit (m) [None to take it from the first lap added]
+    step: spacing of the distance grid (m)
+'''
+class LapComparison:
+    def __init__(self, circuit_distance=None, step=1.0):
+        self.step = step
+        self.set_circuit(circuit_distance)
+
+    # Setting up an empty grid for the circuit [drops every lap]
+    def set_circuit(self, circuit_distance):
+        self.circuit_distance = circuit_distance
+        self.grid = analysis.distance_grid(circuit_distance, self.step) if circuit_distance else np.zeros(1)
+        self.distance = self.grid.astype(np.float32)
+        self.columns = {column: np.empty((0, len(self.grid)), dtype=np.float32) for column in COLUMNS}
+        self.clear()
+
+    def clear(self):
+        self.entries = {}
+
+        # Rows of removed laps, reused by the next laps added
+        self.free_rows = []
+        self.row_count = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __iter__(self):
+        return iter(self.ordered())
+
+    # Every lap of the comparison, reference lap first
+    def ordered(self):
+        return sorted(self.entries.values(), key=lambda entry: entry.order)
+
+    def keys(self):
+        return list(self.entries.keys())
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    # The lap all delta times are measured against [None if the comparison is empty]
+    def reference(self):
+        return min(self.entries.values(), key=lambda entry: entry.order, default=None)
+
+    # Memory held by the resampled columns, including the rows kept free for later laps (bytes)
+    def nbytes(self):
+        return sum(values.nbytes for values in self.columns.values()) + self.grid.nbytes + self.distance.nbytes
+
+    # Resampled values of a lap [a view into the column, shared by every consumer]
+    def values(self, entry, column):
+        return self.columns[column][entry.row]
+
+    # Resampled values of several laps, as an array of shape (len(entries), grid points)
+    def rows(self, entries, column):
+        return self.columns[column][[entry.row for entry in entries]]
+
+    def allocate_row(self):
+        if self.free_rows:
+            return self.free_rows.pop()
+
+        # Growing every column geometrically, so adding a lap stays O(1) amortized
+        # [views handed out earlier keep the previous arrays alive & unchanged]
+        if self.row_count == len(self.columns['Time']):
+            capacity = max(4, 2 * self.row_count)
+            for column in COLUMNS:
+                grown = np.empty((capacity, len(self.grid)), dtype=np.float32)
+                grown[:self.row_count] = self.columns[column][:self.row_count]
+                self.columns[column] = grown
+
+        self.row_count += 1
+        return self.row_count - 1
+
+    '''
+    Adding a lap to the comparison, replacing the lap previously held under the key
+        telemetry: merged lap telemetry [only read, as it is shared through the telemetry cache]
+        distance: aligned distance of the lap [e.g. lap 1 shifted onto the reference lap length]
+        order: position of the lap in the comparison
+    '''
+    def add(self, key, lap, telemetry, distance, name, color, order):
+        # Laying the grid over the lap's own distance when the circuit length is not known
+        # [no circuit geometry & no reference lap; the comparison is still empty then]
+        if not self.circuit_distance:
+            lap_distance = np.nanmax(np.asarray(distance, dtype=np.float64)) if len(distance) else np.nan
+            if not lap_distance > 0:
+                raise ValueError('Unknown circuit length & no distance in the lap telemetry')
+            self.set_circuit(float(lap_distance))
+
+        self.remove(key)
+
+        # Scaling the lap onto the circuit length, so every lap finishes on the last grid point
+        distance = analysis.scale_distance(distance, self.circuit_distance)
+        time = analysis.time_to_seconds(telemetry['Time'])
+
+        row = self.allocate_row()
+        for column in COLUMNS:
+            values = time - time[0] if column == 'Time' else telemetry[column].to_numpy(dtype=np.float64)
+            self.columns[column][row] = analysis.resample(distance, values, self.grid, column in STEPWISE_COLUMNS)
+
+        entry = ComparisonLap(key, order, lap, name, color, row)
+        self.entries[key] = entry
+        return entry
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.free_rows.append(entry.row)
+        return entry
+
+    # Distance of the first grid point covered by the lap
+    def start_distance(self, entry):
+        covered = np.flatnonzero(np.isfinite(self.values(entry, 'Time')))
+        return self.grid[covered[0]] if len(covered) else np.inf
+
+    '''
+    Delta time of every lap after the reference lap
+    Returns the reference entry, the compared entries & an array of shape (len(compared entries), grid points)
+    [None when fewer than two laps are compared; negative where the compared lap is behind]
+    '''
+    def deltas(self):
+        entries = self.ordered()
+        if len(entries) < 2:
+            return None
+
+        reference = entries[0]
+        compared = entries[1:]
+        return reference, compared, self.values(reference, 'Time') - self.rows(compared, 'Time')
+
+    # Minisector times of every lap in order, as an array of shape (len(self), num_minisectors)
+    def minisector_times(self, num_minisectors):
+        entries = self.ordered()
+        if len(entries) == 0:
+            return np.empty((0, num_minisectors))
+        return analysis.grid_minisector_times(self.grid, self.rows(entries, 'Time'), self.circuit_distance, num_minisectors)
+
+    '''
+    Fastest lap of every minisector & the track map it is drawn on
+    [The map is taken from the lap covering the most of the circuit, i.e. not a lap 1 if avoidable]
+    Returns a TrackDomination [None if the comparison is empty]
+    '''
+    def track_domination(self, num_minisectors):
+        entries = self.ordered()
+        if len(entries) == 0:
+            return None
+
+        times = self.minisector_times(num_minisectors)
+        fastest = analysis.fastest_minisectors(times)
+
+        map_entry = min(entries, key=self.start_distance)
+        track = np.column_stack([self.values(map_entry, 'X'), self.values(map_entry, 'Y')]).astype(np.float64)
+        covered = np.isfinite(track).all(axis=1)
+        distance = self.grid[covered]
+
+        # Finding the fastest lap of the minisector every track point lies in
+        point_owner = fastest[analysis.minisector_of(distance, self.circuit_distance, num_minisectors)]
+        return TrackDomination(times, fastest, track[covered], distance, point_owner)
@@ -7,23 +7,57 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 import PyQt5.uic as uic 
 
-# FastF1 API
-import fastf1 as ff1
-
 # Plotting Libraries
+# [FastF1 driver & team colors are imported lazily through plot_style]
 import pyqtgraph as pg
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as  FigureCanvas
-from matplotlib.collections import LineCollection
-import geojson
+import plot_style
 
 # Data Analysis Libraries
 import numpy as np
 import pandas as pd
 import re
-from scipy import interpolate 
+
+# Shared Lap Telemetry Store & Circuit Geometry
+from telemetry_cache import TelemetryCache
+from circuit_index import CircuitIndex
+from image_cache import ImageCache
+
+# Compared Laps & Session Helpers
+from comparison import LapComparison, aligned_distance, lap_row
+import session_data
+
+# Stage Timings
+from perf_trace import timed
+
+class LapTelemetrySignals(QObject):
+    loaded = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+'''
+Fetching the telemetry of several laps on a QThreadPool thread
+    generation: identifies the request, so superseded results can be dropped
+    session: loaded FastF1 session
+    laps: list of (key, lap) pairs
+    telemetry_cache: shared lap telemetry store [thread safe]
+Emits loaded with a list of (key, lap, telemetry) triples
+'''
+class LapTelemetryWorker(QRunnable):
+    def __init__(self, generation, session, laps, telemetry_cache):
+        super().__init__()
+        self.generation = generation
+        self.session = session
+        self.laps = laps
+        self.telemetry_cache = telemetry_cache
+        self.signals = LapTelemetrySignals()
+
+    def run(self):
+        try:
+            results = []
+            for key, lap in self.laps:
+                results.append((key, lap, self.telemetry_cache.get_telemetry(self.session, lap)))
+            self.signals.loaded.emit(self.generation, results)
+        except Exception as error:
+            self.signals.failed.emit(self.generation, str(error))
 
 class UI_driver(QWidget):
     def __init__(self, *args, **kwargs):
@@ -51,6 +85,10 @@ class UI_driver(QWidget):
         self.driver_sector1_disp = [self.driver1_sector1, self.driver2_sector1, self.driver3_sector1]
         self.driver_sector2_disp = [self.driver1_sector2, self.driver2_sector2, self.driver3_sector2]
         self.driver_sector3_disp = [self.driver1_sector3, self.driver2_sector3, self.driver3_sector3]
+        self.driver_sel = [self.driver1, self.driver2, self.driver3]
+        self.lap_sel = [self.lap_sel1, self.lap_sel2, self.lap_sel3]
+        self.fast_buttons = [self.fast1, self.fast2, self.fast3]
+        self.headshots = [self.headshot1, self.headshot2, self.headshot3]
 
         self.set_plot_displays()
 
@@ -70,22 +108,11 @@ class UI_driver(QWidget):
         self.fast2.clicked.connect(lambda: self.set_fastest_lap(1))
         self.fast3.clicked.connect(lambda: self.set_fastest_lap(2))   
         
+        # Overlaying the fastest lap of every driver
+        self.overlay_fastest.toggled.connect(self.overlay_fastest_laps)
+
         # Initializing Matrices
         self.laps = ['','','']
-        self.speed_tel1 = ['','','']
-        self.brake_tel1 = ['','','']
-        self.rpm_tel1 = ['','','']
-        self.throttle_tel1 = ['','','']
-        self.ngear_tel1 = ['','','']
-        self.drs_tel1 = ['','','']
-
-        self.speed_tel2 = ['','','']
-        self.brake_tel2 = ['','','']
-        self.rpm_tel2 = ['','','']
-        self.throttle_tel2 = ['','','']
-        self.ngear_tel2 = ['','','']
-        self.drs_tel2 = ['','','']
-
         self.driver_laptimes = ['','','']
         self.driver_laps = ['','','']
         self.driver_sector1_times = ['','','']
@@ -93,6 +120,38 @@ class UI_driver(QWidget):
         self.driver_sector3_times = ['','','']
         self.tyre_compounds = ['','','']
 
+        # Every compared lap [the three driver slots & any overlaid laps] & the curves drawn for each
+        self.comparison = LapComparison()
+        self.curve_items = {}
+
+        # Laps are only plotted once the telemetry of the session has loaded
+        self.telemetry_ready = False
+
+        # Fetching the telemetry of overlaid laps off the GUI thread
+        self.overlay_generation = 0
+        self.overlay_pool = QThreadPool(self)
+        self.overlay_pool.setMaxThreadCount(1)
+
+        # Merged lap telemetry shared by the telemetry plots, delta, track domination & export
+        self.telemetry_cache = TelemetryCache()
+
+        # Parsed f1_circuits geometry, loaded on the first lookup
+        self.circuit_index = CircuitIndex()
+
+        # Headshots & tyre icons scaled to their displayed size
+        self.image_cache = ImageCache(parent=self)
+
+        # Items drawn on the delta display & the corner overlay shared by all telemetry displays
+        self.delta_items = []
+        self.corner_items = []
+
+        # Delta curve of every compared lap & the reference lap they were drawn against
+        self.delta_curves = {}
+        self.delta_reference = None
+
+        # Number of minisectors the track domination map is split into
+        self.num_minisectors = 18
+
         # Loading Data
         self.lap_sel1.currentIndexChanged.connect(lambda: self.load_compare_data(0))
         self.lap_sel2.currentIndexChanged.connect(lambda: self.load_compare_data(1))
@@ -148,6 +207,20 @@ class UI_driver(QWidget):
         self.drs2p.setLabel('left', 'DRS')
         self.drs2p.setLabel('bottom', 'Distance', units ='km')
 
+        # Displays of every telemetry channel
+        self.channel_plots = {
+            'Speed': [self.speed1p, self.speed2p], 'Brake': [self.brake1p, self.brake2p],
+            'RPM': [self.rpm1p, self.rpm2p], 'Throttle': [self.throttle1p, self.throttle2p],
+            'nGear': [self.ngear1p, self.ngear2p], 'DRS': [self.drs1p, self.drs2p],
+        }
+
+        # Drawing only the visible part of each curve, decimated to the min/max of every pixel column
+        self.telemetry_plots = [self.speed1p, self.speed2p, self.rpm1p, self.rpm2p, self.throttle1p, self.throttle2p,
+                                self.brake1p, self.brake2p, self.ngear1p, self.ngear2p, self.drs1p, self.drs2p, self.deltap]
+        for plot in self.telemetry_plots:
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setClipToView(True)
+
         self.track_dom_p.getPlotItem().hideAxis('bottom')
         self.track_dom_p.getPlotItem().hideAxis('left')
         self.track_dom_p.setAspectLocked()
@@ -157,6 +230,7 @@ class UI_driver(QWidget):
 
     def disable_drivers(self, initial_load: bool):
         self.initial_load = initial_load
+        self.telemetry_ready = False
 
         self.driver1.clear()
         self.driver2.clear()
@@ -178,20 +252,20 @@ class UI_driver(QWidget):
         self.drs2p.clear()
         self.deltap.clear()
         self.track_dom_p.clear()
+        self.delta_items = []
+        self.corner_items = []
+        self.delta_curves = {}
+        self.delta_reference = None
 
-        self.speed_tel1 = ['','','']
-        self.brake_tel1 = ['','','']
-        self.rpm_tel1 = ['','','']
-        self.throttle_tel1 = ['','','']
-        self.ngear_tel1 = ['','','']
-        self.drs_tel1 = ['','','']
+        self.comparison.clear()
+        self.curve_items = {}
 
-        self.speed_tel2 = ['','','']
-        self.brake_tel2 = ['','','']
-        self.rpm_tel2 = ['','','']
-        self.throttle_tel2 = ['','','']
-        self.ngear_tel2 = ['','','']
-        self.drs_tel2 = ['','','']
+        # Dropping overlays still being fetched for the previous session
+        self.overlay_generation += 1
+        self.overlay_fastest.blockSignals(True)
+        self.overlay_fastest.setChecked(False)
+        self.overlay_fastest.blockSignals(False)
+        self.overlay_fastest.setEnabled(False)
 
         self.driver_laptimes = ['','','']
         self.driver_laps = ['','','']
@@ -227,13 +301,75 @@ class UI_driver(QWidget):
         self.clear1.setEnabled(True)
         self.clear2.setEnabled(True)
         self.clear3.setEnabled(True)
+        self.overlay_fastest.setEnabled(True)
     
-    def receive_parameters(self, current_session, circuit_info, initial_load):
+    '''
+    Receiving a session loaded with its results & laps
+    [Drivers & laps can be selected right away; plotting waits for receive_telemetry]
+    '''
+    def receive_parameters(self, current_session, session_index, initial_load):
         self.current_session = current_session
-        self.circuit_info = circuit_info
+        self.session_index = session_index
         self.initial_load = initial_load
+        self.telemetry_ready = False
+
         self.drivers_select()
+        self.overlay_fastest.setEnabled(False)
+
+    '''
+    Receiving the telemetry & circuit info of the session, then plotting the laps selected in the meantime
+        circuit_info: circuit info of the session [placed using the telemetry]
+    '''
+    @timed('driver_comparison.receive_telemetry')
+    def receive_telemetry(self, circuit_info):
+        self.circuit_info = circuit_info
+
+        # Finding the maximum circuit distance from the circuit geometry index
+        # [falling back to the fastest lap's distance for circuits missing from f1_circuits]
+        location = self.current_session.event['Location']
+        if location in self.circuit_index:
+            self.circuit_distance = self.circuit_index.length(location)
+        else:
+            self.circuit_distance = self.session_index.reference_lap_length
+
+        # Every compared lap is resampled onto the distance grid of this circuit
+        self.comparison.set_circuit(self.circuit_distance)
+
+        self.build_corner_markers()
+        self.telemetry_ready = True
+        self.overlay_fastest.setEnabled(True)
+
+        if hasattr(self, 'drivers'):
+            for id in range(3):
+                self.plot_tel(id)
+        if self.overlay_fastest.isChecked():
+            self.overlay_fastest_laps(True)
+        else:
+            self.redraw_comparison()
     
+    # Driver & lap selections of the three slots & the fastest lap overlay, as combo box indices
+    def selection(self):
+        return ([combo.currentIndex() for combo in self.driver_sel], [combo.currentIndex() for combo in self.lap_sel],
+                self.overlay_fastest.isChecked())
+
+    '''
+    Restoring the selections made on a session when switching back to it
+    [Each slot is plotted once, with the restored lap, instead of with its first lap & then again]
+        selection: as returned by selection()
+    '''
+    def restore_selection(self, selection):
+        driver_indices, lap_indices, overlay = selection
+        for id in range(3):
+            self.lap_sel[id].blockSignals(True)
+            self.driver_sel[id].setCurrentIndex(driver_indices[id])
+            self.lap_sel[id].setCurrentIndex(lap_indices[id] if lap_indices[id] < self.lap_sel[id].count() else -1)
+            self.lap_sel[id].blockSignals(False)
+
+            if self.lap_sel[id].currentIndex() != -1:
+                self.load_compare_data(id)
+
+        self.overlay_fastest.setChecked(overlay)
+
     # Adding Drivers from the selected Session to combo box
     def drivers_select(self):
         self.enable_drivers()
@@ -246,6 +382,10 @@ class UI_driver(QWidget):
             self.driver2.addItem(name['DriverNumber'].zfill(2) + ":  " + name['FullName']) 
             self.driver3.addItem(name['DriverNumber'].zfill(2) + ":  " + name['FullName'])
 
+        # Decoding the headshots of the session's drivers in the background
+        self.image_cache.warm(self.current_session.date.year, drivers, self.headshot1.iconSize(),
+                              self.driver1_compound.iconSize(), self.devicePixelRatioF())
+
     # Converting driver strings to only driver numbers
     def get_driver_no(self):
         self.drivers = [self.driver1.currentText(), self.driver2.currentText(), self.driver3.currentText()]
@@ -262,7 +402,8 @@ class UI_driver(QWidget):
         id: index for which driver is being updated
     '''
     def update_headshot(self, id):   
-        driver_headshot = QIcon('images/driver_headshots/' + str(self.current_session.date.year) + '/' + self.drivers[id] + '.webp')
+        driver_headshot = self.image_cache.headshot(self.current_session.date.year, self.drivers[id],
+                                                    self.headshot1.iconSize(), self.devicePixelRatioF())
         if id == 0:
             self.headshot1.setIcon(driver_headshot)
         elif id == 1:
@@ -279,72 +420,25 @@ class UI_driver(QWidget):
         # Generating the driver number array
         self.get_driver_no()
 
-        if id == 0:
-            if not (self.driver1.currentText() == ''):
-                self.lap_sel1.setEnabled(True)
-                self.fast1.setEnabled(True)
-                self.update_headshot(0)
-                self.lap_sel1.clear()
-
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box())):
-                        self.lap_sel1.addItem('Lap ' + str(i+1))
-                else:
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]))):
-                        self.lap_sel1.addItem('Lap ' + str(i+1))
-            
-            else:
-                self.headshot1.setIcon(QIcon())
-                self.lap_sel1.setCurrentIndex(-1)
-                self.lap_sel1.setEnabled(False)
-                self.fast1.setEnabled(False)
-
-        if id == 1:
-            if not (self.driver2.currentText() == ''):
-                self.lap_sel2.setEnabled(True)
-                self.fast2.setEnabled(True)
-                self.update_headshot(1)
-                self.lap_sel2.clear()
-
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box())):
-                        self.lap_sel2.addItem('Lap ' + str(i+1))
-                else:
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]))):
-                        self.lap_sel2.addItem('Lap ' + str(i+1))
-
+        if not (self.driver_sel[id].currentText() == ''):
+            self.lap_sel[id].setEnabled(True)
+            self.fast_buttons[id].setEnabled(True)
+            self.update_headshot(id)
+            self.lap_sel[id].clear()
+
+            # Listing the laps from the session's lap index rather than filtering the laps table
+            # [hot-laps are numbered in order, race laps by their lap number]
+            combo_laps = self.session_index.combo_laps(self.drivers[id], self.is_qualifying())
+            if self.is_qualifying():
+                self.lap_sel[id].addItems(['Lap ' + str(i+1) for i in range(len(combo_laps))])
             else:
-                self.headshot2.setIcon(QIcon())
-                self.lap_sel2.setCurrentIndex(-1)
-                self.lap_sel2.setEnabled(False)
-                self.fast2.setEnabled(False)
-
-        if id == 2:
-            if not (self.driver3.currentText() == ''):
-                self.lap_sel3.setEnabled(True)
-                self.fast3.setEnabled(True)
-                self.update_headshot(2)
-                self.lap_sel3.clear()
-
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box())):
-                        self.lap_sel3.addItem('Lap ' + str(i+1))
-
-                else:
-                    for i in range(len(self.current_session.laps.pick_driver(self.drivers[id]))):
-                        self.lap_sel3.addItem('Lap ' + str(i+1))
+                self.lap_sel[id].addItems(['Lap ' + str(lap_number) for lap_number in combo_laps])
 
-            else:
-                self.headshot3.setIcon(QIcon())
-                self.lap_sel3.setCurrentIndex(-1)
-                self.lap_sel3.setEnabled(False)
-                self.fast3.setEnabled(False)
+        else:
+            self.headshots[id].setIcon(QIcon())
+            self.lap_sel[id].setCurrentIndex(-1)
+            self.lap_sel[id].setEnabled(False)
+            self.fast_buttons[id].setEnabled(False)
         
         self.laps = [self.lap_sel1.currentText(), self.lap_sel2.currentText(), self.lap_sel3.currentText()]
     
@@ -354,74 +448,13 @@ class UI_driver(QWidget):
         id: index for which driver is being updated
     '''
     def set_fastest_lap(self, id):
-        if id == 0:
-            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box().pick_fastest()
-                fastest_lap = fastest_lap['LapNumber']
-
-                # Finding the number of stints completed by the driver
-                stint = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box()
-                stint.reset_index(inplace = True, drop = True)
-
-                # Finding the sting in which the fastest lap was completed
-                fast_index = stint.index[stint['LapNumber']==fastest_lap].tolist()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel1.setCurrentIndex(fast_index[0])
-
-            else:
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_fastest()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel1.setCurrentIndex(int(fastest_lap['LapNumber']) - 1)
-        
-        if id == 1:
-            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box().pick_fastest()
-                fastest_lap = fastest_lap['LapNumber']
-
-                # Finding the number of stints completed by the driver
-                stint = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box()
-                stint.reset_index(inplace = True, drop = True)
-
-                # Finding the sting in which the fastest lap was completed
-                fast_index = stint.index[stint['LapNumber']==fastest_lap].tolist()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel2.setCurrentIndex(fast_index[0])
-
-            else:
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_fastest()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel2.setCurrentIndex(int(fastest_lap['LapNumber']) - 1)
-
-        if id == 2:
-            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box().pick_fastest()
-                fastest_lap = fastest_lap['LapNumber']
-
-                # Finding the number of stints completed by the driver
-                stint = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box()
-                stint.reset_index(inplace = True, drop = True)
-
-                # Finding the sting in which the fastest lap was completed
-                fast_index = stint.index[stint['LapNumber']==fastest_lap].tolist()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel3.setCurrentIndex(fast_index[0])
+        hot_laps = self.is_qualifying()
+        fastest_lap = self.session_index.fastest_lap(self.drivers[id], hot_laps)
 
-            else:
-                fastest_lap = self.current_session.laps.pick_driver(self.drivers[id]).pick_fastest()
-
-                # Setting the current index of the lap selection combobox to that of the fastest lap
-                self.lap_sel3.setCurrentIndex(int(fastest_lap['LapNumber']) - 1)
+        # Setting the current index of the lap selection combobox to that of the fastest lap
+        position = self.session_index.combo_position(self.drivers[id], fastest_lap, hot_laps)
+        if position is not None:
+            self.lap_sel[id].setCurrentIndex(position)
     
     # Setting the driver selection index to ~none~
     def clear_driver(self, id):
@@ -446,35 +479,7 @@ class UI_driver(QWidget):
         self.driver_laptimes[id] = ''
         self.driver_laps[id] = pd.DataFrame()
 
-        self.speed_tel1[id].clear()
-        self.speed1p_legend.removeItem(self.speed_tel1[id])
-        self.speed_tel2[id].clear()
-        self.speed2p_legend.removeItem(self.speed_tel2[id])
-
-        self.brake_tel1[id].clear()
-        self.brake1p_legend.removeItem(self.brake_tel1[id])
-        self.brake_tel2[id].clear()
-        self.brake2p_legend.removeItem(self.brake_tel2[id])
-
-        self.rpm_tel1[id].clear()
-        self.rpm1p_legend.removeItem(self.rpm_tel1[id])
-        self.rpm_tel2[id].clear()
-        self.rpm2p_legend.removeItem(self.rpm_tel2[id])
-
-        self.throttle_tel1[id].clear()
-        self.throttle1p_legend.removeItem(self.throttle_tel1[id])
-        self.throttle_tel2[id].clear()
-        self.throttle2p_legend.removeItem(self.throttle_tel2[id])
-        
-        self.ngear_tel1[id].clear()
-        self.ngear1p_legend.removeItem(self.ngear_tel1[id])
-        self.ngear_tel2[id].clear()
-        self.ngear2p_legend.removeItem(self.ngear_tel2[id])
-
-        self.drs_tel1[id].clear()
-        self.drs1p_legend.removeItem(self.drs_tel1[id])
-        self.drs_tel2[id].clear()
-        self.drs2p_legend.removeItem(self.drs_tel2[id])
+        self.remove_lap(id)
 
         self.driver_colors_disp[id].setStyleSheet('background-color: #28282a')
 
@@ -497,30 +502,28 @@ class UI_driver(QWidget):
         Plotting the Delta Time [with respect to the first driver in self.drivers array]
         Displaying the Track Domination based on selected Laps
     '''
+    @timed('driver_comparison.load_compare_data')
     def load_compare_data(self, id):
        
         if self.initial_load:
             return
 
         # Clearing driver data only if plotted prior
-        if not self.speed_tel1[id] == '':
+        if id in self.comparison:
             self.clear_driver_data(id)
         
-        event = ff1.get_event(self.current_session.date.year, self.current_session.event['EventName'])
-
-        # Finding the maximum circuit distance from geojson data
-        with open('f1_circuits/maps/' + event['Location'] + '.geojson', 'r') as file:
-            geo_data = geojson.load(file)
-        for feature in geo_data['features']:
-            self.circuit_distance = feature['properties']['length']
-        
         # Initializing Laps array
         self.laps = [self.lap_sel1.currentText(), self.lap_sel2.currentText(), self.lap_sel3.currentText()]       
         self.display_lap_time(id)
         self.display_driv_color(id)
+
+        # Laps selected before the telemetry has loaded are plotted by receive_telemetry
+        if not self.telemetry_ready:
+            return
+
         self.plot_tel(id)
         self.plot_delta()
-        self.plot_corner_markers()
+        self.show_corner_markers(not self.drivers == ['0','0','0'] or len(self.comparison) > 0)
         self.plot_track_domination()
 
         print(self.drivers)
@@ -535,46 +538,80 @@ class UI_driver(QWidget):
     '''
     def display_driv_color(self, id):
         if not (self.drivers[id] == '0' or self.laps[id] == ''):
-            driver_lap = self.driver_laps[id]              
-            if self.current_session.date.year == 2024:
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    driv_color = ff1.plotting.driver_color(driver_lap['Driver'])                    
-                else:
-                    driv_color = ff1.plotting.driver_color(driver_lap['Driver'].iat[0])               
-            else:
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    driv_color = ff1.plotting.team_color(driver_lap['Team'])
-                else:
-                    driv_color = ff1.plotting.team_color(driver_lap['Team'].iat[0])
-            
+            driv_color, _ = self.lap_style(self.driver_laps[id])
             self.driver_colors_disp[id].setStyleSheet('background-color: ' + driv_color)
 
+    # Checking if only hot-laps are selectable in the session
+    def is_qualifying(self):
+        return session_data.is_qualifying(self.current_session)
+
+    '''
+    Finding the color & name a lap is drawn with
+    [Currently has the same error as display_driv_color]
+        lap: Lap or one-row Laps
+    '''
+    def lap_style(self, lap):
+        row = lap_row(lap)
+        if self.current_session.date.year == 2024:
+            return plot_style.driver_color(row['Driver']), row['Driver']
+        return plot_style.team_color(row['Team']), row['Driver']
+
+    # Distance trace of a lap, with lap 1 of a race aligned onto the full lap length
+    def lap_distance(self, lap, telemetry):
+        return aligned_distance(lap, telemetry, self.session_index, self.is_qualifying())
+
+    '''
+    Adding a lap to the comparison & drawing its telemetry on every channel display
+        key: slot index or overlay key of the lap
+        lap: Lap or one-row Laps
+        telemetry: merged lap telemetry [shared through the telemetry cache]
+        order: position of the lap in the comparison [the lowest is the delta reference]
+    '''
+    def add_lap(self, key, lap, telemetry, order):
+        self.remove_lap(key)
+        driv_color, driver_name = self.lap_style(lap)
+        entry = self.comparison.add(key, lap, telemetry, self.lap_distance(lap, telemetry), driver_name, driv_color, order)
+
+        # Every lap shares the grid distance array & each channel row is shared by both of its displays
+        pen = plot_style.pen(driv_color)
+        items = []
+        for channel, plots in self.channel_plots.items():
+            values = self.comparison.values(entry, channel)
+            for plot in plots:
+                items.append((plot, plot.plot(self.comparison.distance, values, pen = pen, name=driver_name, connect = 'finite')))
+        self.curve_items[key] = items
+        return entry
+
+    # Removing a lap from the comparison along with its curves & legend entries
+    def remove_lap(self, key):
+        for plot, item in self.curve_items.pop(key, []):
+            plot.removeItem(item)
+        if key in self.delta_curves:
+            self.deltap.removeItem(self.delta_curves.pop(key))
+        self.comparison.remove(key)
+
     '''
     Displays the Laptime & Sector times for the selected lap
         id: index for which driver is being updated
     '''
+    @timed('driver_comparison.display_lap_time')
     def display_lap_time(self, id):
         if not (self.drivers[id] == '0' or self.laps[id] == ''):
             temp = re.findall(r'\b\d+\b', self.laps[id])           
             self.laps[id] = temp[0]
 
             # Generating the required arrays
-            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                driver_lap_temp = self.current_session.laps.pick_driver(self.drivers[id]).pick_wo_box()
-                self.driver_laps[id] = driver_lap_temp.iloc[int(self.laps[id]) - 1]
+            # [the lap is found through the session's lap index; race laps are kept as one-row Laps]
+            row = self.session_index.combo_row(self.drivers[id], self.lap_sel[id].currentIndex(), self.is_qualifying())
+            if self.is_qualifying():
+                self.driver_laps[id] = self.current_session.laps.iloc[row]
                 self.driver_laptimes[id] = self.driver_laps[id]['LapTime']
                 self.driver_sector1_times[id] = self.driver_laps[id]['Sector1Time']
                 self.driver_sector2_times[id] = self.driver_laps[id]['Sector2Time']
                 self.driver_sector3_times[id] = self.driver_laps[id]['Sector3Time']
                 self.tyre_compounds[id] = self.driver_laps[id]['Compound']
             else:
-                self.driver_laps[id] = self.current_session.laps.pick_driver(self.drivers[id]).pick_lap(int(self.laps[id]))
+                self.driver_laps[id] = self.current_session.laps.iloc[[row]]
                 self.driver_laptimes[id] = self.driver_laps[id]['LapTime'].iat[0]
                 self.tyre_compounds[id] = self.driver_laps[id]['Compound'].iat[0]
                 self.driver_sector1_times[id] = self.driver_laps[id]['Sector1Time'].iat[0]
@@ -645,7 +682,7 @@ class UI_driver(QWidget):
         id: index for which driver is being updated
     '''
     def display_tyre_compound(self, id):
-        tyre_compound_picture = QIcon('images/tyre_compounds/' + self.tyre_compounds[id] + '.png')
+        tyre_compound_picture = self.image_cache.tyre(self.tyre_compounds[id], self.driver1_compound.iconSize(), self.devicePixelRatioF())
         if id == 0:
             self.driver1_compound.setIcon(tyre_compound_picture)
         elif id == 1:
@@ -653,438 +690,231 @@ class UI_driver(QWidget):
         elif id == 2:
             self.driver3_compound.setIcon(tyre_compound_picture)
 
-    # Plots the corner markers onto the telemetry display
-    def plot_corner_markers(self):
-        if not self.drivers == ['0','0','0']:
-            for _, corners in self.circuit_info.corners.iterrows():
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.speed1p.addItem(corner_line)
-                    self.speed1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 30)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.speed2p.addItem(corner_line)
-                    self.speed2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 30)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.rpm1p.addItem(corner_line)
-                    self.rpm1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 1200)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.rpm2p.addItem(corner_line)
-                    self.rpm2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 1200)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.brake1p.addItem(corner_line)
-                    self.brake1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.1)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.brake2p.addItem(corner_line)
-                    self.brake2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.1)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.brake1p.addItem(corner_line)
-                    self.brake1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.1)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.brake2p.addItem(corner_line)
-                    self.brake2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.1)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.ngear1p.addItem(corner_line)
-                    self.ngear1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 1.2)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.ngear2p.addItem(corner_line)
-                    self.ngear2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 1.2)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.throttle1p.addItem(corner_line)
-                    self.throttle1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 10)
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.throttle2p.addItem(corner_line)
-                    self.throttle2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 10)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.deltap.addItem(corner_line)
-                    self.deltap.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.02)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.drs1p.addItem(corner_line)
-                    self.drs1p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.02)
-
-                    corner_line = pg.InfiniteLine(pos = corners['Distance'], angle = 90, movable= False, pen = 'grey')
-                    text = f"{corners['Number']}{corners['Letter']}"
-                    text = pg.TextItem(text, color= 'grey')
-                    corner_line.setPen(width = 0.5, style = Qt.DotLine)
-                    self.drs2p.addItem(corner_line)
-                    self.drs2p.addItem(text)
-                    text.setPos(corners['Distance'] + 10, 0.02)
+    '''
+    Building the corner markers of the session once, as a reusable overlay on every telemetry display
+    [one line item per plot draws every corner; the overlay is toggled rather than recreated on lap changes]
+    '''
+    @timed('driver_comparison.build_corner_markers')
+    def build_corner_markers(self):
+        self.remove_corner_markers()
+
+        corners = self.circuit_info.corners
+        distances = corners['Distance'].to_numpy(dtype=np.float64)
+        labels = [f"{number}{letter}" for number, letter in zip(corners['Number'], corners['Letter'])]
+        pen = plot_style.pen('grey', width = 0.5, style = Qt.DotLine)
+
+        # Plot, height of the corner labels, vertical extent of the corner lines
+        overlays = [
+            (self.speed1p, 30, 0, 360), (self.speed2p, 30, 0, 360),
+            (self.rpm1p, 1200, 0, 14100), (self.rpm2p, 1200, 0, 14100),
+            (self.brake1p, 0.1, 0, 1.10), (self.brake2p, 0.1, 0, 1.10),
+            (self.ngear1p, 1.2, 0, 8.5), (self.ngear2p, 1.2, 0, 8.5),
+            (self.throttle1p, 10, 0, 110), (self.throttle2p, 10, 0, 110),
+            (self.deltap, 0.02, -100, 100),
+            (self.drs1p, 0.02, 0, 14.5), (self.drs2p, 0.02, 0, 14.5),
+        ]
+
+        self.corner_items = []
+        for plot, text_y, y_min, y_max in overlays:
+            # Each corner is one (bottom, top) pair of points, joined by an explicit connect array so the pairs hold
+            # wherever the curve is cut; the overlay is exempt from the plot's clipping & downsampling
+            x = np.repeat(distances, 2)
+            y = np.tile([y_min, y_max], len(distances))
+            connect = np.tile([True, False], len(distances))
+            corner_lines = pg.PlotDataItem(x, y, pen = pen, connect = connect)
+            plot.addItem(corner_lines, ignoreBounds = True)
+            corner_lines.setClipToView(False)
+            corner_lines.setDownsampling(ds = 1, auto = False)
+            self.corner_items.append((plot, corner_lines))
+
+            for distance, label in zip(distances, labels):
+                text = pg.TextItem(label, color= 'grey')
+                plot.addItem(text, ignoreBounds = True)
+                text.setPos(distance + 10, text_y)
+                self.corner_items.append((plot, text))
+
+        self.show_corner_markers(False)
+
+    # Showing or hiding the corner overlay on every telemetry display
+    def show_corner_markers(self, visible):
+        for _, item in self.corner_items:
+            item.setVisible(visible)
+
+    def remove_corner_markers(self):
+        for plot, item in getattr(self, 'corner_items', []):
+            plot.removeItem(item)
+        self.corner_items = []
 
     '''
     Plotting the driver Telemetry for the given lap
         id: index for which driver is being updated
     '''
+    @timed('driver_comparison.plot_tel')
     def plot_tel(self, id):
         # Checking if the selected driver or lap is blank
         if not (self.drivers[id] == '0'or self.laps[id] == ''):
             driver_lap = self.driver_laps[id]
-            driver_tel = driver_lap.get_car_data().add_distance()
-
-            # Finding the driver color & generating the telemetry data for the selected driver's lap
-            # [Currently has the same error as display_driver_color]
-            if self.current_session.date.year == 2024:
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    driv_color = ff1.plotting.driver_color(driver_lap['Driver'])
-                    driver_name = driver_lap['Driver']
-                else:
-                    driv_color = ff1.plotting.driver_color(driver_lap['Driver'].iat[0])
-                    driver_name = driver_lap['Driver'].iat[0]
-
-                    if int(driver_lap['LapNumber'].iloc[0]) == 1:
-                        temp_lap = self.current_session.laps.pick_fastest()
-                        temp_tel = temp_lap.get_telemetry().add_distance()
-                        driver_tel['Distance'] = driver_tel['Distance'] + (temp_tel['Distance'].max() - driver_tel['Distance'].max())
-            
-            else:
-                if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                    getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                    driv_color = ff1.plotting.team_color(driver_lap['Team'])
-                    driver_name = driver_lap['Driver']
-                else:
-                    driv_color = ff1.plotting.team_color(driver_lap['Team'].iat[0])
-                    driver_name = driver_lap['Driver'].iat[0]
-
-                    if int(driver_lap['LapNumber'].iloc[0]) == 1:
-                        temp_lap = self.current_session.laps.pick_fastest()
-                        temp_tel = temp_lap.get_telemetry().add_distance()
-                        driver_tel['Distance'] = driver_tel['Distance'] + (temp_tel['Distance'].max() - driver_tel['Distance'].max())
-                
-            max_d = self.circuit_distance             
-            
-            # Plotting all the generated data while constructing an array of it for better management
-            self.speed_tel1[id] = self.speed1p.plot(driver_tel['Distance'], driver_tel['Speed'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.brake_tel1[id] = self.brake1p.plot(driver_tel['Distance'], driver_tel['Brake'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.rpm_tel1[id] = self.rpm1p.plot(driver_tel['Distance'], driver_tel['RPM'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.throttle_tel1[id] = self.throttle1p.plot(driver_tel['Distance'], driver_tel['Throttle'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.ngear_tel1[id] = self.ngear1p.plot(driver_tel['Distance'], driver_tel['nGear'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.drs_tel1[id] = self.drs1p.plot(driver_tel['Distance'], driver_tel['DRS'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-
-            self.speed_tel2[id] = self.speed2p.plot(driver_tel['Distance'], driver_tel['Speed'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.brake_tel2[id] = self.brake2p.plot(driver_tel['Distance'], driver_tel['Brake'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.rpm_tel2[id] = self.rpm2p.plot(driver_tel['Distance'], driver_tel['RPM'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.throttle_tel2[id] = self.throttle2p.plot(driver_tel['Distance'], driver_tel['Throttle'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.ngear_tel2[id] = self.ngear2p.plot(driver_tel['Distance'], driver_tel['nGear'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-            self.drs_tel2[id] = self.drs2p.plot(driver_tel['Distance'], driver_tel['DRS'], pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-
-            # Setting the telemetry plot dimensions and scrollable limits
-            self.speed1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=360)
-            self.speed2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=360)
-            self.rpm1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=14100)
-            self.rpm2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=14100)
-            self.brake1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=1.10)
-            self.brake2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=1.10)
-            self.throttle1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=110)
-            self.throttle2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=110)
-            self.ngear1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=8.5)
-            self.ngear2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=8.5)
-            self.drs1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=7.5, yMax=14.5)
-            self.drs2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=7.5, yMax=14.5)
+            driver_tel = self.telemetry_cache.get_telemetry(self.current_session, driver_lap)
+
+            # The driver slots come first, so the first selected slot stays the delta reference
+            self.add_lap(id, driver_lap, driver_tel, id)
+            self.set_plot_limits()
+
+    # Setting the telemetry plot dimensions and scrollable limits
+    def set_plot_limits(self):
+        max_d = self.comparison.circuit_distance
+        self.speed1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=360)
+        self.speed2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=360)
+        self.rpm1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=14100)
+        self.rpm2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=14100)
+        self.brake1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=1.10)
+        self.brake2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=1.10)
+        self.throttle1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=110)
+        self.throttle2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=110)
+        self.ngear1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=8.5)
+        self.ngear2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=0, yMax=8.5)
+        self.drs1p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=7.5, yMax=14.5)
+        self.drs2p.getViewBox().setLimits(xMin=0, xMax=max_d, yMin=7.5, yMax=14.5)
+
+    '''
+    Overlaying the fastest lap of every driver onto the selected laps
+    [The telemetry is fetched in the background; unchecking removes the overlaid laps]
+        checked: state of the overlay button
+    '''
+    def overlay_fastest_laps(self, checked):
+        self.overlay_generation += 1
+
+        # Overlays checked before the telemetry has loaded are fetched by receive_telemetry
+        if not self.telemetry_ready:
+            return
+
+        if not checked:
+            for key in self.comparison.keys():
+                if isinstance(key, tuple):
+                    self.remove_lap(key)
+            self.redraw_comparison()
+            return
+
+        laps = []
+        for driver in self.current_session.drivers:
+            fastest_lap = self.session_index.fastest_lap(driver, False)
+            if fastest_lap is not None:
+                row = self.session_index.lap_row(driver, fastest_lap)
+                laps.append((('fastest', driver), self.current_session.laps.iloc[row]))
+
+        worker = LapTelemetryWorker(self.overlay_generation, self.current_session, laps, self.telemetry_cache)
+        worker.signals.loaded.connect(self.overlay_loaded)
+        worker.signals.failed.connect(self.overlay_failed)
+        self.overlay_pool.start(worker)
+
+    @timed('driver_comparison.overlay_loaded')
+    def overlay_loaded(self, generation, results):
+        # Ignoring overlays of a previous request or session
+        if generation != self.overlay_generation:
+            return
+
+        # Overlaid laps follow the driver slots
+        for i, (key, lap, telemetry) in enumerate(results):
+            self.add_lap(key, lap, telemetry, len(self.laps) + i)
+        self.set_plot_limits()
+        self.redraw_comparison()
+
+    def overlay_failed(self, generation, message):
+        if generation == self.overlay_generation:
+            print('Failed to load the overlaid laps: ' + message)
+
+    # Redrawing everything derived from all compared laps at once
+    def redraw_comparison(self):
+        self.plot_delta()
+        self.show_corner_markers(len(self.comparison) > 0)
+        self.plot_track_domination()
 
     '''
     Plotting the driver delta time
     [works only when 2 or more driver laps were selected]
     '''
+    @timed('driver_comparison.plot_delta')
     def plot_delta(self):
-        max_d = self.circuit_distance
+        max_d = self.comparison.circuit_distance
 
-        # Checking the number of blank lap selection combo boxes 
-        # [i.e. how many driver laps were selected]
-        ele = ''
-        x = [i for i in self.laps if i==ele]
-        self.deltap.clear()
+        # Plotting Delta Time only if 2 or more laps are compared
+        # [a single array subtraction on the shared distance grid]
+        deltas = self.comparison.deltas()
+        if deltas is None:
+            self.remove_delta_items()
+            return
+        reference, compared, delta_time = deltas
+        ref_dist = self.comparison.distance
 
-        # Plotting Delta Time only if 2 or more driver laps were selected
-        if not len(x) >= 2:
-            # Adding horizontal line at delta time = 0s
-            self.deltap.addLine(y = 0, pen = pg.mkPen('white', width= 2))
-            driver_count = 0
-            for id in range(3):
-                if not (self.drivers[id] == '0'or self.laps[id] == ''):
-                    # Setting the first driver lap selected/available as the reference telemetry
-                    if driver_count == 0:
-                        ref_lap = self.driver_laps[id]
-                        ref_tel = ref_lap.get_telemetry()
-                        if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                            getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                            getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                            ref_name = ref_lap['Driver']
-                        else:
-                            ref_name = ref_lap['Driver'].iat[0]
-                        driver_count = driver_count + 1
-                        continue
-                    
-                    # Finding the delta time of the following laps with respect to the first
-                    else:
-                        driver_lap = self.driver_laps[id]
-                        driver_tel = driver_lap.get_telemetry()
-
-                        if self.current_session.date.year == 2024:
-                            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                                driv_color = ff1.plotting.driver_color(driver_lap['Driver'])
-                                driver_name = driver_lap['Driver']
-                            else:
-                                driv_color = ff1.plotting.driver_color(driver_lap['Driver'].iat[0])
-                                driver_name = driver_lap['Driver'].iat[0]
-                            
-                        else:
-                            if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                                getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                                getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                                driv_color = ff1.plotting.team_color(driver_lap['Team'])
-                                driver_name = driver_lap['Driver']
-                            else:
-                                driv_color = ff1.plotting.team_color(driver_lap['Team'].iat[0])
-                                driver_name = driver_lap['Driver'].iat[0]
-
-                    # Extracting the delta time
-                    delta_time, ref_dist = self.get_delta(ref_tel, driver_tel)
-
-                    # Finding the limits of the arrays; required for setting plot limits
-                    if driver_count == 1:
-                            max = delta_time.max()
-                            min = delta_time.min()
-                        
-                    else:
-                        if delta_time.max() > max:
-                            max = delta_time.max()
-                        if delta_time.min() < min:
-                            min = delta_time.min()
-
-                    driver_count = driver_count + 1
-                    self.deltap.plot(ref_dist, delta_time, pen = pg.mkPen(driv_color, width= 2.5), name=driver_name)
-
-            self.deltap.getViewBox().setLimits(xMin=0, xMax=max_d, yMin= min - 0.1, yMax= max + 0.1)
-            self.deltap.setLabel('left', 'Gap to ' + ref_name, units ='s')
-            self.deltap.setLabel('bottom', 'Distance', units ='km')
+        # Curves of unchanged laps are kept while the reference lap stays the same
+        if self.delta_reference is not reference:
+            self.remove_delta_items()
+            self.delta_reference = reference
 
-    '''
-    Calculating the Delta time w.r.t telemetry distance between two laps using interpolation
-    [self-made function due to the deprecation of the FastF1 utils module]
-    '''
-    def get_delta(self, ref_lap, comp_lap):
-        
-        distance_ref = ref_lap['Distance']
-        distance_comp = comp_lap['Distance']
-        time_ref = [0] * len(ref_lap['Time'])
-        time_comp = [0] * len(comp_lap['Time'])
-
-        # Converting Laptime column into a useful format (microseconds)
-        for i in range(len(ref_lap['Time'])):
-            time_ref[i] = ref_lap['Time'].iloc[i].seconds * (10 ** 6) + ref_lap['Time'].iloc[i].microseconds
-
-        for i in range(len(comp_lap['Time'])):
-            time_comp[i] = comp_lap['Time'].iloc[i].seconds * (10 ** 6) + comp_lap['Time'].iloc[i].microseconds
-
-        # Setting the final distances the same in order to make a useful interpolation
-        # [ERROR: Causes a sharp spike towards the end of the plot, as well as some error in the leadup to it]
-        max1 = distance_comp.max()
-        max2 = distance_ref.max()
-        if distance_comp.max() < distance_ref.max():
-            distance_comp.replace(to_replace= max1, value=max2, inplace=True)
-        elif distance_comp.max() > distance_ref.max():
-            distance_ref.replace(to_replace=max2, value=max1, inplace=True)
-
-        # Setting the initial distance counter as 0
-        distance_comp.replace(distance_comp.min(), 0, inplace=True)
-        distance_ref.replace(distance_ref.min(), 0, inplace=True)
-
-        # 1-D Interpolation of data for plotting
-        temp = interpolate.interp1d(distance_ref, time_ref) 
-        distance_ref = np.arange(distance_ref.min(), distance_ref.max()) 
-        time_ref = temp(distance_ref) 
-
-        temp = interpolate.interp1d(distance_comp, time_comp) 
-        distance_comp = np.arange(distance_comp.min(), distance_comp.max()) 
-        time_comp = temp(distance_comp)
-
-        # Generating array of delta time at different points based on the interpolated data
-        delta = (time_ref - time_comp) / (10** 6)
-        return(delta, distance_ref)
+            # Adding horizontal line at delta time = 0s
+            self.delta_items.append(self.deltap.addLine(y = 0, pen = plot_style.pen('white', width= 2)))
+
+        compared_keys = [entry.key for entry in compared]
+        for key in [key for key in self.delta_curves if key not in compared_keys]:
+            self.deltap.removeItem(self.delta_curves.pop(key))
+
+        for entry, lap_delta in zip(compared, delta_time):
+            if entry.key not in self.delta_curves:
+                self.delta_curves[entry.key] = self.deltap.plot(ref_dist, lap_delta, pen = plot_style.pen(entry.color), name=entry.name,
+                                                                connect = 'finite')
+
+        # Finding the limits of the arrays; required for setting plot limits
+        # [grid points a lap does not cover, e.g. the grid start of lap 1, are NaN]
+        if np.isfinite(delta_time).any():
+            self.deltap.getViewBox().setLimits(xMin=0, xMax=max_d, yMin= float(np.nanmin(delta_time)) - 0.1, yMax= float(np.nanmax(delta_time)) + 0.1)
+        self.deltap.setLabel('left', 'Gap to ' + reference.name, units ='s')
+        self.deltap.setLabel('bottom', 'Distance', units ='km')
+
+    # Removing the delta traces, leaving the corner overlay in place
+    def remove_delta_items(self):
+        for item in self.delta_items + list(self.delta_curves.values()):
+            self.deltap.removeItem(item)
+        self.delta_items = []
+        self.delta_curves = {}
+        self.delta_reference = None
 
     # Plotting Track Domination for the selected driver laps
+    @timed('driver_comparison.plot_track_domination')
     def plot_track_domination(self):
-        driver_count = 0
-        for i, driver in enumerate(self.drivers):
-            if not self.laps[i] == '':
-                driver_lap = self.driver_laps[i]
-                driver_tel = driver_lap.get_telemetry().add_distance()
-                if self.current_session.date.year == 2024:
-                    if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                        getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                        getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                        driv_color = ff1.plotting.driver_color(driver_lap['Driver'])
-                    else:
-                        driv_color = ff1.plotting.driver_color(driver_lap['Driver'].iat[0])
-
-                        if int(driver_lap['LapNumber'].iloc[0]) == 1:
-                            temp_lap = self.current_session.laps.pick_fastest()
-                            temp_tel = temp_lap.get_telemetry().add_distance()
-                            driver_tel['Distance'] = driver_tel['Distance'] + (temp_tel['Distance'].max() - driver_tel['Distance'].max())
-                
-                else:
-                    if (getattr(self.current_session, 'name') == 'Qualifying' or 
-                        getattr(self.current_session, 'name') == 'Sprint Qualifying' or 
-                        getattr(self.current_session, 'name') == 'Sprint Shootout'):
-                        driv_color = ff1.plotting.team_color(driver_lap['Team'])
-                    else:
-                        driv_color = ff1.plotting.team_color(driver_lap['Team'].iat[0])
-
-                        if int(driver_lap['LapNumber'].iloc[0]) == 1:
-                            temp_lap = self.current_session.laps.pick_fastest()
-                            temp_tel = temp_lap.get_telemetry().add_distance()
-                            driver_tel['Distance'] = driver_tel['Distance'] + (temp_tel['Distance'].max() - driver_tel['Distance'].max())
-                
-                driver_tel['Driver'] = self.drivers[i]
-                driver_tel['DriverColor'] = driv_color
-
-                # Generating array of telemetry data
-                if i == 0:
-                    telemetry = driver_tel
-                else:
-                    if driver_count == 0:
-                        telemetry = driver_tel
-                    else:
-                        telemetry = telemetry._append(driver_tel)
-                
-                driver_count = driver_count + 1
+        entries = self.comparison.ordered()
+        domination = self.comparison.track_domination(self.num_minisectors)
 
-        if not (self.drivers == ['0', '0', '0'] or self.laps == ['','','']):
-            # Generate equally sized mini-sectors 
-            num_minisectors = 18
-            minisector_length = self.circuit_distance / num_minisectors
+        # Removing the map of the previous laps [nothing is drawn once every lap has been cleared]
+        self.track_dom_p.clear()
+        if domination is None:
+            return
 
-            # Initiate minisector variable, with 0 (meters) as a starting point.
-            minisectors = [0]
+        # Convert the rotation angle from degrees to radian.
+        track_angle = self.circuit_info.rotation / 180 * np.pi
 
-            # Add multiples of minisector_length to the minisectors
-            for i in range(0, (num_minisectors - 1)):
-                minisectors.append(minisector_length * (i + 1))
-            
-            # Adding the minisector column to the dataframe 
-            # [i.e. in which minisector was the telemetry data for the lap at that point recorded]
-            telemetry['Minisector'] = telemetry['Distance'].apply(
-                lambda dist: (
-                    int((dist // minisector_length) + 1)
-                )
-            )
-
-            # Initializing the arrays to be used in the loop
-            drivers = [None] * driver_count
-            delta = [None] * driver_count
-
-            for i in range(1, num_minisectors + 1):
-                # Temporary dataframe of the selected minisector
-                filtered_data = telemetry[telemetry['Minisector'] == i].iloc[:, :] 
-
-                # Collapsing the dataframe into just a single entry for each driver
-                # [Done by finding the average speed carried through the minisector by the driver & resetting index]
-                msector_dom = filtered_data.groupby(['Minisector', 'Driver', 'DriverColor'])['Speed'].mean().reset_index()
-
-                # Generating driver array & delta time array for each minisector
-                for id in range(driver_count):
-                    drivers[id] = filtered_data[filtered_data['Driver'] == msector_dom['Driver'].iloc[id]].iloc[:, :]
-                    delta[id] = drivers[id]['Time'].max() - drivers[id]['Time'].min()
-                
-                # Adding the delta time points to the required dataframe
-                msector_dom = msector_dom.assign(Time = delta)
-                if i == 1:
-                    times = msector_dom
-                else:
-                    times = times._append(msector_dom)
-
-            # Resetting the index of the modified dataframe
-            times = times.reset_index()
-            times.drop(["index"], axis = 1, inplace = True)
-
-            # Grouping by Minisector & selecting the minimum elapsed time for each
-            fastest_driver = times.loc[times.groupby(['Minisector'])['Time'].idxmin()]
-            # Getting rid of the speed column and renaming the driver column
-            fastest_driver = fastest_driver[['Minisector', 'Driver', 'DriverColor']].rename(columns={'Driver': 'FastestDriver'})
-
-            track = telemetry.loc[:, ('X', 'Y')].to_numpy()
-
-            # Convert the rotation angle from degrees to radian.
-            track_angle = self.circuit_info.rotation / 180 * np.pi
-
-            # Rotate and plot the track map.
-            track = self.rotate(track, angle=track_angle)
-
-            # Adding Starting line marker
-            start_line = pg.ScatterPlotItem(size=20, pen = pg.mkPen('k' , width= 8), brush=pg.mkBrush(255, 255, 255), symbol = 'o')
-            start_line.addPoints([track[0][0]], [track[0][1]])
-
-            self.track_dom_p.clear()
-            track = np.array_split(track, num_minisectors)
-            for i in range(num_minisectors):
-                self.track_dom_p.plot(track[i][:, 0], track[i][:, 1], pen = pg.mkPen(fastest_driver['DriverColor'].iloc[i] ,width= 15))
-            self.track_dom_p.addItem(start_line)
-            self.plot_corner_points()
+        # Rotate and plot the track map.
+        track = self.rotate(domination.track, angle=track_angle)
+
+        # Adding Starting line marker
+        start_line = pg.ScatterPlotItem(size=20, pen = pg.mkPen('k' , width= 8), brush=pg.mkBrush(255, 255, 255), symbol = 'o')
+        start_line.addPoints([track[0][0]], [track[0][1]])
+        point_owner = domination.point_owner
+
+        # Plotting the whole track once per lap, connecting only the segments that lap dominates
+        # [keeps the item count independent of the number of minisectors]
+        self.track_dom_p.plot(track[:, 0], track[:, 1], pen = plot_style.pen('#464649', width= 15))
+        for i, entry in enumerate(entries):
+            connect = np.append(point_owner[:-1] == i, False)
+            if connect.any():
+                self.track_dom_p.plot(track[:, 0], track[:, 1], pen = plot_style.pen(entry.color, width= 15), connect = connect)
+        self.track_dom_p.addItem(start_line)
+        self.plot_corner_points()
+
+    # Changing the track domination resolution & redrawing the map for the selected laps
+    def set_minisectors(self, num_minisectors):
+        self.num_minisectors = num_minisectors
+        if hasattr(self, 'current_session') and len(self.comparison) > 0:
+            self.plot_track_domination()
 
     # Rotation function for plotting track layout in official rotation
     def rotate(self, xy, *, angle):
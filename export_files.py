@@ -0,0 +1,131 @@
+''' EXPORT FILE LIBRARIES'''
+# Miscellanous Functionality
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+
+# Data Analysis Libraries
+import pandas as pd
+
+# Weather is left out of the session load until an export asks for it
+from session_data import load_weather
+
+# File extension of every export format
+FORMATS = {'CSV': '.csv', 'Parquet': '.parquet', 'Feather': '.feather'}
+
+# Turning a Lap (Series) into a single row frame, as the columnar formats only store frames
+def as_frame(data):
+    if isinstance(data, pd.Series):
+        return data.to_frame().T.infer_objects()
+    return pd.DataFrame(data)
+
+'''
+Writing a frame in the given export format
+    data: DataFrame or Series to write
+    path: file path without extension
+    file_format: one of FORMATS
+'''
+def write_frame(data, path, file_format):
+    path = path + FORMATS[file_format]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if file_format == 'CSV':
+        data.to_csv(path)
+        return path
+
+    frame = as_frame(data)
+    frame.columns = [str(column) for column in frame.columns]
+
+    if file_format == 'Parquet':
+        frame.to_parquet(path, compression='zstd')
+    else:
+        # Feather only stores a default index, so any meaningful index is kept as a column
+        if isinstance(frame.index, pd.RangeIndex) or (frame.index.name is None and pd.api.types.is_integer_dtype(frame.index)):
+            frame = frame.reset_index(drop=True)
+        else:
+            frame = frame.reset_index()
+        frame.to_feather(path, compression='zstd')
+    return path
+
+# Single row of the lap for name & number lookups [race laps are passed as one-row Laps objects]
+def lap_row(lap):
+    if isinstance(lap, pd.DataFrame):
+        return lap.iloc[0]
+    return lap
+
+'''
+Building the list of files to export for the session, as (relative path, producer) pairs
+[Called on the export thread; producers are only called by the export workers, so no data is computed on the GUI thread]
+    session: loaded FastF1 session
+    circuit_info: circuit info of the session
+    selected_laps: laps selected on the driver comparison page
+    options: dict of the export preferences
+    telemetry_cache: shared lap telemetry store
+    session_index: per-session lookups [personal best laps]
+'''
+def plan_export(session, circuit_info, selected_laps, options, telemetry_cache, session_index):
+    jobs = []
+
+    # Weather is loaded once here, before the producers run concurrently & read the session
+    if options['weather'] and len(selected_laps) > 0:
+        load_weather(session)
+
+    if options['session_results']:
+        jobs.append(('session_results', lambda: session.results))
+
+    if options['circuit_info']:
+        jobs.append(('circuit_corners', lambda: circuit_info.corners))
+        jobs.append(('circuit_marshal_lights', lambda: circuit_info.marshal_lights))
+        jobs.append(('circuit_marshal_sectors', lambda: circuit_info.marshal_sectors))
+
+        # Converting Track Rotation into a single element dataframe
+        jobs.append(('circuit_rotation', lambda: pd.DataFrame({'TrackRotation': [circuit_info.rotation]})))
+
+    for lap in selected_laps:
+        row = lap_row(lap)
+        lap_number = int(row['LapNumber'])
+        name = 'driver_laps/' + row['Driver'] + '_' + str(lap_number)
+        if session_index.fastest_lap(row['DriverNumber'], True) == lap_number:
+            name = name + '_personalBest'
+
+        if options['lap_data']:
+            jobs.append((name, lambda lap=lap: lap))
+        if options['weather']:
+            jobs.append((name + '_weatherData', lambda lap=lap: lap.get_weather_data()))
+        if options['telemetry']:
+            jobs.append((name + '_telemetry', lambda lap=lap: telemetry_cache.get_telemetry(session, lap)))
+
+    # Telemetry of every lap of every driver, partitioned by driver & lap
+    # [bypasses the telemetry cache, so a bulk export does not evict the laps being viewed]
+    if options['whole_session']:
+        for driver in session.drivers:
+            driver_laps = session.laps.pick_driver(driver)
+            abbreviation = session.get_driver(driver)['Abbreviation']
+            for _, lap in driver_laps.iterlaps():
+                path = 'session_telemetry/driver=' + abbreviation + '/lap=' + str(int(lap['LapNumber']))
+                jobs.append((path, lambda lap=lap: lap.get_telemetry()))
+
+    return jobs
+
+'''
+Producing & writing the files of an export concurrently
+    directory: export directory
+    jobs: (relative path, producer) pairs [see plan_export]
+    file_format: one of FORMATS
+    max_workers: number of files produced & written at once
+    progress: optional callable receiving (files done, files total, path or error) as each file completes
+Returns the number of files written & the list of errors
+'''
+def write_files(directory, jobs, file_format, max_workers, progress=None):
+    errors = []
+    write = lambda name, producer: write_frame(producer(), os.path.join(directory, name), file_format)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(write, name, producer) for name, producer in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                path = future.result()
+            except Exception as error:
+                errors.append(str(error))
+                path = 'failed: ' + str(error)
+            if progress is not None:
+                progress(done, len(jobs), path)
+    return len(jobs) - len(errors), errors
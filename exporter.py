@@ -0,0 +1,77 @@
+''' EXPORT LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+import os
+
+# Planning & Writing the Export Files
+from export_files import plan_export, write_files
+
+# Stage Timings
+from perf_trace import recorder
+
+'''
+Signals emitted by the export worker [an export ends with exactly one of finished or failed]
+    progress:   files done, files total, path or error of the last file
+    finished:   export directory, number of files written, errors of the files that failed
+    failed:     error message of an export that could not run
+'''
+class ExportSignals(QObject):
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str)
+
+'''
+Runs an export on a QThreadPool thread, writing the independent files concurrently
+    directory: export directory
+    plan: callable returning the (relative path, producer) pairs to write
+    file_format: one of FORMATS
+    max_workers: number of files produced & written at once
+'''
+class ExportWorker(QRunnable):
+    def __init__(self, directory, plan, file_format, max_workers):
+        super().__init__()
+        self.directory = directory
+        self.plan = plan
+        self.file_format = file_format
+        self.max_workers = max_workers
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            with recorder.span('exporter.plan', 'export'):
+                jobs = self.plan()
+            with recorder.span('exporter.write_files', 'export'):
+                written, errors = write_files(self.directory, jobs, self.file_format, self.max_workers, self.signals.progress.emit)
+            self.signals.finished.emit(self.directory, written, errors)
+
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+
+'''
+Exports session data in the background & reports the progress
+[Only one export runs at a time]
+'''
+class SessionExporter(QObject):
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(str, int, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def is_exporting(self):
+        return self.pool.activeThreadCount() > 0
+
+    def export(self, directory, session, circuit_info, selected_laps, options, telemetry_cache, session_index):
+        plan = lambda: plan_export(session, circuit_info, selected_laps, options, telemetry_cache, session_index)
+        worker = ExportWorker(directory, plan, options['file_format'], self.max_workers)
+        worker.signals.progress.connect(self.progress)
+        worker.signals.finished.connect(self.finished)
+        worker.signals.failed.connect(self.failed)
+        self.pool.start(worker)
@@ -0,0 +1,157 @@
+''' IMAGE CACHE LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+
+# Miscellanous Functionality
+import os
+
+'''
+Decoding an image at the given size
+[QImageReader scales while decoding, so the full size image is never held in memory]
+    path: source image
+    size: QSize in device pixels
+    thumbnail_dir: directory of the downscaled thumbnails on disk [None to not store thumbnails]
+'''
+def read_scaled(path, size, thumbnail_dir=None):
+    thumbnail = thumbnail_path(path, size, thumbnail_dir) if thumbnail_dir else None
+
+    # A thumbnail is only valid while it is newer than its source image
+    if thumbnail and os.path.isfile(thumbnail) and os.path.getmtime(thumbnail) >= os.path.getmtime(path):
+        image = QImage(thumbnail)
+        if not image.isNull():
+            return image
+
+    reader = QImageReader(path)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, Qt.KeepAspectRatio))
+    image = reader.read()
+
+    if thumbnail and not image.isNull():
+        try:
+            os.makedirs(os.path.dirname(thumbnail), exist_ok=True)
+            image.save(thumbnail, 'PNG')
+        except OSError:
+            pass
+    return image
+
+# Location of the thumbnail of an image [named after its source path & size]
+def thumbnail_path(path, size, thumbnail_dir):
+    name = os.path.splitext(os.path.normpath(path))[0].replace(os.sep, '_')
+    return os.path.join(thumbnail_dir, name + '_' + str(size.width()) + 'x' + str(size.height()) + '.png')
+
+def cache_key(path, size, pixel_ratio):
+    return path + '@' + str(size.width()) + 'x' + str(size.height()) + '@' + str(pixel_ratio)
+
+class ImageWarmSignals(QObject):
+    decoded = pyqtSignal(str, object)
+
+'''
+Decodes a batch of images on a QThreadPool thread
+[QImage is used as QPixmap may only be created on the GUI thread]
+    paths: source images
+    size: QSize in device pixels
+    pixel_ratio: device pixel ratio the images are displayed at
+    thumbnail_dir: directory of the downscaled thumbnails on disk
+'''
+class ImageWarmWorker(QRunnable):
+    def __init__(self, paths, size, pixel_ratio, thumbnail_dir):
+        super().__init__()
+        self.paths = paths
+        self.size = size
+        self.pixel_ratio = pixel_ratio
+        self.thumbnail_dir = thumbnail_dir
+        self.signals = ImageWarmSignals()
+
+    def run(self):
+        for path in self.paths:
+            if os.path.isfile(path):
+                image = read_scaled(path, self.size, self.thumbnail_dir)
+                if not image.isNull():
+                    image.setDevicePixelRatio(self.pixel_ratio)
+                    self.signals.decoded.emit(cache_key(path, self.size, self.pixel_ratio), image)
+
+'''
+Driver headshots & tyre compound icons, pre-scaled to their displayed size
+[Scaled pixmaps are kept in the bounded QPixmapCache; downscaled thumbnails are stored on disk
+ so the ~1000 px WebP headshots are only decoded once]
+    thumbnail_dir: directory of the downscaled thumbnails [None to keep them in memory only]
+    cache_limit: QPixmapCache size (KB)
+'''
+class ImageCache(QObject):
+    HEADSHOT_DIR = 'images/driver_headshots'
+    TYRE_DIR = 'images/tyre_compounds'
+
+    def __init__(self, thumbnail_dir='cache/thumbnails', cache_limit=64 * 1024, parent=None):
+        super().__init__(parent)
+        self.thumbnail_dir = thumbnail_dir
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), cache_limit))
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    @staticmethod
+    def device_size(size, pixel_ratio):
+        return QSize(int(size.width() * pixel_ratio), int(size.height() * pixel_ratio))
+
+    def headshot_path(self, year, driver_number):
+        return self.HEADSHOT_DIR + '/' + str(year) + '/' + str(driver_number) + '.webp'
+
+    def tyre_path(self, compound):
+        return self.TYRE_DIR + '/' + str(compound) + '.png'
+
+    '''
+    Scaled pixmap of an image, decoded on the first request
+        path: source image
+        size: displayed size (QSize)
+        pixel_ratio: device pixel ratio of the widget showing the image
+    '''
+    def pixmap(self, path, size, pixel_ratio=1.0):
+        device_size = self.device_size(size, pixel_ratio)
+        key = cache_key(path, device_size, pixel_ratio)
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            if not os.path.isfile(path):
+                return QPixmap()
+            image = read_scaled(path, device_size, self.thumbnail_dir)
+            image.setDevicePixelRatio(pixel_ratio)
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def icon(self, path, size, pixel_ratio=1.0):
+        pixmap = self.pixmap(path, size, pixel_ratio)
+        return QIcon() if pixmap.isNull() else QIcon(pixmap)
+
+    def headshot(self, year, driver_number, size, pixel_ratio=1.0):
+        return self.icon(self.headshot_path(year, driver_number), size, pixel_ratio)
+
+    def tyre(self, compound, size, pixel_ratio=1.0):
+        return self.icon(self.tyre_path(compound), size, pixel_ratio)
+
+    '''
+    Decoding the headshots of the given drivers & every tyre compound in the background
+        year: season of the headshots
+        driver_numbers: drivers of the loaded session
+        headshot_size, tyre_size: displayed sizes (QSize)
+    '''
+    def warm(self, year, driver_numbers, headshot_size, tyre_size, pixel_ratio=1.0):
+        headshot_size = self.device_size(headshot_size, pixel_ratio)
+        tyre_size = self.device_size(tyre_size, pixel_ratio)
+
+        headshots = [self.headshot_path(year, number) for number in driver_numbers]
+        tyres = [self.tyre_path(compound) for compound in ['SOFT', 'MEDIUM', 'HARD', 'INTERMEDIATE', 'WET']]
+        for paths, size in [(headshots, headshot_size), (tyres, tyre_size)]:
+            paths = [path for path in paths if QPixmapCache.find(cache_key(path, size, pixel_ratio)) is None]
+            if len(paths) == 0:
+                continue
+
+            worker = ImageWarmWorker(paths, size, pixel_ratio, self.thumbnail_dir)
+            worker.signals.decoded.connect(self.on_decoded)
+            self.pool.start(worker)
+
+    def on_decoded(self, key, image):
+        if QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
@@ -0,0 +1,260 @@
+''' MOCK DATA SERVER LIBRARIES'''
+# Local stand-in for the FastF1 data backends [livetiming, Ergast, the schedule backends]
+# Responses are recorded once from the real backends, then replayed with a configurable latency & bandwidth,
+# so session loads can be measured end to end without the network
+# Run from the repository root:
+#     python mock_server.py record --year 2023 --event Monza --session Q     record the responses of a session load
+#     python mock_server.py serve --latency 80 --bandwidth 4                 replay them on http://127.0.0.1:8765
+#     python app.py --data-server=http://127.0.0.1:8765                      run the app against the replay
+
+# Miscellanous Functionality
+import argparse
+from contextlib import contextmanager
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+# HTTP Requests [every FastF1 backend request goes through a requests adapter]
+from requests.adapters import HTTPAdapter
+
+RECORDINGS_DIR = 'recordings'
+DEFAULT_PORT = 8765
+
+# Response headers that no longer apply to the stored, decoded body
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+# Identifies a recorded request
+def request_key(method, url):
+    return hashlib.sha1((method.upper() + ' ' + url).encode('utf-8')).hexdigest()
+
+'''
+Directory of recorded responses: one file per response body & an index of the requests
+    directory: location of the recordings
+'''
+class Recordings:
+    def __init__(self, directory=RECORDINGS_DIR):
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.index = {}
+        try:
+            with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as file:
+                self.index = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+    def __len__(self):
+        return len(self.index)
+
+    def store(self, method, url, status, headers, body):
+        key = request_key(method, url)
+        headers = {name: value for name, value in headers.items() if name.lower() not in DROPPED_HEADERS}
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, key + '.bin'), 'wb') as file:
+                file.write(body)
+            self.index[key] = {'method': method.upper(), 'url': url, 'status': status, 'headers': headers, 'size': len(body)}
+            with open(os.path.join(self.directory, 'index.json'), 'w', encoding='utf-8') as file:
+                json.dump(self.index, file, indent=1)
+
+    # The recorded (status, headers, body) of a request [None if it was not recorded]
+    def find(self, method, url):
+        key = request_key(method, url)
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, key + '.bin'), 'rb') as file:
+            return entry['status'], entry['headers'], file.read()
+
+'''
+Local URL of a backend URL on the replay server, e.g.
+https://livetiming.formula1.com/static/2023/... -> http://127.0.0.1:8765/livetiming.formula1.com/static/2023/...
+'''
+def local_url(server_url, url):
+    parts = urlsplit(url)
+    return server_url.rstrip('/') + '/' + parts.netloc + parts.path + ('?' + parts.query if parts.query else '')
+
+# Backend URL of a path requested from the replay server [the inverse of local_url]
+def backend_url(path):
+    return 'https://' + path.lstrip('/')
+
+'''
+Replays the recorded responses over HTTP
+    recordings: Recordings
+    latency: delay before every response (s)
+    bandwidth: transfer rate of the response bodies (bytes/s) [None for unlimited]
+'''
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, recordings, latency=0.0, bandwidth=None, port=DEFAULT_PORT):
+        super().__init__(('127.0.0.1', port), ReplayHandler)
+        self.recordings = recordings
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.misses = []
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:' + str(self.server_address[1])
+
+    # Serving on a daemon thread, for harnesses running in the same process
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='ReplayServer', daemon=True)
+        thread.start()
+        return thread
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    # Size of the chunks a throttled body is written in (bytes)
+    CHUNK = 16 * 1024
+
+    def do_GET(self):
+        self.replay('GET')
+
+    def do_POST(self):
+        self.replay('POST')
+
+    def replay(self, method):
+        url = backend_url(self.path)
+        recorded = self.server.recordings.find(method, url)
+        time.sleep(self.server.latency)
+
+        if recorded is None:
+            self.server.misses.append(url)
+            self.send_error(404, 'Not recorded: ' + url)
+            return
+
+        status, headers, body = recorded
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if self.server.bandwidth is None:
+            self.wfile.write(body)
+            return
+
+        # Writing the body at the configured rate
+        start = time.perf_counter()
+        for offset in range(0, len(body), self.CHUNK):
+            chunk = body[offset:offset + self.CHUNK]
+            self.wfile.write(chunk)
+            delay = (offset + len(chunk)) / self.server.bandwidth - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+    def log_message(self, format, *args):
+        pass
+
+'''
+Sending every HTTPS request of the process to the replay server instead of the backends
+[Patches the requests adapter, below FastF1's HTTP cache, so cache keys & cold/warm cache behaviour are unchanged]
+    server_url: URL of the replay server
+'''
+@contextmanager
+def redirect(server_url):
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        if request.url.startswith('https://'):
+            request = request.copy()
+            request.url = local_url(server_url, request.url)
+        return original_send(adapter, request, **kwargs)
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+# Redirect installed for the rest of the process [kept referenced, as a collected redirect restores the adapter]
+installed = None
+
+# Redirecting the requests of the app for the rest of the process [see redirect]
+def install(server_url):
+    global installed
+    installed = redirect(server_url)
+    installed.__enter__()
+    print('Data server: ' + server_url)
+
+'''
+Storing every HTTPS response the process receives from the real backends
+    recordings: Recordings to store the responses in
+'''
+@contextmanager
+def record(recordings):
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, **kwargs):
+        response = original_send(adapter, request, **kwargs)
+        if request.url.startswith('https://'):
+            recordings.store(request.method, request.url, response.status_code, dict(response.headers), response.content)
+        return response
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+'''
+Recording the responses of a session load as the app performs it
+[The FastF1 cache is disabled, so every request reaches the backends & is recorded]
+'''
+def record_session(year, event, session_name, recordings):
+    import fastf1 as ff1
+    import session_data
+
+    with record(recordings), ff1.Cache.disabled():
+        ff1.get_event_schedule(year, include_testing=False)
+        loaded = session_data.load_session(year, event, session_name)
+        session_data.load_weather(loaded.session)
+        loaded.session.results
+    return len(recordings)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Record & replay the FastF1 data backends locally.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='record the responses of a session load from the real backends')
+    record_parser.add_argument('--year', type=int, required=True)
+    record_parser.add_argument('--event', required=True)
+    record_parser.add_argument('--session', required=True)
+    record_parser.add_argument('--recordings', default=RECORDINGS_DIR)
+
+    serve_parser = commands.add_parser('serve', help='replay the recorded responses')
+    serve_parser.add_argument('--recordings', default=RECORDINGS_DIR)
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='delay before every response (ms)')
+    serve_parser.add_argument('--bandwidth', type=float, default=0.0, help='transfer rate (MB/s) [0 for unlimited]')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    recordings = Recordings(args.recordings)
+
+    if args.command == 'record':
+        count = record_session(args.year, args.event, args.session, recordings)
+        print('Recorded ' + str(count) + ' responses in ' + args.recordings)
+        return 0
+
+    bandwidth = args.bandwidth * 1024**2 if args.bandwidth > 0 else None
+    server = ReplayServer(recordings, args.latency / 1000, bandwidth, args.port)
+    print('Replaying ' + str(len(recordings)) + ' responses on ' + server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if server.misses:
+            print(str(len(server.misses)) + ' request(s) were not recorded, e.g. ' + server.misses[0])
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+''' RACE PACE LIBRARIES'''
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Lap time gained per lap of fuel burnt (s) [~1.6 kg of fuel per lap at ~0.035 s/kg]
+FUEL_CORRECTION = 0.055
+
+# Laps slower than this fraction of the fastest lap are not representative of the pace [the 107% rule]
+QUICKLAP_THRESHOLD = 1.07
+
+# Fewest representative laps a stint needs for its pace & degradation to be fitted
+MIN_STINT_LAPS = 3
+
+'''
+Reducing the laps table to the representative laps of every driver, with fuel-corrected lap times
+[Laps out of & into the pits, lap 1, laps not run under green flag & laps slower than the
+ 107% threshold are left out, all through vectorized masks]
+    laps: session.laps
+    fuel_correction: lap time gained per lap of fuel burnt (s)
+Returns a DataFrame with one row per representative lap:
+    DriverNumber, Driver, Team, LapNumber, Stint, Compound, TyreLife, LapTime (s),
+    FuelCorrected (s) [lap time with the weight of the fuel still on board removed]
+'''
+def representative_laps(laps, fuel_correction=FUEL_CORRECTION):
+    frame = pd.DataFrame({
+        'DriverNumber': laps['DriverNumber'].astype(str).to_numpy(),
+        'Driver': laps['Driver'].to_numpy(),
+        'Team': laps['Team'].to_numpy(),
+        'LapNumber': laps['LapNumber'].to_numpy(dtype=np.float64),
+        'Stint': laps['Stint'].to_numpy(dtype=np.float64),
+        'Compound': laps['Compound'].fillna('UNKNOWN').astype(str).to_numpy(),
+        'TyreLife': laps['TyreLife'].to_numpy(dtype=np.float64),
+        'LapTime': laps['LapTime'].dt.total_seconds().to_numpy(),
+    })
+
+    track_status = laps['TrackStatus'].fillna('').astype(str)
+    green = track_status.str.fullmatch('1+').to_numpy()
+    clean = (laps['PitInTime'].isna() & laps['PitOutTime'].isna()).to_numpy()
+    deleted = laps['Deleted'].fillna(False).to_numpy(dtype=bool) if 'Deleted' in laps else np.zeros(len(frame), dtype=bool)
+
+    mask = (np.isfinite(frame['LapTime'].to_numpy()) & np.isfinite(frame['Stint'].to_numpy())
+            & (frame['LapNumber'].to_numpy() > 1) & green & clean & ~deleted)
+    frame = frame[mask]
+    if frame.empty:
+        return frame.assign(FuelCorrected=pd.Series(dtype=np.float64))
+
+    frame = frame[frame['LapTime'] <= frame['LapTime'].min() * QUICKLAP_THRESHOLD]
+
+    # Removing the weight of the fuel still on board; the race distance is the last lap anyone completed
+    total_laps = laps['LapNumber'].max()
+    frame = frame.assign(FuelCorrected=frame['LapTime'] - fuel_correction * (total_laps - frame['LapNumber']))
+
+    # Tyre age is unknown on some laps; counting from the start of the stint keeps the fit usable
+    stint_start = frame.groupby(['DriverNumber', 'Stint'])['LapNumber'].transform('min')
+    tyre_life = frame['TyreLife'].fillna(frame['LapNumber'] - stint_start + 1)
+    return frame.assign(TyreLife=tyre_life).reset_index(drop=True)
+
+'''
+Fitting the pace & degradation of every stint of every driver at once
+[Least-squares lines of fuel-corrected lap time against tyre age, from grouped sums rather than a fit per stint]
+    representative: output of representative_laps
+Returns a DataFrame with one row per stint:
+    DriverNumber, Driver, Team, Stint, Compound, FirstLap, LastLap, Laps,
+    Pace (s) [fuel-corrected lap time on the tyre age the stint started on],
+    Degradation (s/lap) [lap time lost per lap of tyre age], Median (s)
+'''
+def stint_pace(representative):
+    frame = representative.assign(
+        XY=representative['TyreLife'] * representative['FuelCorrected'],
+        XX=representative['TyreLife'] ** 2,
+    )
+    grouped = frame.groupby(['DriverNumber', 'Stint'], sort=False)
+    stints = grouped.agg(
+        Driver=('Driver', 'first'), Team=('Team', 'first'), Compound=('Compound', 'first'),
+        FirstLap=('LapNumber', 'min'), LastLap=('LapNumber', 'max'), Laps=('LapNumber', 'size'),
+        StartAge=('TyreLife', 'min'), SumX=('TyreLife', 'sum'), SumY=('FuelCorrected', 'sum'),
+        SumXY=('XY', 'sum'), SumXX=('XX', 'sum'), Median=('FuelCorrected', 'median'),
+    ).reset_index()
+    stints = stints[stints['Laps'] >= MIN_STINT_LAPS]
+
+    n = stints['Laps'].to_numpy(dtype=np.float64)
+    mean_x = stints['SumX'].to_numpy() / n
+    mean_y = stints['SumY'].to_numpy() / n
+    variance = stints['SumXX'].to_numpy() / n - mean_x ** 2
+    covariance = stints['SumXY'].to_numpy() / n - mean_x * mean_y
+
+    # Stints run on a single tyre age (e.g. laps without tyre data) get no degradation
+    slope = np.divide(covariance, variance, out=np.zeros_like(variance), where=variance > 1e-9)
+    pace = mean_y - slope * (mean_x - stints['StartAge'].to_numpy())
+
+    columns = ['DriverNumber', 'Driver', 'Team', 'Stint', 'Compound', 'FirstLap', 'LastLap', 'Laps']
+    return stints[columns].assign(Pace=pace, Degradation=slope, Median=stints['Median'].to_numpy()).reset_index(drop=True)
+
+'''
+Median fuel-corrected lap time of every driver on every compound, & of the whole field per compound
+    representative: output of representative_laps
+'''
+def compound_medians(representative):
+    drivers = representative.groupby(['DriverNumber', 'Driver', 'Compound'], sort=False)['FuelCorrected'].median().reset_index()
+    field = representative.groupby('Compound', sort=False)['FuelCorrected'].agg(['median', 'size']).reset_index()
+    return drivers, field.rename(columns={'median': 'Median', 'size': 'Laps'})
+
+'''
+Complete race pace analysis of a session
+    laps: session.laps
+Returns a dict of:
+    laps: representative laps, stints: stint pace & degradation,
+    driver_compounds / field_compounds: compound medians,
+    order: driver numbers ordered by their median fuel-corrected pace
+'''
+def analyse(laps, fuel_correction=FUEL_CORRECTION):
+    representative = representative_laps(laps, fuel_correction)
+    stints = stint_pace(representative)
+    driver_compounds, field_compounds = compound_medians(representative)
+    order = representative.groupby('DriverNumber')['FuelCorrected'].median().sort_values().index.tolist()
+    return {
+        'laps': representative, 'stints': stints, 'driver_compounds': driver_compounds,
+        'field_compounds': field_compounds, 'order': order,
+    }
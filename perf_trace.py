@@ -0,0 +1,153 @@
+''' PERFORMANCE TRACE LIBRARIES'''
+# Miscellanous Functionality
+from collections import deque
+from contextlib import contextmanager
+import functools
+import json
+import os
+import threading
+import time
+
+# Process memory is read through psutil where installed, from /proc otherwise
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+'''
+Resident memory of the app process (bytes)
+[None where neither psutil nor /proc is available]
+'''
+def process_memory():
+    if psutil is not None:
+        return psutil.Process(os.getpid()).memory_info().rss
+    try:
+        with open('/proc/self/statm', 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+'''
+Records the duration & memory change of the app's stages, from any thread
+[Disabled by default; a disabled recorder only runs the stages. Spans are kept as Chrome trace events,
+ so a recording can be opened in chrome://tracing or Perfetto, & aggregated per stage for the settings page]
+    max_events: number of trace events kept [the oldest are dropped first]
+'''
+class PerfRecorder:
+    def __init__(self, max_events=200000):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=max_events)
+        self.lock = threading.Lock()
+
+        # stage name: [calls, total (s), last (s), max (s), last memory change (bytes)]
+        self.stages = {}
+        self.threads = {}
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def reset(self):
+        with self.lock:
+            self.events.clear()
+            self.stages.clear()
+            self.threads.clear()
+
+    # Microseconds since the recorder was created, the time base of the trace events
+    def timestamp(self, moment):
+        return (moment - self.origin) * 10**6
+
+    '''
+    Timing the enclosed stage & the change of the process memory over it
+        name: stage name, e.g. driver_comparison.plot_tel
+        category: groups the stages in the trace, e.g. ui, load, export
+    '''
+    @contextmanager
+    def span(self, name, category='ui'):
+        if not self.enabled:
+            yield
+            return
+
+        memory_start = process_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            memory_end = process_memory()
+            memory_change = memory_end - memory_start if memory_start is not None and memory_end is not None else None
+            self.record(name, category, start, end, memory_end, memory_change)
+
+    def record(self, name, category, start, end, memory, memory_change):
+        thread = threading.current_thread()
+        duration = end - start
+        args = {}
+        if memory is not None:
+            args = {'rss_mb': round(memory / 1024**2, 1), 'rss_change_kb': round(memory_change / 1024, 1)}
+
+        with self.lock:
+            if thread.ident not in self.threads:
+                self.threads[thread.ident] = thread.name
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': thread.ident,
+                                    'args': {'name': thread.name}})
+
+            self.events.append({'name': name, 'cat': category, 'ph': 'X', 'ts': self.timestamp(start), 'dur': duration * 10**6,
+                                'pid': os.getpid(), 'tid': thread.ident, 'args': args})
+            if memory is not None:
+                self.events.append({'name': 'Process memory', 'ph': 'C', 'ts': self.timestamp(end), 'pid': os.getpid(),
+                                    'args': {'rss_mb': args['rss_mb']}})
+
+            stage = self.stages.setdefault(name, [0, 0.0, 0.0, 0.0, None])
+            stage[0] = stage[0] + 1
+            stage[1] = stage[1] + duration
+            stage[2] = duration
+            stage[3] = max(stage[3], duration)
+            stage[4] = memory_change
+
+    '''
+    Timings of every recorded stage, slowest last call first
+    Returns a list of (stage, calls, last (ms), mean (ms), max (ms), last memory change (bytes or None))
+    '''
+    def summary(self):
+        with self.lock:
+            rows = [(name, calls, last * 1000, total / calls * 1000, longest * 1000, memory_change)
+                    for name, (calls, total, last, longest, memory_change) in self.stages.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    # Writing the recorded events as a Chrome trace-format JSON file
+    def write_chrome_trace(self, path):
+        with self.lock:
+            events = list(self.events)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+        return len(events)
+
+# The recorder shared by every instrumented stage of the app
+recorder = PerfRecorder()
+
+'''
+Decorator timing every call of a function as a stage of the shared recorder
+[Only for functions called with their exact arguments; Qt slots receiving extra signal arguments use recorder.span]
+    name: stage name shown in the panel & the trace
+'''
+def timed(name, category='ui'):
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not recorder.enabled:
+                return function(*args, **kwargs)
+            with recorder.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+# Formatting a number of bytes for display, e.g. 1.2 GB
+def format_bytes(size):
+    if size is None:
+        return '-'
+    for unit in ['B', 'KB', 'MB']:
+        if abs(size) < 1024:
+            return format(size, '.0f' if unit == 'B' else '.1f') + ' ' + unit
+        size = size / 1024
+    return format(size, '.2f') + ' GB'
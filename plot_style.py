@@ -0,0 +1,72 @@
+''' PLOT STYLE LIBRARIES'''
+# FastF1 plotting pulls in matplotlib, so it is only imported on the first color lookup
+import importlib
+
+# PyQtGraph
+import pyqtgraph as pg
+
+plotting = None
+
+# (color, width, style): QPen shared by every curve drawn with it
+pens = {}
+
+# Tyre compound colors [same as FastF1's, without importing its plotting module]
+COMPOUND_COLORS = {
+    'SOFT': '#da291c', 'MEDIUM': '#ffd12e', 'HARD': '#f0f0ec',
+    'INTERMEDIATE': '#43b02a', 'WET': '#0067ad', 'UNKNOWN': '#00ffff',
+}
+
+'''
+Importing FastF1 plotting on first use & applying the app's driver/team color modifications
+'''
+def get_plotting():
+    global plotting
+    if plotting is None:
+        ff1_plotting = importlib.import_module('fastf1.plotting')
+
+        # FastF1 Plotting Global Modifications
+        ff1_plotting.DRIVER_COLORS['max verstappen'] = '#734fff'
+        ff1_plotting.DRIVER_COLORS['lewis hamilton'] = '#eef12e'
+        ff1_plotting.DRIVER_COLORS['sergio perez'] = '#1017df'
+        ff1_plotting.TEAM_COLORS['red bull'] = '#734fff'
+        ff1_plotting.DRIVER_COLORS['alexander albon'] = '#49BBFF'
+        ff1_plotting.DRIVER_COLORS['logan sargeant'] = '#008BFE'
+        ff1_plotting.TEAM_COLORS['williams'] = '#49BBFF'
+
+        plotting = ff1_plotting
+    return plotting
+
+def driver_color(identifier):
+    return get_plotting().driver_color(identifier)
+
+def team_color(identifier):
+    return get_plotting().team_color(identifier)
+
+def compound_color(compound):
+    return COMPOUND_COLORS.get(str(compound).upper(), COMPOUND_COLORS['UNKNOWN'])
+
+'''
+Color of a driver in the given season
+[Driver colors are only told apart from 2024 onwards; earlier seasons & unknown drivers use the team color]
+'''
+def session_driver_color(year, driver, team):
+    if year == 2024:
+        try:
+            return driver_color(driver)
+        except (KeyError, ValueError):
+            pass
+    return team_color(team)
+
+'''
+Shared pen of the given color & width, created once instead of once per curve
+[pens are shared between items, so they must not be modified after creation]
+'''
+def pen(color, width=2.5, style=None):
+    key = (color, width, style)
+    if key not in pens:
+        if style is None:
+            pens[key] = pg.mkPen(color, width=width)
+        else:
+            pens[key] = pg.mkPen(color, width=width, style=style)
+    return pens[key]
+
@@ -0,0 +1,172 @@
+''' PREFETCH LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+from collections import namedtuple
+import threading
+import time
+import warnings
+
+# FastF1 API
+import fastf1 as ff1
+
+# FastF1's API requests share the cache with Session.load, so a session fetched request by request
+# is later loaded from the cache [fastf1.api warns about becoming private in newer releases]
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    from fastf1 import api as ff1_api
+
+# Serializing FastF1 loads with the interactive session loader
+from session_data import FASTF1_LOCK
+
+# Sessions of a weekend worth fetching ahead of time, most likely first
+PREFETCH_SESSIONS = ['Qualifying', 'Race']
+
+# API requests making up a full session load, in the order Session.load makes them
+API_STEPS = [
+    ff1_api.session_info, ff1_api.driver_info, ff1_api.session_status_data, ff1_api.lap_count,
+    ff1_api.track_status_data, ff1_api.timing_data, ff1_api.timing_app_data, ff1_api.car_data,
+    ff1_api.position_data, ff1_api.weather_data, ff1_api.race_control_messages,
+]
+
+'''
+Limits on the background prefetch
+    max_sessions: sessions fetched per request [0 disables prefetching]
+    pause: seconds waited after every API request [throttles the bandwidth & CPU taken from the app]
+    max_seconds: time after which a request gives up on the sessions left
+'''
+PrefetchBudget = namedtuple('PrefetchBudget', ['max_sessions', 'pause', 'max_seconds'])
+
+'''
+Sessions the user is most likely to open next, as (year, event name, session name)
+[Qualifying & Race of the selected event, then those of the latest weekend of the current season]
+    schedule_cache: ScheduleCache of the app [only sessions that have taken place are listed]
+    year, event_name: selected season & Grand-Prix [event_name may be None]
+    current_year: season of the latest weekend
+'''
+def likely_sessions(schedule_cache, year, event_name, current_year):
+    events = []
+    if event_name:
+        events.append((year, event_name))
+    latest_events = schedule_cache.events(current_year)
+    if latest_events:
+        events.append((current_year, latest_events[-1]))
+
+    sessions = []
+    for event_year, event in events:
+        held = schedule_cache.sessions(event_year, event)
+        for name in PREFETCH_SESSIONS:
+            if name in held and (event_year, event, name) not in sessions:
+                sessions.append((event_year, event, name))
+    return sessions
+
+class PrefetchSignals(QObject):
+    fetched = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object, str)
+
+'''
+Fetching & parsing sessions into the FastF1 cache on a low priority QThreadPool thread
+[Sessions are fetched one API request at a time, holding the FastF1 lock only per request,
+ so an interactive load waits for at most one request]
+    generation: id of the request
+    sessions: list of (year, event name, session name)
+    budget: PrefetchBudget
+    stop: threading.Event set when the request is cancelled
+'''
+class PrefetchWorker(QRunnable):
+    def __init__(self, generation, sessions, budget, stop):
+        super().__init__()
+        self.generation = generation
+        self.sessions = sessions
+        self.budget = budget
+        self.stop = stop
+        self.signals = PrefetchSignals()
+
+    def run(self):
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+        deadline = time.monotonic() + self.budget.max_seconds
+
+        for key in self.sessions:
+            try:
+                with FASTF1_LOCK:
+                    session = ff1.get_session(*key)
+
+                for step in API_STEPS:
+                    if self.stop.is_set() or time.monotonic() > deadline:
+                        return
+                    with FASTF1_LOCK:
+                        try:
+                            step(session.api_path)
+                        except Exception:
+                            # Not every request is available for every session, as in Session.load
+                            pass
+
+                    # Waiting out the pause, waking up right away when cancelled
+                    if self.stop.wait(self.budget.pause):
+                        return
+
+                self.signals.fetched.emit(self.generation, key)
+            except Exception as error:
+                self.signals.failed.emit(self.generation, key, str(error))
+
+'''
+Fetches the sessions the user is likely to open next into the FastF1 cache in the background
+[Only one request runs at a time; a new request or an interactive load stops the running one]
+    budget: PrefetchBudget
+'''
+class SessionPrefetcher(QObject):
+    fetched = pyqtSignal(object)
+
+    def __init__(self, budget=PrefetchBudget(4, 1.0, 600.0), parent=None):
+        super().__init__(parent)
+        self.budget = budget
+
+        # (year, event name, session name) of every session already fetched
+        self.prefetched = set()
+
+        self.generation = 0
+        self.stop = threading.Event()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def set_budget(self, max_sessions=None, pause=None):
+        self.budget = self.budget._replace(
+            max_sessions=self.budget.max_sessions if max_sessions is None else max_sessions,
+            pause=self.budget.pause if pause is None else pause,
+        )
+
+    '''
+    Fetching the given sessions, skipping those already fetched
+        sessions: list of (year, event name, session name), most likely first
+        exclude: sessions loaded interactively [already in the cache]
+    '''
+    def request(self, sessions, exclude=()):
+        self.cancel()
+
+        sessions = [key for key in sessions if key not in self.prefetched and key not in exclude]
+        sessions = sessions[:self.budget.max_sessions]
+        if len(sessions) == 0:
+            return
+
+        worker = PrefetchWorker(self.generation, sessions, self.budget, self.stop)
+        worker.signals.fetched.connect(self.on_fetched)
+        worker.signals.failed.connect(self.on_failed)
+        self.pool.start(worker)
+
+    # Stopping the running request after its current API request & dropping any queued one
+    def cancel(self):
+        self.generation = self.generation + 1
+        self.stop.set()
+        self.stop = threading.Event()
+        self.pool.clear()
+
+    def is_prefetching(self):
+        return self.pool.activeThreadCount() > 0
+
+    def on_fetched(self, generation, key):
+        self.prefetched.add(key)
+        self.fetched.emit(key)
+
+    def on_failed(self, generation, key, message):
+        print('Failed to prefetch ' + ' '.join(str(part) for part in key) + ': ' + message)
@@ -0,0 +1,194 @@
+''' UI LIBRARIES'''
+# PyQt5
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import PyQt5.uic as uic
+
+# Plotting Libraries
+import pyqtgraph as pg
+import plot_style
+
+# Data Analysis Libraries
+import numpy as np
+
+# Stint Pace & Degradation Engine
+import pace
+
+# Miscellanous Functionality
+import time
+
+class PaceSignals(QObject):
+    analysed = pyqtSignal(int, object, float)
+    failed = pyqtSignal(int, str)
+
+'''
+Runs the race pace analysis of a session on a QThreadPool thread
+    generation: identifies the request, so results of a replaced session can be dropped
+    laps: session.laps [only read]
+'''
+class PaceWorker(QRunnable):
+    def __init__(self, generation, laps):
+        super().__init__()
+        self.generation = generation
+        self.laps = laps
+        self.signals = PaceSignals()
+
+    def run(self):
+        try:
+            start = time.perf_counter()
+            result = pace.analyse(self.laps)
+            self.signals.analysed.emit(self.generation, result, time.perf_counter() - start)
+        except Exception as error:
+            self.signals.failed.emit(self.generation, str(error))
+
+class UI_pace(QWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        uic.loadUi('race_pace_page.ui', self)
+
+        self.generation = 0
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.set_plot_displays()
+
+    # Setting the race pace plot displays
+    def set_plot_displays(self):
+        self.long_run_p_legend = self.long_run_p.addLegend()
+        self.long_run_p.setLabel('left', 'Fuel Corrected Lap Time', units ='s')
+        self.long_run_p.setLabel('bottom', 'Lap')
+
+        self.stint_pace_p.setLabel('left', 'Stint Pace', units ='s')
+        self.degradation_p.setLabel('left', 'Degradation', units ='s/lap')
+        self.compound_p.setLabel('left', 'Median Lap Time', units ='s')
+
+        for plot in [self.long_run_p, self.stint_pace_p, self.degradation_p, self.compound_p]:
+            plot.showGrid(x=False, y=True, alpha=0.2)
+
+    def clear(self):
+        self.generation += 1
+        for plot in [self.long_run_p, self.stint_pace_p, self.degradation_p, self.compound_p]:
+            plot.clear()
+        self.pace_status.setText('Load a session to analyse the race pace')
+
+    '''
+    Analysing the race pace of a newly loaded session in the background
+        current_session: loaded FastF1 session
+    '''
+    def receive_session(self, current_session):
+        self.clear()
+        self.current_session = current_session
+        self.pace_status.setText('Analysing the race pace...')
+
+        worker = PaceWorker(self.generation, current_session.laps)
+        worker.signals.analysed.connect(self.analysed)
+        worker.signals.failed.connect(self.failed)
+        self.pool.start(worker)
+
+    def failed(self, generation, message):
+        if generation == self.generation:
+            self.pace_status.setText('Race pace analysis failed: ' + message)
+
+    def analysed(self, generation, result, duration):
+        # Ignoring the analysis of a session that was replaced in the meantime
+        if generation != self.generation:
+            return
+
+        if result['laps'].empty:
+            self.pace_status.setText('No representative laps in this session')
+            return
+
+        render_start = time.perf_counter()
+        self.plot_long_runs(result)
+        self.plot_stints(result)
+        self.plot_compounds(result)
+        render_time = time.perf_counter() - render_start
+
+        self.pace_status.setText(str(len(result['laps'])) + ' laps  |  ' + str(len(result['stints'])) + ' stints  |  ' +
+                                 'analysed in ' + format(duration * 1000, '.0f') + ' ms, drawn in ' +
+                                 format(render_time * 1000, '.0f') + ' ms')
+
+    # Color of every driver of the analysis
+    def driver_colors(self, laps):
+        year = self.current_session.date.year
+        drivers = laps.drop_duplicates('DriverNumber').set_index('DriverNumber')
+        return {number: plot_style.session_driver_color(year, row['Driver'], row['Team']) for number, row in drivers.iterrows()}
+
+    # Driver abbreviations in the order of their pace, used as the x-axis ticks of the stint plots
+    def driver_ticks(self, result):
+        abbreviations = result['laps'].drop_duplicates('DriverNumber').set_index('DriverNumber')['Driver']
+        return [(i, abbreviations[number]) for i, number in enumerate(result['order'])]
+
+    '''
+    Plotting the fuel corrected lap time of every representative lap, one curve per driver
+    [stints are separated by NaN, so each driver is a single item]
+    '''
+    def plot_long_runs(self, result):
+        laps = result['laps'].sort_values(['DriverNumber', 'LapNumber'])
+        colors = self.driver_colors(laps)
+
+        for number, driver_laps in laps.groupby('DriverNumber', sort=False):
+            lap_numbers = driver_laps['LapNumber'].to_numpy()
+            lap_times = driver_laps['FuelCorrected'].to_numpy()
+
+            # Breaking the line between stints & over laps that were left out
+            breaks = np.flatnonzero((np.diff(driver_laps['Stint'].to_numpy()) != 0) | (np.diff(lap_numbers) > 1)) + 1
+            lap_numbers = np.insert(lap_numbers, breaks, np.nan)
+            lap_times = np.insert(lap_times, breaks, np.nan)
+
+            color = colors[number]
+            self.long_run_p.plot(lap_numbers, lap_times, pen = plot_style.pen(color, width= 1.5), connect = 'finite',
+                                 symbol = 'o', symbolSize = 4, symbolPen = None, symbolBrush = color,
+                                 name = driver_laps['Driver'].iat[0])
+
+    '''
+    Plotting the pace & degradation of every stint, colored by compound
+    [a single scatter item per plot; the drivers are ordered by their median pace]
+    '''
+    def plot_stints(self, result):
+        stints = result['stints']
+        if stints.empty:
+            return
+
+        # Spreading the stints of a driver around their position on the x-axis
+        position = {number: i for i, number in enumerate(result['order'])}
+        x = stints['DriverNumber'].map(position).to_numpy(dtype=np.float64)
+        stint_index = stints.groupby('DriverNumber').cumcount().to_numpy()
+        stint_count = stints.groupby('DriverNumber')['Stint'].transform('size').to_numpy()
+        x = x + (stint_index - (stint_count - 1) / 2) * 0.2
+
+        brushes = [pg.mkBrush(plot_style.compound_color(compound)) for compound in stints['Compound']]
+        sizes = 6 + np.sqrt(stints['Laps'].to_numpy(dtype=np.float64)) * 2
+        ticks = [self.driver_ticks(result)]
+
+        for plot, column in [(self.stint_pace_p, 'Pace'), (self.degradation_p, 'Degradation')]:
+            scatter = pg.ScatterPlotItem(x = x, y = stints[column].to_numpy(), size = sizes, brush = brushes, pen = None)
+            plot.addItem(scatter)
+            plot.getAxis('bottom').setTicks(ticks)
+        self.degradation_p.addLine(y = 0, pen = plot_style.pen('grey', width= 1))
+
+    # Plotting the field median of every compound as bars, with the median of every driver on top
+    def plot_compounds(self, result):
+        field = result['field_compounds']
+        drivers = result['driver_compounds']
+        if field.empty:
+            return
+
+        compounds = field.sort_values('Median')['Compound'].tolist()
+        position = {compound: i for i, compound in enumerate(compounds)}
+        medians = field.set_index('Compound').loc[compounds, 'Median'].to_numpy()
+        base = min(medians.min(), drivers['FuelCorrected'].min()) - 0.5
+
+        bars = pg.BarGraphItem(x = np.arange(len(compounds)), y0 = base, y1 = medians, width = 0.6,
+                               brushes = [pg.mkBrush(plot_style.compound_color(compound) + '80') for compound in compounds],
+                               pens = [plot_style.pen(plot_style.compound_color(compound), width= 1) for compound in compounds])
+        self.compound_p.addItem(bars)
+
+        colors = self.driver_colors(result['laps'])
+        x = drivers['Compound'].map(position).to_numpy(dtype=np.float64)
+        x = x + (drivers.groupby('Compound').cumcount().to_numpy() / max(len(result['order']) - 1, 1) - 0.5) * 0.5
+        scatter = pg.ScatterPlotItem(x = x, y = drivers['FuelCorrected'].to_numpy(), size = 7, pen = None,
+                                     brush = [pg.mkBrush(colors[number]) for number in drivers['DriverNumber']])
+        self.compound_p.addItem(scatter)
+        self.compound_p.getAxis('bottom').setTicks([[(i, compound.title()) for i, compound in enumerate(compounds)]])
@@ -0,0 +1,226 @@
+''' SCHEDULE CACHE LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+import datetime
+import os
+import pickle
+
+# FastF1 API
+import fastf1 as ff1
+
+# Data Analysis Libraries
+import pandas as pd
+
+# Serializing FastF1 calls with every other background loader
+from session_data import FASTF1_LOCK
+
+SESSION_COLUMNS = ['Session' + str(i) for i in range(1, 6)]
+SESSION_DATE_COLUMNS = ['Session' + str(i) + 'DateUtc' for i in range(1, 6)]
+
+# Reducing an EventSchedule to the columns the app needs, as a plain DataFrame
+def compact_schedule(schedule):
+    columns = ['RoundNumber', 'EventName', 'Location'] + SESSION_COLUMNS + SESSION_DATE_COLUMNS
+    frame = pd.DataFrame(schedule)[columns].sort_values('RoundNumber').reset_index(drop=True)
+    for column in SESSION_DATE_COLUMNS:
+        frame[column] = pd.to_datetime(frame[column])
+    return frame
+
+class ScheduleFetchSignals(QObject):
+    fetched = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+'''
+Fetches the event schedules of the given seasons on a QThreadPool thread
+    years: seasons to fetch, in order
+    is_closing: callable returning whether the app is shutting down [the remaining seasons are skipped]
+'''
+class ScheduleFetchWorker(QRunnable):
+    def __init__(self, years, is_closing):
+        super().__init__()
+        self.years = years
+        self.is_closing = is_closing
+        self.signals = ScheduleFetchSignals()
+
+    def run(self):
+        for year in self.years:
+            if self.is_closing():
+                return
+            try:
+                with FASTF1_LOCK:
+                    schedule = ff1.get_event_schedule(year, include_testing=False)
+                self.signals.fetched.emit(year, compact_schedule(schedule))
+            except Exception as error:
+                self.signals.failed.emit(year, str(error))
+
+'''
+Event schedules of every season from 2018 onwards, kept in memory & stored as one local file
+[Seasons are prefetched in the background; the Grand-Prix & Session combo boxes are filled from
+ availability lists precomputed per season, so year & event switches never touch FastF1]
+    path: location of the stored schedules
+'''
+class ScheduleCache(QObject):
+    schedule_ready = pyqtSignal(int)
+    schedule_failed = pyqtSignal(int, str)
+
+    FIRST_SEASON = 2018
+
+    # Hours after the start of a session before it is listed [matches the delay in the original combo box logic]
+    SESSION_DELAY = pd.Timedelta(hours=5)
+
+    # Age after which the schedule of a season that was not yet over when fetched is fetched again
+    REFRESH_AGE = datetime.timedelta(days=1)
+
+    # Age after which the precomputed availability lists are recomputed
+    AVAILABILITY_AGE = datetime.timedelta(minutes=15)
+
+    def __init__(self, path='cache/event_schedules.pkl', parent=None):
+        super().__init__(parent)
+        self.path = path
+
+        # year: (fetch time [UTC], compact schedule)
+        self.schedules = {}
+        # year: (computation time [UTC], [event names], {event name: [session names]})
+        self.availability = {}
+        self.pending = set()
+        self.closing = False
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.read_file()
+
+    def read_file(self):
+        try:
+            with open(self.path, 'rb') as file:
+                self.schedules = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            self.schedules = {}
+
+    def write_file(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'wb') as file:
+                pickle.dump(self.schedules, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def now():
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+    # A season's schedule may still change if it was fetched before the season was over
+    def is_stale(self, year):
+        if year not in self.schedules:
+            return True
+        fetched, _ = self.schedules[year]
+        return fetched.year <= year and (self.now() - fetched) > self.REFRESH_AGE
+
+    def has(self, year):
+        return year in self.schedules
+
+    # Fetching every season from 2018 onwards that is missing or stale, latest season first
+    def prefetch(self):
+        years = [year for year in range(self.now().year, self.FIRST_SEASON - 1, -1)
+                 if self.is_stale(year) and year not in self.pending]
+        self.fetch(years)
+
+    '''
+    Requesting the schedule of a season
+    Returns True if it is available right away, otherwise it is fetched & schedule_ready is emitted
+    '''
+    def request(self, year):
+        if self.has(year):
+            if self.is_stale(year):
+                self.prefetch()
+            return True
+
+        if year not in self.pending:
+            self.fetch([year])
+        return False
+
+    def fetch(self, years):
+        if len(years) == 0:
+            return
+        self.pending.update(years)
+
+        worker = ScheduleFetchWorker(years, lambda: self.closing)
+        worker.signals.fetched.connect(self.on_fetched)
+        worker.signals.failed.connect(self.on_failed)
+        self.pool.start(worker)
+
+    '''
+    Stopping the background fetches before the app exits
+    [Waits for the season being fetched, as PyQt deletes the worker's signals at interpreter exit
+     & a fetch still running would then emit on a deleted object]
+    '''
+    def shutdown(self):
+        self.closing = True
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def on_fetched(self, year, schedule):
+        self.pending.discard(year)
+        self.schedules[year] = (self.now(), schedule)
+        self.availability.pop(year, None)
+        self.write_file()
+        self.schedule_ready.emit(year)
+
+    def on_failed(self, year, message):
+        self.pending.discard(year)
+        self.schedule_failed.emit(year, message)
+
+    # Compact schedule of a season [None if it is not fetched yet]
+    def schedule(self, year):
+        if not self.has(year):
+            return None
+        return self.schedules[year][1]
+
+    # Precomputing the Grand-Prix & Session lists of a season from the session start times
+    def compute_availability(self, year):
+        _, schedule = self.schedules[year]
+        cutoff = self.now() - self.SESSION_DELAY
+
+        # Listing a weekend once its first session has taken place
+        started = schedule[schedule['Session1DateUtc'] < cutoff]
+        events = started['EventName'].tolist()
+
+        # Listing every session of the listed weekends that has taken place
+        held = started[SESSION_DATE_COLUMNS].lt(cutoff).to_numpy()
+        names = started[SESSION_COLUMNS].to_numpy()
+        sessions = {}
+        for event, session_names, session_held in zip(events, names, held):
+            sessions[event] = [name for name, is_held in zip(session_names, session_held)
+                               if is_held and isinstance(name, str) and name]
+
+        self.availability[year] = (self.now(), events, sessions)
+
+    def get_availability(self, year):
+        if year not in self.availability or (self.now() - self.availability[year][0]) > self.AVAILABILITY_AGE:
+            self.compute_availability(year)
+        return self.availability[year]
+
+    # Grand-Prix weekends of the season that have started
+    def events(self, year):
+        if not self.has(year):
+            return []
+        return self.get_availability(year)[1]
+
+    # Sessions of the weekend that have taken place
+    def sessions(self, year, event_name):
+        if not self.has(year):
+            return []
+        return self.get_availability(year)[2].get(event_name, [])
+
+    # Compact schedule row of an event [None if the season or event is unknown]
+    def event_info(self, year, event_name):
+        if not self.has(year):
+            return None
+        _, schedule = self.schedules[year]
+        rows = schedule[schedule['EventName'] == event_name]
+        if rows.empty:
+            return None
+        return rows.iloc[0]
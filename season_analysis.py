@@ -0,0 +1,195 @@
+''' SEASON ANALYSIS LIBRARIES'''
+# Cross-event analysis of whole seasons without a GUI
+# [Every session is loaded in a worker process & reduced there to one row per driver; only these compact
+#  summaries travel back & are merged, so a season takes as long as the cores & the disk allow, not 24 serial loads]
+
+# Miscellanous Functionality
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import datetime
+import multiprocessing
+import os
+
+# FastF1 API
+import fastf1 as ff1
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Session Loading & Session Helpers
+import session_data
+from session_data import SESSION_DELAY, seconds
+from session_index import SessionIndex
+
+# First season with the timing data the analysis needs
+FIRST_SEASON = 2018
+
+# Columns of a session summary, one row per driver
+SUMMARY_COLUMNS = ['Year', 'Round', 'EventName', 'Session', 'DriverNumber', 'Abbreviation', 'TeamName', 'TeamColor',
+                   'Position', 'BestLap']
+
+'''
+A session of a season analysis
+    year, round, event: season, round number & event name
+    session: session name, e.g. Qualifying
+'''
+SeasonSession = namedtuple('SeasonSession', ['year', 'round', 'event', 'session'])
+
+# Short name of a session for progress & error messages, e.g. 2024 R8 Monaco Grand Prix
+def session_label(season_session):
+    return str(season_session.year) + ' R' + str(season_session.round) + ' ' + season_session.event
+
+'''
+The given session of every event of the seasons that has taken place, in calendar order
+[The lock is held per schedule fetch only, so the interactive loader is never blocked for more than one request]
+    years: seasons to analyse
+    session_name: session of every event, e.g. Qualifying
+'''
+def season_sessions(years, session_name):
+    cutoff = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - SESSION_DELAY
+
+    sessions = []
+    for year in years:
+        with session_data.FASTF1_LOCK:
+            schedule = ff1.get_event_schedule(year, include_testing=False)
+        for _, event in schedule.sort_values('RoundNumber').iterrows():
+            for i in range(1, 6):
+                date = event['Session' + str(i) + 'DateUtc']
+                if event['Session' + str(i)] == session_name and pd.notna(date) and date < cutoff:
+                    sessions.append(SeasonSession(year, int(event['RoundNumber']), event['EventName'], session_name))
+    return sessions
+
+'''
+Loading a session & reducing it to the best lap of every driver
+[Runs in a worker process; only the laps & race control messages are loaded, no telemetry or weather.
+ Best laps are picked as on the driver comparison page: the personal best hot lap in qualifying sessions]
+    season_session: SeasonSession
+Returns a DataFrame of SUMMARY_COLUMNS [BestLap in seconds, NaN for drivers without a timed lap]
+'''
+def session_summary(season_session):
+    session = ff1.get_session(season_session.year, season_session.round, season_session.session)
+    session.load(laps=True, telemetry=False, weather=False, messages=True)
+
+    session_index = SessionIndex(session)
+    hot_laps = session_data.is_qualifying(session)
+
+    rows = []
+    for driver in session.drivers:
+        best_lap = np.nan
+        lap_number = session_index.fastest_lap(driver, hot_laps)
+        if lap_number is not None:
+            best_lap = seconds(session.laps['LapTime'].iloc[session_index.lap_row(driver, lap_number)])
+
+        result = session.get_driver(driver)
+        rows.append((season_session.year, season_session.round, season_session.event, season_session.session, str(driver),
+                     result['Abbreviation'], result['TeamName'], result['TeamColor'], float(result['Position']), best_lap))
+    return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+
+# Merging the session summaries into one frame, in calendar & finishing order
+def merge_summaries(summaries):
+    if len(summaries) == 0:
+        return pd.DataFrame(columns=SUMMARY_COLUMNS)
+    return pd.concat(summaries, ignore_index=True).sort_values(['Year', 'Round', 'Position'], kind='mergesort').reset_index(drop=True)
+
+'''
+Summarizing the sessions in a pool of worker processes
+[Workers are spawned rather than forked, so they never inherit the app's Qt & loader threads]
+    sessions: list of SeasonSession
+    workers: number of worker processes
+    cache_dir: FastF1 cache directory shared by the workers
+    progress: callable receiving (sessions done, total, session label) as every session completes
+    is_cancelled: callable returning whether to stop [sessions not started yet are dropped]
+Returns the merged summaries & the messages of the sessions that failed
+'''
+def run_season(sessions, workers, cache_dir='cache', progress=None, is_cancelled=None):
+    summaries, errors = [], []
+    if len(sessions) == 0:
+        return merge_summaries(summaries), errors
+
+    workers = max(1, min(workers, len(sessions)))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=session_data.init_worker, initargs=(cache_dir,)) as executor:
+        futures = {executor.submit(session_summary, season_session): season_session for season_session in sessions}
+        for done, future in enumerate(as_completed(futures), start=1):
+            label = session_label(futures[future])
+            try:
+                summaries.append(future.result())
+            except Exception as error:
+                errors.append(label + ': ' + str(error))
+
+            if progress is not None:
+                progress(done, len(sessions), label)
+            if is_cancelled is not None and is_cancelled():
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+    return merge_summaries(summaries), errors
+
+'''
+Best-lap deficit of every driver to the fastest lap of every session [pole position in qualifying]
+    summaries: merged session summaries
+Adds Deficit (s) & DeficitPercent to the drivers with a timed lap
+'''
+def pole_deficits(summaries):
+    frame = summaries.dropna(subset=['BestLap']).copy()
+    pole = frame.groupby(['Year', 'Round'])['BestLap'].transform('min')
+    frame['Deficit'] = frame['BestLap'] - pole
+    frame['DeficitPercent'] = 100 * frame['Deficit'] / pole
+    return frame
+
+'''
+Best-lap gap of every driver to the teammate in every session
+[Only teams where both drivers set a timed lap are compared; a negative gap is ahead of the teammate]
+    summaries: merged session summaries
+Adds Teammate, TeammateGap (s) & TeammateGapPercent
+'''
+def teammate_gaps(summaries):
+    frame = summaries.dropna(subset=['BestLap'])
+    keys = ['Year', 'Round', 'TeamName']
+    frame = frame[frame.groupby(keys)['BestLap'].transform('count') == 2].copy()
+
+    teammate_lap = frame.groupby(keys)['BestLap'].transform('sum') - frame['BestLap']
+    frame['Teammate'] = frame.groupby(keys)['Abbreviation'].transform(lambda names: names.iloc[::-1].to_numpy())
+    frame['TeammateGap'] = frame['BestLap'] - teammate_lap
+    frame['TeammateGapPercent'] = 100 * frame['TeammateGap'] / teammate_lap
+    return frame
+
+'''
+Season of every driver in one row: deficit to pole & head to head with the teammate
+[Drivers are listed under the team they drove for last in the season, fastest median deficit first]
+    summaries: merged session summaries
+'''
+def driver_seasons(summaries):
+    keys = ['Year', 'DriverNumber']
+    deficits = pole_deficits(summaries)
+    if deficits.empty:
+        return pd.DataFrame(columns=keys + ['Abbreviation', 'TeamName', 'TeamColor', 'Rounds', 'Poles', 'MedianDeficit',
+                                            'BestDeficit', 'TeammateRounds', 'AheadOfTeammate', 'MedianTeammateGap'])
+
+    table = deficits.groupby(keys).agg(
+        Abbreviation=('Abbreviation', 'last'), TeamName=('TeamName', 'last'), TeamColor=('TeamColor', 'last'),
+        Rounds=('Round', 'count'), Poles=('Deficit', lambda deficit: int((deficit == 0).sum())),
+        MedianDeficit=('DeficitPercent', 'median'), BestDeficit=('DeficitPercent', 'min'))
+
+    gaps = teammate_gaps(summaries).groupby(keys).agg(
+        TeammateRounds=('Round', 'count'), AheadOfTeammate=('TeammateGap', lambda gap: int((gap < 0).sum())),
+        MedianTeammateGap=('TeammateGap', 'median'))
+    table = table.join(gaps).fillna({'TeammateRounds': 0, 'AheadOfTeammate': 0})
+    table[['TeammateRounds', 'AheadOfTeammate']] = table[['TeammateRounds', 'AheadOfTeammate']].astype(int)
+    return table.reset_index().sort_values(['Year', 'MedianDeficit'], kind='mergesort').reset_index(drop=True)
+
+'''
+Deficit of every team's faster car to the fastest lap of every session
+[The pace trend of the teams over the analysed seasons]
+    summaries: merged session summaries
+Returns a DataFrame of Year, Round, TeamName, TeamColor & DeficitPercent
+'''
+def team_deficits(summaries):
+    deficits = pole_deficits(summaries)
+    best = deficits.loc[deficits.groupby(['Year', 'Round', 'TeamName'])['DeficitPercent'].idxmin()]
+    return best[['Year', 'Round', 'TeamName', 'TeamColor', 'DeficitPercent']].reset_index(drop=True)
+
+# Worker processes used by default [one core is left to the app]
+def default_workers():
+    return max(1, (os.cpu_count() or 2) - 1)
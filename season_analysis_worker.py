@@ -0,0 +1,132 @@
+''' SEASON ANALYSIS WORKER LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+import threading
+
+# Season Analysis Engine [sessions are summarized in worker processes]
+import season_analysis
+
+'''
+Signals emitted by the season analysis worker
+    progress:   generation, sessions done, total sessions, label of the last session
+    finished:   generation, merged session summaries, error messages
+    failed:     generation, error message
+'''
+class SeasonAnalysisSignals(QObject):
+    progress = pyqtSignal(int, int, int, str)
+    finished = pyqtSignal(int, object, object)
+    failed = pyqtSignal(int, str)
+
+'''
+Runs a season analysis on a QThreadPool thread
+[The thread only fetches the schedules & waits on the process pool that loads the sessions]
+    generation: id of the request; a newer request cancels the sessions not started yet
+    years: seasons to analyse
+    session_name: session of every event, e.g. Qualifying
+    workers: number of worker processes
+    is_current: callable returning whether the generation is still the latest request
+'''
+class SeasonAnalysisWorker(QRunnable):
+    def __init__(self, generation, years, session_name, workers, cache_dir, is_current):
+        super().__init__()
+        self.generation = generation
+        self.years = years
+        self.session_name = session_name
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.is_current = is_current
+        self.signals = SeasonAnalysisSignals()
+
+    def report(self, done, total, label):
+        if self.is_current(self.generation):
+            self.signals.progress.emit(self.generation, done, total, label)
+
+    def run(self):
+        try:
+            sessions = season_analysis.season_sessions(self.years, self.session_name)
+            self.report(0, len(sessions), 'Loading ' + str(len(sessions)) + ' sessions')
+
+            summaries, errors = season_analysis.run_season(sessions, self.workers, self.cache_dir, self.report,
+                                                           lambda: not self.is_current(self.generation))
+            if self.is_current(self.generation):
+                self.signals.finished.emit(self.generation, summaries, errors)
+
+        except Exception as error:
+            if self.is_current(self.generation):
+                self.signals.failed.emit(self.generation, str(error))
+
+'''
+Schedules season analyses in the background & keeps the results of every analysis run
+[One analysis runs at a time; a newer request cancels the sessions of the running one that have not started]
+    workers: number of worker processes [every core but one by default]
+    cache_dir: FastF1 cache directory shared by the worker processes
+'''
+class SeasonAnalyser(QObject):
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, workers=None, cache_dir='cache', parent=None):
+        super().__init__(parent)
+        self.workers = workers or season_analysis.default_workers()
+        self.cache_dir = cache_dir
+
+        # (years, session name): merged session summaries
+        self.results = {}
+        self.requested = None
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def is_current(self, generation):
+        with self.lock:
+            return generation == self.generation
+
+    '''
+    Analysing the given session of every event of the seasons
+    Returns the summaries of an earlier run right away [None while the analysis runs in the background]
+    '''
+    def analyse(self, years, session_name):
+        key = (tuple(years), session_name)
+        with self.lock:
+            self.generation = self.generation + 1
+            generation = self.generation
+            self.requested = key
+        self.pool.clear()
+
+        if key in self.results:
+            return self.results[key]
+
+        worker = SeasonAnalysisWorker(generation, list(years), session_name, self.workers, self.cache_dir, self.is_current)
+        worker.signals.progress.connect(self.on_progress)
+        worker.signals.finished.connect(self.on_finished)
+        worker.signals.failed.connect(self.on_failed)
+        self.pool.start(worker)
+        return None
+
+    # Stopping the running analysis after the sessions being loaded
+    def cancel(self):
+        with self.lock:
+            self.generation = self.generation + 1
+        self.pool.clear()
+
+    def on_progress(self, generation, done, total, label):
+        if self.is_current(generation):
+            self.progress.emit(done, total, label)
+
+    def on_finished(self, generation, summaries, errors):
+        if not self.is_current(generation):
+            return
+        # Runs with failed sessions are not kept, so the failed sessions are retried on the next request
+        if len(errors) == 0:
+            self.results[self.requested] = summaries
+        self.finished.emit(summaries, errors)
+
+    def on_failed(self, generation, message):
+        if self.is_current(generation):
+            self.failed.emit(message)
@@ -0,0 +1,285 @@
+''' SEASON RESULTS LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+import datetime
+import os
+import sqlite3
+import threading
+
+# FastF1 API
+import fastf1 as ff1
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Serializing FastF1 loads with the interactive session loader
+from session_data import FASTF1_LOCK
+
+SCHEDULE_SESSIONS = [('Session' + str(i), 'Session' + str(i) + 'DateUtc') for i in range(1, 6)]
+
+# Columns of the stored session results [as named in FastF1's SessionResults]
+RESULT_COLUMNS = ['DriverNumber', 'Abbreviation', 'FullName', 'TeamName', 'TeamColor', 'Position', 'Points', 'Status']
+
+DRIVER_COLUMNS = ['Position', 'DriverNumber', 'Abbreviation', 'FullName', 'TeamName', 'TeamColor', 'Points', 'Wins', 'Podiums']
+CONSTRUCTOR_COLUMNS = ['Position', 'TeamName', 'TeamColor', 'Points', 'Wins', 'Podiums']
+
+# Sessions awarding championship points [the 2021 sprints were named Sprint Qualifying]
+def points_sessions(year):
+    if year == 2021:
+        return {'Race', 'Sprint Qualifying'}
+    return {'Race', 'Sprint'}
+
+'''
+Points scoring sessions of a season that have taken place, from its compact event schedule
+    schedule: compact schedule [see schedule_cache.compact_schedule]
+    cutoff: sessions starting after this time (UTC) are left out
+Returns a list of (round number, event name, session name)
+'''
+def held_sessions(year, schedule, cutoff):
+    scoring = points_sessions(year)
+    held = []
+    for name_column, date_column in SCHEDULE_SESSIONS:
+        mask = schedule[name_column].isin(scoring).to_numpy() & (schedule[date_column] < cutoff).to_numpy()
+        rows = schedule[mask]
+        held.extend(zip(rows['RoundNumber'].astype(int), rows['EventName'], rows[name_column]))
+    return sorted(held)
+
+'''
+Local store of the results of every points scoring session, one SQLite file for all seasons
+[Rounds are written once, as soon as they are fetched, so a season is only ever fetched incrementally
+ & its standings are available offline]
+    path: location of the database [':memory:' to keep the results in memory only]
+'''
+class ResultsStore:
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS sessions (
+            year INTEGER, round INTEGER, session TEXT, event_name TEXT, stored TEXT,
+            PRIMARY KEY (year, round, session));
+        CREATE TABLE IF NOT EXISTS results (
+            year INTEGER, round INTEGER, session TEXT, driver_number TEXT, abbreviation TEXT,
+            full_name TEXT, team_name TEXT, team_color TEXT, position REAL, points REAL, status TEXT,
+            PRIMARY KEY (year, round, session, driver_number));
+    '''
+
+    def __init__(self, path='cache/season_results.sqlite'):
+        self.lock = threading.Lock()
+        try:
+            if path != ':memory:':
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self.connection = sqlite3.connect(path, check_same_thread=False)
+            self.connection.executescript(self.SCHEMA)
+        except (OSError, sqlite3.Error):
+            # Falling back to a store kept in memory for this run only
+            self.connection = sqlite3.connect(':memory:', check_same_thread=False)
+            self.connection.executescript(self.SCHEMA)
+
+    # (round, session) pairs of the season that are stored
+    def stored_sessions(self, year):
+        with self.lock:
+            rows = self.connection.execute('SELECT round, session FROM sessions WHERE year = ?', (year,)).fetchall()
+        return set(rows)
+
+    '''
+    Storing the results of a session, replacing any results stored for it before
+        results: FastF1 SessionResults [or any frame holding RESULT_COLUMNS]
+    '''
+    def write(self, year, round_number, session_name, event_name, results):
+        frame = pd.DataFrame(results).reindex(columns=RESULT_COLUMNS)
+        rows = zip(frame['DriverNumber'].astype(str), frame['Abbreviation'], frame['FullName'], frame['TeamName'],
+                   frame['TeamColor'], frame['Position'].astype(float), frame['Points'].astype(float).fillna(0.0), frame['Status'])
+        rows = [(year, round_number, session_name) + tuple(None if pd.isna(value) else value for value in row) for row in rows]
+
+        stored = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM results WHERE year = ? AND round = ? AND session = ?',
+                                    (year, round_number, session_name))
+            self.connection.executemany('INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            self.connection.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?)',
+                                    (year, round_number, session_name, event_name, stored))
+
+    # Every stored result of the season, with the columns named as in FastF1
+    def season_results(self, year):
+        query = '''
+            SELECT r.round AS Round, s.event_name AS EventName, r.session AS Session,
+                   r.driver_number AS DriverNumber, r.abbreviation AS Abbreviation, r.full_name AS FullName,
+                   r.team_name AS TeamName, r.team_color AS TeamColor, r.position AS Position,
+                   r.points AS Points, r.status AS Status
+            FROM results r JOIN sessions s USING (year, round, session)
+            WHERE r.year = ? ORDER BY r.round, r.session, r.position
+        '''
+        with self.lock:
+            return pd.read_sql_query(query, self.connection, params=(year,))
+
+'''
+Finishing position counts of every competitor in the races, as columns P1, P2, ...
+[Used for the countback: ties on points are broken by the most wins, then second places, ...]
+    races: season results of the race sessions
+    by: column identifying the competitor
+'''
+def finish_counts(races, by):
+    positions = races.dropna(subset=['Position'])
+    if positions.empty:
+        return pd.DataFrame()
+
+    counts = pd.crosstab(positions[by], positions['Position'].astype(int))
+    counts = counts.reindex(columns=range(1, int(counts.columns.max()) + 1), fill_value=0)
+    counts.columns = ['P' + str(position) for position in counts.columns]
+    return counts
+
+# Ordering a standings table by points & countback, numbering the positions
+def rank(table, counts):
+    table = table.join(counts).fillna({column: 0 for column in counts.columns})
+    table = table.sort_values(['Points'] + list(counts.columns), ascending=False, kind='mergesort')
+    table['Wins'] = table['P1'] if 'P1' in table else 0
+    podium_columns = [column for column in ['P1', 'P2', 'P3'] if column in table]
+    table['Podiums'] = table[podium_columns].sum(axis=1) if podium_columns else 0
+    table['Position'] = np.arange(1, len(table) + 1)
+    return table.reset_index()
+
+'''
+Drivers' championship standings from the stored results of a season
+[Drivers are listed under the team they drove for last]
+'''
+def driver_standings(results):
+    if results.empty:
+        return pd.DataFrame(columns=DRIVER_COLUMNS)
+
+    latest = results.sort_values('Round').groupby('DriverNumber')[['Abbreviation', 'FullName', 'TeamName', 'TeamColor']].last()
+    table = latest.assign(Points=results.groupby('DriverNumber')['Points'].sum())
+    counts = finish_counts(results[results['Session'] == 'Race'], 'DriverNumber')
+    return rank(table, counts)[DRIVER_COLUMNS]
+
+# Constructors' championship standings from the stored results of a season
+def constructor_standings(results):
+    if results.empty:
+        return pd.DataFrame(columns=CONSTRUCTOR_COLUMNS)
+
+    grouped = results.sort_values('Round').groupby('TeamName')
+    table = grouped[['TeamColor']].last().assign(Points=grouped['Points'].sum())
+    counts = finish_counts(results[results['Session'] == 'Race'], 'TeamName')
+    return rank(table, counts)[CONSTRUCTOR_COLUMNS]
+
+'''
+Points of every driver after every round
+Returns a DataFrame indexed by round with one column per driver number [cumulative points]
+'''
+def points_progression(results):
+    if results.empty:
+        return pd.DataFrame()
+    per_round = results.pivot_table(index='Round', columns='DriverNumber', values='Points', aggfunc='sum', fill_value=0.0)
+    return per_round.cumsum()
+
+class ResultsFetchSignals(QObject):
+    stored = pyqtSignal(int, int, int)
+    failed = pyqtSignal(int, int, str)
+    finished = pyqtSignal(int, int)
+
+'''
+Fetching the results of the given sessions on a QThreadPool thread, storing every session as it arrives
+[Only the results are loaded; no laps, telemetry, weather or messages]
+    generation: id of the request; a newer request stops this one between sessions
+    sessions: list of (round number, event name, session name)
+    store: ResultsStore [thread safe]
+    is_current: callable returning whether the generation is still the latest request
+'''
+class ResultsFetchWorker(QRunnable):
+    def __init__(self, generation, year, sessions, store, is_current):
+        super().__init__()
+        self.generation = generation
+        self.year = year
+        self.sessions = sessions
+        self.store = store
+        self.is_current = is_current
+        self.signals = ResultsFetchSignals()
+
+    def run(self):
+        for round_number, event_name, session_name in self.sessions:
+            if not self.is_current(self.generation):
+                return
+            try:
+                with FASTF1_LOCK:
+                    session = ff1.get_session(self.year, round_number, session_name)
+                    session.load(laps=False, telemetry=False, weather=False, messages=False)
+                if session.results is None or session.results.empty:
+                    continue
+                self.store.write(self.year, round_number, session_name, event_name, session.results)
+                self.signals.stored.emit(self.generation, self.year, round_number)
+            except Exception as error:
+                self.signals.failed.emit(self.generation, self.year, event_name + ' ' + session_name + ': ' + str(error))
+        self.signals.finished.emit(self.generation, self.year)
+
+'''
+Championship standings of every season, computed from the local results store
+[Standings are shown from the stored rounds right away; rounds that are missing are fetched in the
+ background & the standings recomputed as each of them arrives]
+    store: ResultsStore
+'''
+class SeasonResults(QObject):
+    updated = pyqtSignal(int)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(int, str)
+
+    # Hours after the start of a session before its results are fetched
+    RESULTS_DELAY = pd.Timedelta(hours=3)
+
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self.store = store or ResultsStore()
+
+        # year: (driver standings, constructor standings, points progression)
+        self.standings = {}
+
+        self.generation = 0
+        self.lock = threading.Lock()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def is_current(self, generation):
+        with self.lock:
+            return generation == self.generation
+
+    # Standings of the season from the stored rounds, computed once per change of the store
+    def season(self, year):
+        if year not in self.standings:
+            results = self.store.season_results(year)
+            self.standings[year] = (driver_standings(results), constructor_standings(results), points_progression(results))
+        return self.standings[year]
+
+    '''
+    Fetching the points scoring sessions of the season that are not stored yet
+        schedule: compact schedule of the season
+    Returns the number of sessions requested [0 when the stored standings are complete]
+    '''
+    def request(self, year, schedule):
+        cutoff = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - self.RESULTS_DELAY
+        stored = self.store.stored_sessions(year)
+        missing = [session for session in held_sessions(year, schedule, cutoff) if (session[0], session[2]) not in stored]
+
+        with self.lock:
+            self.generation = self.generation + 1
+            generation = self.generation
+        self.pool.clear()
+
+        if len(missing) == 0:
+            return 0
+
+        worker = ResultsFetchWorker(generation, year, missing, self.store, self.is_current)
+        worker.signals.stored.connect(self.on_stored)
+        worker.signals.failed.connect(self.on_failed)
+        worker.signals.finished.connect(self.on_finished)
+        self.pool.start(worker)
+        return len(missing)
+
+    def on_stored(self, generation, year, round_number):
+        self.standings.pop(year, None)
+        self.updated.emit(year)
+
+    def on_failed(self, generation, year, message):
+        self.failed.emit(year, message)
+
+    def on_finished(self, generation, year):
+        if self.is_current(generation):
+            self.finished.emit(year)
@@ -0,0 +1,96 @@
+''' SESSION CACHE LIBRARIES'''
+# Miscellanous Functionality
+from collections import OrderedDict, namedtuple
+import threading
+
+# Data Analysis Libraries
+import pandas as pd
+
+'''
+A fully loaded session & everything derived from it when it was loaded
+    session: loaded FastF1 session
+    circuit_info: circuit info of the session
+    session_index: per-session lookups [see session_index.SessionIndex]
+'''
+LoadedSession = namedtuple('LoadedSession', ['session', 'circuit_info', 'session_index'])
+
+# Frames of a loaded session, read from the private attributes so data that was not loaded is skipped
+SESSION_FRAMES = ['_laps', '_results', '_weather_data', '_track_status', '_session_status', '_race_control_messages']
+SESSION_FRAME_DICTS = ['_car_data', '_pos_data']
+
+'''
+Approximate memory footprint of a loaded session (bytes)
+[Shallow frame sizes; object columns are counted by reference, which keeps the estimate cheap]
+'''
+def session_footprint(session):
+    frames = [getattr(session, name, None) for name in SESSION_FRAMES]
+    for name in SESSION_FRAME_DICTS:
+        frames.extend((getattr(session, name, None) or {}).values())
+    return int(sum(frame.memory_usage(index=True, deep=False).sum() for frame in frames if isinstance(frame, pd.DataFrame)))
+
+'''
+Least-recently-used store of fully loaded sessions, for switching back to a session without reloading it
+[Keyed by the load request (year, grand prix, session name); evicted once the memory budget is exceeded]
+The driver comparison selections made on a session are kept with it, so they can be restored
+    max_bytes: memory budget for all cached sessions [approximate, see session_footprint]
+'''
+class SessionCache:
+    def __init__(self, max_bytes=1024**3):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.selections = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # Returning the loaded session of the request [None if it is not cached]
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits = self.hits + 1
+                return self.entries[key]
+            self.misses = self.misses + 1
+            return None
+
+    def insert(self, key, loaded_session):
+        size = session_footprint(loaded_session.session)
+
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes = self.total_bytes - self.sizes[key]
+            self.entries[key] = loaded_session
+            self.entries.move_to_end(key)
+            self.sizes[key] = size
+            self.total_bytes = self.total_bytes + size
+
+            # Evicting the least recently used sessions while over budget [the newest session is always kept]
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, _ = self.entries.popitem(last=False)
+                self.total_bytes = self.total_bytes - self.sizes.pop(old_key)
+                self.selections.pop(old_key, None)
+
+    # Keeping the selections made on a cached session
+    def set_selection(self, key, selection):
+        with self.lock:
+            if key in self.entries:
+                self.selections[key] = selection
+
+    def selection(self, key):
+        with self.lock:
+            return self.selections.get(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.selections.clear()
+            self.total_bytes = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
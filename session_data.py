@@ -0,0 +1,83 @@
+''' SESSION DATA LIBRARIES'''
+# Miscellanous Functionality
+import copy
+import datetime
+import os
+import threading
+
+# FastF1 API
+import fastf1 as ff1
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+# Per-Session Lookups & Loaded Sessions
+from session_index import SessionIndex
+from session_cache import LoadedSession
+
+# FastF1 is not safe for concurrent loads; every background loader holds this lock around its FastF1 calls
+FASTF1_LOCK = threading.Lock()
+
+# Setting up a worker process of a process pool [each process has its own FastF1 session state, sharing the on-disk cache]
+def init_worker(cache_dir):
+    os.makedirs(cache_dir, exist_ok=True)
+    ff1.Cache.enable_cache(cache_dir)
+
+# Hours after the start of a session before it is included in a batch or season run [as in the app's session lists]
+SESSION_DELAY = datetime.timedelta(hours=5)
+
+# Lap & sector time in seconds [NaN when not set]
+def seconds(time):
+    return time.total_seconds() if pd.notna(time) else np.nan
+
+# Sessions where only hot-laps are listed & compared
+QUALIFYING_SESSIONS = ['Qualifying', 'Sprint Qualifying', 'Sprint Shootout']
+
+# Checking if only hot-laps are selectable in the session
+def is_qualifying(session):
+    return session.name in QUALIFYING_SESSIONS
+
+'''
+Loading the telemetry of a session loaded with its laps, without writing to any frame other threads read
+[Only FastF1's telemetry stage runs: session.load() would also reload the session info & results, rewrite
+ the deleted laps & recompute the results in place. The stage itself adds LapStartDate to the laps in place,
+ so it runs on a shallow copy of the session holding a private copy of the laps; every attribute it produces
+ is then published on the session by a single reference swap, & the laps handed out before are never written]
+'''
+def load_telemetry(session):
+    stage = copy.copy(session)
+    stage._laps = session.laps.copy()
+    with FASTF1_LOCK:
+        stage._load_telemetry()
+
+    for name, value in vars(stage).items():
+        if vars(session).get(name) is not value:
+            setattr(session, name, value)
+
+'''
+Loading the weather data of a session loaded without it, through FastF1's weather stage only [see load_telemetry]
+[Weather is only needed by the export, so it is left out of the session load]
+'''
+def load_weather(session):
+    with FASTF1_LOCK:
+        try:
+            session.weather_data
+        except ff1.core.DataNotLoadedError:
+            session._load_weather_data()
+
+'''
+Loading a session with its laps & telemetry, its lap index & its circuit info in one call
+[The counterpart of the staged background loader for runs without a GUI; weather is left out as in the app]
+    year, event, session_name: session identifiers as passed to ff1.get_session
+Returns a LoadedSession
+'''
+def load_session(year, event, session_name):
+    with FASTF1_LOCK:
+        session = ff1.get_session(year, event, session_name)
+        session.load(laps=True, telemetry=True, weather=False, messages=True)
+
+    session_index = SessionIndex(session)
+    session_index.index_telemetry(session)
+    circuit_info = session.get_circuit_info()
+    return LoadedSession(session, circuit_info, session_index)
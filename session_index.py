@@ -0,0 +1,145 @@
+''' SESSION INDEX LIBRARIES'''
+# Miscellanous Functionality
+from collections import namedtuple
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+
+'''
+Laps of one driver, as positions into session.laps
+    lap_numbers, rows: every lap of the driver in order, & its row in session.laps
+    hot_lap_numbers, hot_rows: laps without a pit entry or exit [the laps listed for qualifying sessions]
+    fastest_lap: fastest lap marked as a personal best [None if no lap was]
+    personal_best: fastest personal best lap without a pit entry or exit [None if no lap was]
+    stints: {stint number: (first lap number, last lap number)}
+    positions, hot_positions: {lap number: position in lap_numbers / hot_lap_numbers}
+'''
+DriverLaps = namedtuple('DriverLaps', ['lap_numbers', 'rows', 'hot_lap_numbers', 'hot_rows', 'fastest_lap',
+                                       'personal_best', 'stints', 'positions', 'hot_positions'])
+
+'''
+Per-session lookups computed once after the session has loaded
+[Built on the session loading thread, so lap selections never pay for them]
+    session: FastF1 session loaded with its laps [lookups needing telemetry are added by index_telemetry]
+'''
+class SessionIndex:
+    def __init__(self, session):
+        self.reference_lap_length = None
+        self.laps = self.build_lap_index(session.laps)
+
+    # Adding the lookups that need the telemetry, once it has been loaded
+    def index_telemetry(self, session):
+        self.reference_lap_length = self.find_reference_lap_length(session)
+
+    '''
+    Indexing the laps of every driver in a single pass over the laps table
+    [Matches pick_driver, pick_wo_box & pick_fastest, so lap selections are dictionary lookups]
+        laps: session.laps
+    Returns {driver number: DriverLaps}
+    '''
+    @staticmethod
+    def build_lap_index(laps):
+        frame = pd.DataFrame({
+            'DriverNumber': laps['DriverNumber'].astype(str).to_numpy(),
+            'LapNumber': laps['LapNumber'].to_numpy(),
+            'Stint': laps['Stint'].to_numpy(),
+            'LapTime': laps['LapTime'].to_numpy(),
+            'Hot': (laps['PitInTime'].isna() & laps['PitOutTime'].isna()).to_numpy(),
+            'PersonalBest': (laps['IsPersonalBest'] == True).to_numpy(),  # noqa: E712
+        })
+        frame = frame[frame['LapNumber'].notna()]
+        frame['Row'] = frame.index
+
+        # Fastest personal best lap of every driver, with & without the laps entering or leaving the pits
+        timed = frame[frame['PersonalBest'] & frame['LapTime'].notna()]
+        fastest = timed.loc[timed.groupby('DriverNumber')['LapTime'].idxmin(), ['DriverNumber', 'LapNumber']]
+        timed = timed[timed['Hot']]
+        personal_best = timed.loc[timed.groupby('DriverNumber')['LapTime'].idxmin(), ['DriverNumber', 'LapNumber']]
+        fastest = dict(zip(fastest['DriverNumber'], fastest['LapNumber'].astype(int)))
+        personal_best = dict(zip(personal_best['DriverNumber'], personal_best['LapNumber'].astype(int)))
+
+        # First & last lap of every stint
+        stints = frame[frame['Stint'].notna()].groupby(['DriverNumber', 'Stint'])['LapNumber'].agg(['min', 'max'])
+
+        index = {}
+        for driver, driver_frame in frame.groupby('DriverNumber', sort=False):
+            lap_numbers = driver_frame['LapNumber'].to_numpy().astype(int)
+            rows = driver_frame['Row'].to_numpy()
+            hot = driver_frame['Hot'].to_numpy()
+            driver_stints = {}
+            if driver in stints.index.get_level_values(0):
+                driver_stints = {int(stint): (int(first), int(last)) for stint, (first, last) in stints.loc[driver].iterrows()}
+
+            index[driver] = DriverLaps(
+                lap_numbers, rows, lap_numbers[hot], rows[hot],
+                fastest.get(driver), personal_best.get(driver), driver_stints,
+                {int(number): i for i, number in enumerate(lap_numbers)},
+                {int(number): i for i, number in enumerate(lap_numbers[hot])})
+        return index
+
+    # Indexed laps of a driver [None if the driver set no laps]
+    def driver_laps(self, driver):
+        return self.laps.get(str(driver))
+
+    '''
+    Lap numbers listed in the lap selection of a driver, in combo box order
+        hot_laps: listing only the laps without a pit entry or exit [qualifying sessions]
+    '''
+    def combo_laps(self, driver, hot_laps):
+        driver_laps = self.driver_laps(driver)
+        if driver_laps is None:
+            return np.empty(0, dtype=int)
+        return driver_laps.hot_lap_numbers if hot_laps else driver_laps.lap_numbers
+
+    # Row in session.laps of the lap at the given combo box position
+    def combo_row(self, driver, position, hot_laps):
+        driver_laps = self.driver_laps(driver)
+        return driver_laps.hot_rows[position] if hot_laps else driver_laps.rows[position]
+
+    # Row in session.laps of the given lap of a driver
+    def lap_row(self, driver, lap_number):
+        driver_laps = self.driver_laps(driver)
+        return driver_laps.rows[driver_laps.positions[int(lap_number)]]
+
+    # Combo box position of the given lap [None if the lap is not listed]
+    def combo_position(self, driver, lap_number, hot_laps):
+        driver_laps = self.driver_laps(driver)
+        if driver_laps is None or lap_number is None:
+            return None
+        positions = driver_laps.hot_positions if hot_laps else driver_laps.positions
+        return positions.get(int(lap_number))
+
+    '''
+    Lap number of the fastest lap of a driver
+        hot_laps: the fastest lap without a pit entry or exit [the personal best of qualifying sessions]
+    '''
+    def fastest_lap(self, driver, hot_laps):
+        driver_laps = self.driver_laps(driver)
+        if driver_laps is None:
+            return None
+        return driver_laps.personal_best if hot_laps else driver_laps.fastest_lap
+
+    '''
+    Finding the distance covered on the fastest lap of the session
+    [Used as the full lap length when aligning lap 1, which starts from the grid rather than the start line]
+    '''
+    @staticmethod
+    def find_reference_lap_length(session):
+        fastest_lap = session.laps.pick_fastest()
+        if fastest_lap is None or fastest_lap.empty or pd.isna(fastest_lap['LapTime']):
+            return None
+
+        telemetry = fastest_lap.get_telemetry()
+        if telemetry.empty:
+            return None
+        return float(telemetry['Distance'].max())
+
+    '''
+    Shifting the distance trace of a lap 1 so that it finishes on the reference lap length
+        distance: Series or array of the lap's distance
+    '''
+    def align_lap_one(self, distance):
+        if self.reference_lap_length is None:
+            return distance
+        return distance + (self.reference_lap_length - distance.max())
@@ -0,0 +1,259 @@
+''' SESSION LOADING LIBRARIES'''
+# PyQt5
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Miscellanous Functionality
+import logging
+import threading
+
+# FastF1 API
+import fastf1 as ff1
+
+# Per-Session Lookups
+from session_index import SessionIndex
+
+# Recently Loaded Sessions
+from session_cache import LoadedSession, SessionCache
+
+# Lock serializing FastF1 loads across every background loader & the telemetry stage loader
+from session_data import FASTF1_LOCK, load_telemetry
+
+# Stage Timings
+from perf_trace import recorder
+
+# Share of the progress bar taken by each loading stage, as (start, end) percentages
+LAPS_STAGE = (0, 40)
+TELEMETRY_STAGE = (40, 90)
+
+'''
+Signals emitted by the background session loader
+Every signal carries the generation of the request that produced it, so stale results can be dropped
+    progress:           generation, percentage complete, status message
+    loaded:             generation, session with its results & laps, session index
+    telemetry_loaded:   generation, session with its telemetry, circuit info
+    failed:             generation, error message
+    cancelled:          generation
+'''
+class SessionLoadSignals(QObject):
+    progress = pyqtSignal(int, int, str)
+    loaded = pyqtSignal(int, object, object)
+    telemetry_loaded = pyqtSignal(int, object, object)
+    failed = pyqtSignal(int, str)
+    cancelled = pyqtSignal(int)
+
+'''
+Forwards the FastF1 log output of the loading thread as progress messages
+[FastF1 logs every loading stage, which makes for a finer progress report than the worker stages alone]
+'''
+class ProgressLogHandler(logging.Handler):
+    # FastF1 log messages mapped to the percentage of the load they mark
+    STAGES = [
+        ('Loading data for', 5),
+        ('session info data', 10),
+        ('driver list', 15),
+        ('session status data', 20),
+        ('lap timing data', 25),
+        ('timing app data', 35),
+        ('Processing timing data', 40),
+        ('car data', 50),
+        ('position data', 65),
+        ('weather data', 75),
+        ('race control messages', 80),
+        ('Finished loading data', 85),
+    ]
+
+    def __init__(self, worker):
+        super().__init__(logging.INFO)
+        self.worker = worker
+        self.thread_id = threading.get_ident()
+
+    def emit(self, record):
+        # Ignoring log output from any other thread
+        if record.thread != self.thread_id:
+            return
+
+        message = record.getMessage()
+        for stage, percent in self.STAGES:
+            if stage in message:
+                self.worker.report_stage(percent, message)
+                return
+
+'''
+Loads a single FastF1 session & its circuit info on a QThreadPool thread, in stages
+[Results & laps are loaded first, so the driver & lap selections can be filled right away;
+ car & position telemetry follow, then the circuit info that is placed using it. Weather is left out]
+    generation: id of the load request; used to supersede older requests
+    year, grand_prix, session_name: session identifiers as passed to ff1.get_session
+    is_current: callable returning whether the generation is still the latest request
+'''
+class SessionLoadWorker(QRunnable):
+    def __init__(self, generation, year, grand_prix, session_name, is_current):
+        super().__init__()
+        self.generation = generation
+        self.year = year
+        self.grand_prix = grand_prix
+        self.session_name = session_name
+        self.is_current = is_current
+        self.signals = SessionLoadSignals()
+        self.stage = LAPS_STAGE
+
+    def report(self, percent, message):
+        if self.is_current(self.generation):
+            self.signals.progress.emit(self.generation, percent, message)
+
+    # Reporting the progress of a FastF1 load within the range of the current stage
+    def report_stage(self, percent, message):
+        start, end = self.stage
+        self.report(int(start + (end - start) * percent / 100), message)
+
+    # Checks between loading stages whether a newer request has superseded this one
+    def superseded(self):
+        if self.is_current(self.generation):
+            return False
+        self.signals.cancelled.emit(self.generation)
+        return True
+
+    def run(self):
+        if self.superseded():
+            return
+
+        log_handler = ProgressLogHandler(self)
+        ff1_logger = logging.getLogger('fastf1')
+        ff1_logger.addHandler(log_handler)
+
+        try:
+            self.report(0, 'Fetching ' + self.session_name + ' schedule data')
+            with FASTF1_LOCK:
+                session = ff1.get_session(self.year, self.grand_prix, self.session_name)
+            if self.superseded():
+                return
+
+            # Race control messages are kept in the first stage, as they mark the deleted laps
+            self.stage = LAPS_STAGE
+            with FASTF1_LOCK, recorder.span('session_loader.load_laps', 'load'):
+                session.load(laps=True, telemetry=False, weather=False, messages=True)
+            if self.superseded():
+                return
+
+            with recorder.span('session_loader.session_index', 'load'):
+                session_index = SessionIndex(session)
+            self.report(LAPS_STAGE[1], 'Loaded ' + self.session_name + ' laps, loading telemetry')
+            self.signals.loaded.emit(self.generation, session, session_index)
+            if self.superseded():
+                return
+
+            # The telemetry stream of the session holds every driver, so it is loaded at once in the background
+            self.stage = TELEMETRY_STAGE
+            with recorder.span('session_loader.load_telemetry', 'load'):
+                load_telemetry(session)
+            if self.superseded():
+                return
+
+            self.report(95, 'Loading circuit info')
+            with recorder.span('session_loader.circuit_info', 'load'):
+                circuit_info = session.get_circuit_info()
+                session_index.index_telemetry(session)
+            if self.superseded():
+                return
+
+            self.report(100, 'Loaded ' + self.session_name)
+            self.signals.telemetry_loaded.emit(self.generation, session, circuit_info)
+
+        except Exception as error:
+            if self.is_current(self.generation):
+                self.signals.failed.emit(self.generation, str(error))
+
+        finally:
+            ff1_logger.removeHandler(log_handler)
+
+'''
+Schedules session loads in the background
+[Only one load runs at a time; a newer request drops any queued request & discards the result of a running one.
+ Recently loaded sessions are kept in memory & handed back right away when requested again]
+    session_cache: SessionCache of the loaded sessions
+'''
+class SessionLoader(QObject):
+    progress = pyqtSignal(int, str)
+    loaded = pyqtSignal(object, object)
+    telemetry_loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, session_cache=None, parent=None):
+        super().__init__(parent)
+        self.session_cache = session_cache or SessionCache()
+
+        # (year, grand prix, session name) of the latest request
+        self.requested = None
+
+        # FastF1 is not safe for concurrent loads, hence a single loading thread
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.generation = 0
+        self.lock = threading.Lock()
+
+        # Whether the latest request is still loading [set & cleared on the GUI thread only]
+        self.loading = False
+
+    def is_current(self, generation):
+        with self.lock:
+            return generation == self.generation
+
+    def load(self, year, grand_prix, session_name):
+        with self.lock:
+            self.generation = self.generation + 1
+            generation = self.generation
+
+        # Dropping requests that are still waiting for the loading thread
+        self.pool.clear()
+
+        # Handing a recently loaded session back without reloading it
+        self.requested = (year, grand_prix, session_name)
+        cached = self.session_cache.get(self.requested)
+        if cached is not None:
+            self.loading = False
+            self.progress.emit(100, 'Loaded ' + session_name + ' from memory')
+            self.loaded.emit(cached.session, cached.session_index)
+            self.telemetry_loaded.emit(cached.session, cached.circuit_info)
+            return
+
+        worker = SessionLoadWorker(generation, year, grand_prix, session_name, self.is_current)
+        worker.signals.progress.connect(self.on_progress)
+        worker.signals.loaded.connect(self.on_loaded)
+        worker.signals.telemetry_loaded.connect(self.on_telemetry_loaded)
+        worker.signals.failed.connect(self.on_failed)
+        self.loading = True
+        self.pool.start(worker)
+
+    # Invalidating any running or queued load
+    def cancel(self):
+        with self.lock:
+            self.generation = self.generation + 1
+        self.pool.clear()
+        self.loading = False
+
+    # Whether the latest request is still loading [a superseded load finishing in the background does not count]
+    def is_loading(self):
+        return self.loading
+
+    # Slots run on the GUI thread; results of superseded requests are discarded
+    def on_progress(self, generation, percent, message):
+        if self.is_current(generation):
+            self.progress.emit(percent, message)
+
+    def on_loaded(self, generation, session, session_index):
+        if self.is_current(generation):
+            self.session_index = session_index
+            self.loaded.emit(session, session_index)
+
+    # Sessions are only kept in memory once fully loaded
+    def on_telemetry_loaded(self, generation, session, circuit_info):
+        if self.is_current(generation):
+            self.loading = False
+            self.session_cache.insert(self.requested, LoadedSession(session, circuit_info, self.session_index))
+            self.telemetry_loaded.emit(session, circuit_info)
+
+    def on_failed(self, generation, message):
+        if self.is_current(generation):
+            self.loading = False
+            self.failed.emit(message)
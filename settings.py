@@ -1,10 +1,92 @@
 ''' UI LIBRARIES'''
 # PyQt5
-from PyQt5.QtWidgets import QWidget
-import PyQt5.uic as uic 
+from PyQt5.QtWidgets import QWidget, QStyledItemDelegate, QTableWidgetItem, QHeaderView, QFileDialog
+from PyQt5.QtCore import Qt, QTimer
+import PyQt5.uic as uic
+
+# Stage Timings & Memory Accounting
+from perf_trace import recorder, format_bytes
+
+# Columns of the performance table
+PERF_COLUMNS = ['Stage', 'Calls', 'Last (ms)', 'Mean (ms)', 'Max (ms)', 'Memory']
 
 class UI_settings(QWidget):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        uic.loadUi('settings_page.ui', self)
\ No newline at end of file
+        uic.loadUi('settings_page.ui', self)
+
+        # Stylizing the QComboBoxes with the applied QSS in .ui file
+        self.export_format.setItemDelegate(QStyledItemDelegate(self.export_format))
+
+        # Performance panel [refreshed every second while the page is shown]
+        self.perf_table.setHorizontalHeaderLabels(PERF_COLUMNS)
+        self.perf_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, len(PERF_COLUMNS)):
+            self.perf_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeToContents)
+
+        # Callable returning the memory held by the app as (label, bytes) pairs [set by the main window]
+        self.memory_source = None
+
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(1000)
+        self.perf_timer.timeout.connect(self.refresh_performance)
+
+        self.perf_enabled.setChecked(recorder.enabled)
+        self.perf_enabled.toggled.connect(self.set_recording)
+        self.perf_reset.clicked.connect(self.reset_performance)
+        self.perf_save.clicked.connect(self.save_trace)
+
+    # Collecting the export preferences
+    def export_options(self):
+        return {
+            'session_results': self.session_results_exp.isChecked(),
+            'circuit_info': self.circuit_info_exp.isChecked(),
+            'lap_data': self.lap_data_exp.isChecked(),
+            'telemetry': self.telemetry_data_exp.isChecked(),
+            'weather': self.weather_exp.isChecked(),
+            'whole_session': self.whole_session_exp.isChecked(),
+            'file_format': self.export_format.currentText(),
+        }
+
+    def set_memory_source(self, memory_source):
+        self.memory_source = memory_source
+
+    def set_recording(self, enabled):
+        recorder.enable(enabled)
+        self.refresh_performance()
+
+    def reset_performance(self):
+        recorder.reset()
+        self.refresh_performance()
+
+    # Showing the timings of every recorded stage & the memory held by the app
+    def refresh_performance(self):
+        rows = recorder.summary()
+        self.perf_table.setRowCount(len(rows))
+        for row, (stage, calls, last, mean, longest, memory_change) in enumerate(rows):
+            values = [stage, str(calls), format(last, '.1f'), format(mean, '.1f'), format(longest, '.1f'), format_bytes(memory_change)]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.perf_table.setItem(row, column, item)
+
+        if self.memory_source is not None:
+            self.perf_memory.setText('\n'.join(label + ':  ' + format_bytes(size) for label, size in self.memory_source()))
+
+    # Writing the recorded stages as a Chrome trace [opened in chrome://tracing or Perfetto]
+    def save_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, 'Save Chrome Trace', 'perf_trace.json', 'Chrome Trace (*.json)')
+        if path:
+            count = recorder.write_chrome_trace(path)
+            self.perf_save.setToolTip('Saved ' + str(count) + ' events to ' + path)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_performance()
+        self.perf_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.perf_timer.stop()
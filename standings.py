@@ -0,0 +1,236 @@
+''' UI LIBRARIES'''
+# PyQt5
+from PyQt5.QtWidgets import QWidget, QHeaderView, QStyledItemDelegate
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+import PyQt5.uic as uic
+
+# Plotting Libraries
+import plot_style
+
+# Data Analysis Libraries
+import pandas as pd
+
+# Season Results Store & Standings Engine
+from season_results import SeasonResults
+
+# Cross-Event Season Analysis [sessions are loaded in worker processes]
+from season_analysis_worker import SeasonAnalyser
+from season_analysis import FIRST_SEASON, driver_seasons, team_deficits
+
+# Number of drivers drawn on the points progression
+PROGRESSION_DRIVERS = 10
+
+# Columns of the season analysis table, as (column, header) pairs
+ANALYSIS_COLUMNS = [('Year', 'Season'), ('Abbreviation', 'Driver'), ('TeamName', 'Team'), ('Rounds', 'Rounds'), ('Poles', 'Fastest'),
+                    ('MedianDeficit', 'Median to Fastest (%)'), ('BestDeficit', 'Best to Fastest (%)'),
+                    ('AheadOfTeammate', 'Ahead of Teammate'), ('MedianTeammateGap', 'Median to Teammate (s)')]
+
+# Color of a team as stored in the session results [hex without '#'; empty when unknown]
+def team_color(color):
+    if isinstance(color, str) and len(color) == 6:
+        return '#' + color
+    return '#808080'
+
+'''
+Read-only table model over a standings DataFrame
+[Cells are formatted on request by the view, so only the visible rows are ever turned into text]
+    columns: list of (column, header) pairs to show
+    color_column: column shown with the team color swatch
+'''
+class StandingsModel(QAbstractTableModel):
+    def __init__(self, columns, color_column, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.color_column = color_column
+        self.frame = pd.DataFrame(columns=[column for column, _ in columns] + ['TeamColor'])
+
+    def set_frame(self, frame):
+        self.beginResetModel()
+        self.frame = frame.reset_index(drop=True)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.frame)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        column = self.columns[index.column()][0]
+        if role == Qt.DisplayRole:
+            value = self.frame.at[index.row(), column]
+            if isinstance(value, float):
+                return '-' if pd.isna(value) else format(value, 'g')
+            return str(value)
+        if role == Qt.DecorationRole and column == self.color_column:
+            return QColor(team_color(self.frame.at[index.row(), 'TeamColor']))
+        if role == Qt.TextAlignmentRole and column != self.color_column:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][1]
+        return None
+
+class UI_standings(QWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        uic.loadUi('standings_page.ui', self)
+
+        self.year = None
+        self.fetching = 0
+
+        # Standings engine backed by the local results store
+        self.season_results = SeasonResults(parent=self)
+        self.season_results.updated.connect(self.season_updated)
+        self.season_results.finished.connect(self.season_finished)
+        self.season_results.failed.connect(self.season_failed)
+
+        self.driver_model = StandingsModel([('Position', 'Pos'), ('FullName', 'Driver'), ('TeamName', 'Team'),
+                                            ('Points', 'Points'), ('Wins', 'Wins'), ('Podiums', 'Podiums')], 'TeamName', self)
+        self.constructor_model = StandingsModel([('Position', 'Pos'), ('TeamName', 'Team'), ('Points', 'Points'),
+                                                 ('Wins', 'Wins'), ('Podiums', 'Podiums')], 'TeamName', self)
+        for table, model in [(self.driver_table, self.driver_model), (self.constructor_table, self.constructor_model)]:
+            table.setModel(model)
+            table.verticalHeader().setVisible(False)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        self.progression_p_legend = self.progression_p.addLegend()
+        self.progression_p.setLabel('left', 'Points')
+        self.progression_p.setLabel('bottom', 'Round')
+        self.progression_p.showGrid(x=False, y=True, alpha=0.2)
+
+        # Season analysis of every round from the first season selected up to the shown season [run on request]
+        self.season_analyser = SeasonAnalyser(parent=self)
+        self.season_analyser.progress.connect(self.analysis_progress)
+        self.season_analyser.finished.connect(self.analysis_finished)
+        self.season_analyser.failed.connect(self.analysis_failed)
+
+        self.analysis_session.setItemDelegate(QStyledItemDelegate(self.analysis_session))
+        self.analysis_from.setValue(FIRST_SEASON)
+        self.analysis_run.clicked.connect(self.run_analysis)
+
+        self.analysis_model = StandingsModel(ANALYSIS_COLUMNS, 'TeamName', self)
+        self.analysis_table.setModel(self.analysis_model)
+        self.analysis_table.verticalHeader().setVisible(False)
+        self.analysis_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        self.analysis_p.setLabel('left', 'Deficit to Fastest (%)')
+        self.analysis_p.setLabel('bottom', 'Season')
+        self.analysis_p.showGrid(x=True, y=True, alpha=0.2)
+        self.analysis_p.invertY(True)
+
+    '''
+    Showing the standings of a season
+    [The stored rounds are shown right away; missing rounds are fetched & added as they arrive]
+        year: season
+        schedule: compact schedule of the season [None while it is not fetched yet]
+    '''
+    def show_season(self, year, schedule):
+        self.year = year
+        self.analysis_from.setMaximum(year)
+        self.display()
+
+        self.fetching = 0
+        if schedule is not None:
+            self.fetching = self.season_results.request(year, schedule)
+        self.display_status()
+
+    def season_updated(self, year):
+        if year == self.year:
+            self.fetching = max(0, self.fetching - 1)
+            self.display()
+            self.display_status()
+
+    def season_finished(self, year):
+        if year == self.year:
+            self.fetching = 0
+            self.display_status()
+
+    def season_failed(self, year, message):
+        if year == self.year:
+            self.fetching = max(0, self.fetching - 1)
+            self.display_status()
+        print('Failed to fetch the ' + str(year) + ' results: ' + message)
+
+    def display_status(self):
+        _, _, progression = self.season_results.season(self.year)
+        rounds = len(progression)
+        if rounds == 0 and self.fetching == 0:
+            text = 'No results stored for ' + str(self.year)
+        else:
+            text = str(self.year) + '  |  after round ' + str(progression.index.max() if rounds else 0)
+        if self.fetching:
+            text = text + '  |  fetching ' + str(self.fetching) + ' session(s)...'
+        self.standings_status.setText(text)
+
+    def display(self):
+        drivers, constructors, progression = self.season_results.season(self.year)
+        self.driver_model.set_frame(drivers)
+        self.constructor_model.set_frame(constructors)
+        self.plot_progression(drivers, progression)
+
+    # Plotting the points of the leading drivers after every round
+    def plot_progression(self, drivers, progression):
+        self.progression_p.clear()
+        if progression.empty:
+            return
+
+        rounds = progression.index.to_numpy()
+        for _, driver in drivers.head(PROGRESSION_DRIVERS).iterrows():
+            color = team_color(driver['TeamColor'])
+            self.progression_p.plot(rounds, progression[driver['DriverNumber']].to_numpy(), pen = plot_style.pen(color, width= 2),
+                                    symbol = 'o', symbolSize = 5, symbolPen = None, symbolBrush = color,
+                                    name = driver['Abbreviation'])
+
+    # Analysing every round of the seasons from the selected first season up to the shown season
+    def run_analysis(self):
+        if self.year is None:
+            return
+
+        years = list(range(self.analysis_from.value(), self.year + 1))
+        summaries = self.season_analyser.analyse(years, self.analysis_session.currentText())
+        if summaries is None:
+            self.analysis_status.setText('Fetching the ' + str(years[0]) + (' - ' + str(years[-1]) if len(years) > 1 else '') + ' schedules...')
+        else:
+            self.display_analysis(summaries, [])
+
+    def analysis_progress(self, done, total, label):
+        self.analysis_status.setText(str(done) + '/' + str(total) + ' sessions  |  ' + label)
+
+    def analysis_finished(self, summaries, errors):
+        self.display_analysis(summaries, errors)
+        for error in errors:
+            print('Failed to analyse ' + error)
+
+    def analysis_failed(self, message):
+        self.analysis_status.setText('Season analysis failed')
+        print('Failed to analyse the seasons: ' + message)
+
+    def display_analysis(self, summaries, errors):
+        seasons = driver_seasons(summaries).round({'MedianDeficit': 3, 'BestDeficit': 3, 'MedianTeammateGap': 3})
+        self.analysis_model.set_frame(seasons)
+        self.plot_analysis(summaries)
+
+        sessions = len(summaries.groupby(['Year', 'Round'])) if not summaries.empty else 0
+        text = str(sessions) + ' sessions analysed'
+        if errors:
+            text = text + '  |  ' + str(len(errors)) + ' failed'
+        self.analysis_status.setText(text)
+
+    # Plotting the deficit of every team's faster car to the fastest lap of every round, over the analysed seasons
+    def plot_analysis(self, summaries):
+        self.analysis_p.clear()
+        if summaries.empty:
+            return
+
+        teams = team_deficits(summaries)
+        rounds = summaries.groupby('Year')['Round'].max()
+        teams['Season'] = teams['Year'] + (teams['Round'] - 1) / teams['Year'].map(rounds)
+        for team_name, team in teams.groupby('TeamName', sort=False):
+            color = team_color(team['TeamColor'].iloc[-1])
+            self.analysis_p.plot(team['Season'].to_numpy(), team['DeficitPercent'].to_numpy(), pen = plot_style.pen(color, width= 2),
+                                 symbol = 'o', symbolSize = 4, symbolPen = None, symbolBrush = color, name = team_name)
@@ -0,0 +1,41 @@
+''' STARTUP PROFILING LIBRARIES'''
+# Miscellanous Functionality
+from contextlib import contextmanager
+import time
+
+'''
+Records the time spent in each import & initialization stage of the app start
+[Enabled with the --profile-startup flag; a disabled profiler only runs the stages]
+    enabled: whether timings are recorded & reported
+'''
+class StartupProfiler:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.stages = []
+
+    @contextmanager
+    def stage(self, category, name):
+        if not self.enabled:
+            yield
+            return
+
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((category, name, time.perf_counter() - stage_start))
+
+    # Printing the breakdown of every stage, grouped by category, & the total time until the call
+    def report(self):
+        if not self.enabled:
+            return
+
+        total = time.perf_counter() - self.start
+        print('Startup profile')
+        for category in dict.fromkeys(category for category, _, _ in self.stages):
+            stages = [(name, duration) for stage_category, name, duration in self.stages if stage_category == category]
+            print('  ' + category + ': ' + format(sum(duration for _, duration in stages) * 1000, '.1f') + ' ms')
+            for name, duration in stages:
+                print('    ' + name.ljust(32) + format(duration * 1000, '8.1f') + ' ms')
+        print('  Total until first event loop iteration: ' + format(total * 1000, '.1f') + ' ms')
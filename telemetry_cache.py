@@ -0,0 +1,86 @@
+''' TELEMETRY CACHE LIBRARIES'''
+# Miscellanous Functionality
+from collections import OrderedDict
+import threading
+
+# Data Analysis Libraries
+import pandas as pd
+
+# Identifies a loaded session independently of the session object itself
+def session_key(session):
+    return (session.date.year, session.event['EventName'], session.name)
+
+'''
+Least-recently-used store of merged lap telemetry shared by every consumer of a lap
+[Keyed by (session, driver number, lap number); entries are evicted once the memory budget is exceeded]
+    max_bytes: memory budget for all cached telemetry frames
+Cached frames are shared, consumers must not modify them in place
+'''
+class TelemetryCache:
+    def __init__(self, max_bytes=512 * 1024**2):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    '''
+    Generating the cache key of a lap
+        session: session the lap belongs to
+        lap: single FastF1 Lap, or a Laps object holding one lap [as returned by pick_lap]
+    '''
+    def lap_key(self, session, lap):
+        if isinstance(lap, pd.DataFrame):
+            lap = lap.iloc[0]
+        return (session_key(session), str(lap['DriverNumber']), int(lap['LapNumber']))
+
+    # Returning the merged car & position telemetry of the lap, computing it only on the first request
+    def get_telemetry(self, session, lap):
+        key = self.lap_key(session, lap)
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits = self.hits + 1
+                return self.entries[key]
+            self.misses = self.misses + 1
+
+        # Merging telemetry outside the lock, as it is the expensive part
+        telemetry = lap.get_telemetry()
+        self.insert(key, telemetry)
+        return telemetry
+
+    def insert(self, key, telemetry):
+        size = int(telemetry.memory_usage(index=True, deep=True).sum())
+
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes = self.total_bytes - self.sizes[key]
+            self.entries[key] = telemetry
+            self.entries.move_to_end(key)
+            self.sizes[key] = size
+            self.total_bytes = self.total_bytes + size
+
+            # Evicting the least recently used laps while over budget [the newest lap is always kept]
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, _ = self.entries.popitem(last=False)
+                self.total_bytes = self.total_bytes - self.sizes.pop(old_key)
+
+    # Removing every cached lap, or only the laps of the given session
+    def clear(self, session=None):
+        with self.lock:
+            if session is None:
+                self.entries.clear()
+                self.sizes.clear()
+                self.total_bytes = 0
+                return
+
+            current = session_key(session)
+            for key in [key for key in self.entries if key[0] == current]:
+                del self.entries[key]
+                self.total_bytes = self.total_bytes - self.sizes.pop(key)
+
+    def __len__(self):
+        return len(self.entries)
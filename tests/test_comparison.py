@@ -0,0 +1,39 @@
+'''
+LapComparison on circuits of unknown length [no circuit geometry & no reference lap]
+Run from the repository root:
+    python -m pytest tests
+'''
+# Miscellanous Functionality
+import os
+import sys
+
+# Data Analysis Libraries
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+import fixtures
+from comparison import LapComparison
+
+def test_unknown_circuit_takes_length_from_first_lap():
+    comparison = LapComparison(None)
+    first = fixtures.synthetic_telemetry(seed=1)
+    second = fixtures.synthetic_telemetry(lap_time=fixtures.LAP_TIME + 0.5, seed=2)
+
+    comparison.add('first', None, first, first['Distance'], 'VER', '#3671C6', 0)
+    comparison.add('second', None, second, second['Distance'], 'LEC', '#E8002D', 1)
+
+    assert comparison.circuit_distance == pytest.approx(first['Distance'].max())
+    assert comparison.grid[-1] == pytest.approx(comparison.circuit_distance)
+    reference, compared, delta = comparison.deltas()
+    assert reference.key == 'first' and len(compared) == 1
+    assert np.isfinite(delta).all()
+
+def test_unknown_circuit_without_distance_raises():
+    comparison = LapComparison(None)
+    telemetry = fixtures.synthetic_telemetry().iloc[:0]
+
+    with pytest.raises(ValueError):
+        comparison.add('empty', None, telemetry, pd.Series([], dtype=float), 'VER', '#3671C6', 0)
+    assert len(comparison) == 0